@@ -0,0 +1,223 @@
+#!/usr/bin/env python3
+"""
+Read-through cache for LLM opportunity analyses, shared by every pipeline.
+
+Design decisions:
+- Storage is llm_cache (SQLite, WAL). This module only decides WHAT the cache
+  key means; llm_cache owns HOW it is stored.
+- Key: the source URL (analysis_key(); sources that yield several
+  opportunities per URL, the ideas of an Ask HN thread, add the title so each
+  idea keeps its own entry) plus an input fingerprint. The fingerprint is a sha256
+  over the prompt inputs (title, description, revenue claim, tech stack), the
+  pipeline's prompt template (each pipeline has its own prompt and result
+  schema, and they share one llm_cache), its version and the model name. An
+  edited post, another pipeline's entry, a prompt change or a model swap
+  produces a new fingerprint, so the old entry is simply a miss and gets
+  overwritten by the fresh analysis — no manual invalidation.
+- Only real LLM results are cached. Fallback analyses are never written, so an
+  LLM outage does not poison the cache.
+- Cache errors are logged and treated as misses. The cache must never fail a
+  pipeline run.
+- Hit/miss counters live on the AnalysisCache instance, so each run reports its
+  own numbers (call reset_stats() at the start of a run).
+
+Usage:
+    from analysis_cache import AnalysisCache, analysis_fingerprint
+
+    cache = AnalysisCache()
+    fingerprint = analysis_fingerprint(
+        title, description, revenue_claim, tech_stack,
+        template=ANALYSIS_TEMPLATE, prompt_version=ANALYSIS_PROMPT_VERSION, model=LLM_MODEL,
+    )
+
+    key = analysis_key(url, source, title)
+    analysis = cache.get(key, fingerprint)
+    if analysis is None:
+        analysis = call_llm(...)
+        cache.put(key, fingerprint, analysis)
+
+    # Pre-check a whole batch in one round trip per chunk
+    cached = cache.get_many({key: fingerprint, ...})   # hits only
+
+    cache.stats()   # {"hits": 12, "misses": 3, "hit_rate": 0.8}
+"""
+
+import hashlib
+import json
+import logging
+import threading
+from pathlib import Path
+from typing import Any, Dict, Iterable, Mapping, Optional, Union
+
+import llm_cache
+from chroma_writer import MULTI_OPPORTUNITY_SOURCES
+
+logger = logging.getLogger(__name__)
+
+
+# ---------------------------------------------------------------------------
+# Fingerprints
+# ---------------------------------------------------------------------------
+
+def _sha256(parts: list) -> str:
+    """Stable sha256 over a JSON-encoded list of parts."""
+    payload = json.dumps(parts, ensure_ascii=False, separators=(",", ":"))
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+def _normalise_tech_stack(tech_stack: Union[str, Iterable[str], None]) -> str:
+    """Scrapers emit tech stacks as lists or comma-joined strings; hash both alike."""
+    if tech_stack is None:
+        return ""
+    if isinstance(tech_stack, str):
+        return tech_stack.strip()
+    return ", ".join(tech_stack)
+
+
+def content_hash(
+    title: Optional[str],
+    description: Optional[str],
+    revenue_claim: Optional[str] = None,
+    tech_stack: Union[str, Iterable[str], None] = None,
+) -> str:
+    """
+    Hash of the scraped content an analysis is computed from.
+
+    Changes whenever the post itself is edited; independent of the prompt.
+    """
+    return _sha256([
+        title or "",
+        description or "",
+        revenue_claim or "",
+        _normalise_tech_stack(tech_stack),
+    ])
+
+
+def analysis_fingerprint(
+    title: Optional[str],
+    description: Optional[str],
+    revenue_claim: Optional[str] = None,
+    tech_stack: Union[str, Iterable[str], None] = None,
+    *,
+    template: str,
+    prompt_version: Union[str, int],
+    model: str,
+) -> str:
+    """
+    Fingerprint of everything that determines an LLM analysis result.
+
+    Combines content_hash() with the prompt template id (one per pipeline:
+    the prompts and result schemas differ), its version and the model name.
+    """
+    return _sha256([
+        content_hash(title, description, revenue_claim, tech_stack),
+        template,
+        str(prompt_version),
+        model,
+    ])
+
+
+def analysis_key(url: str, source: str = "", title: str = "") -> str:
+    """
+    Cache key of one opportunity's analysis: its URL, plus the title for
+    sources that extract several opportunities from one URL (the same rule as
+    chroma_writer.opportunity_doc_id), so sibling ideas do not replace each
+    other's entry.
+    """
+    if source in MULTI_OPPORTUNITY_SOURCES:
+        return f"{url}#{(title or '').strip().lower()}"
+    return url
+
+
+# ---------------------------------------------------------------------------
+# Read-through cache
+# ---------------------------------------------------------------------------
+
+class AnalysisCache:
+    """Fingerprint-checked analysis cache with per-run hit/miss counters."""
+
+    def __init__(self, db_path: Path = llm_cache._DEFAULT_DB_PATH, enabled: bool = True):
+        """
+        Args:
+            db_path: Path to the llm_cache SQLite database
+            enabled: Set False to bypass the cache entirely (every lookup misses)
+        """
+        self.db_path = db_path
+        self.enabled = enabled
+        self._lock = threading.Lock()  # counters are bumped from worker threads
+        self.hits = 0
+        self.misses = 0
+
+        if self.enabled:
+            try:
+                llm_cache.init_cache_db(self.db_path)
+            except Exception as e:
+                logger.warning(f"⚠️  LLM cache unavailable, analysing without it: {e}")
+                self.enabled = False
+
+    def get(self, key: str, fingerprint: str) -> Optional[Any]:
+        """
+        Return the cached analysis for key (the URL, or analysis_key()) if its
+        fingerprint matches, else None.
+        """
+        result = None
+
+        if self.enabled:
+            try:
+                result = llm_cache.get_cached_result(
+                    key, self.db_path, content_hash=fingerprint
+                )
+            except Exception as e:
+                logger.warning(f"⚠️  LLM cache lookup failed for {key}: {e}")
+
+        with self._lock:
+            if result is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+
+        return result
+
+    def get_many(self, fingerprints: Mapping[str, str]) -> Dict[str, Any]:
+        """Cached analyses for {key: fingerprint} in one lookup; returns the hits only."""
+        results: Dict[str, Any] = {}
+
+        if self.enabled and fingerprints:
+            try:
+                results = llm_cache.get_cached_results(
+                    fingerprints, self.db_path, content_hashes=fingerprints
+                )
+            except Exception as e:
+                logger.warning(f"⚠️  LLM cache batch lookup failed: {e}")
+
+        with self._lock:
+            self.hits += len(results)
+            self.misses += len(fingerprints) - len(results)
+
+        return results
+
+    def put(self, key: str, fingerprint: str, result: Any) -> None:
+        """Store a fresh analysis, replacing any stale entry for the key."""
+        if not self.enabled:
+            return
+
+        try:
+            llm_cache.cache_result(key, result, self.db_path, content_hash=fingerprint)
+        except Exception as e:
+            logger.warning(f"⚠️  LLM cache write failed for {key}: {e}")
+
+    def reset_stats(self) -> None:
+        """Zero the hit/miss counters (call at the start of a run)."""
+        with self._lock:
+            self.hits = 0
+            self.misses = 0
+
+    def stats(self) -> Dict[str, Any]:
+        """Hit/miss counters for the current run."""
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": (self.hits / lookups) if lookups else 0.0,
+            }
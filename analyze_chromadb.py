@@ -43,13 +43,12 @@ def analyze_database():
             print("  python3 production_opportunity_pipeline.py --demo")
             return
 
-        # Fetch all data
+        # Fetch metadata only (document bodies are never used here)
         results = collection.get(
-            include=['metadatas', 'documents']
+            include=['metadatas']
         )
 
         metadatas = results['metadatas']
-        documents = results['documents']
 
         # Initialize analysis containers
         automation_scores = []
@@ -0,0 +1,146 @@
+#!/usr/bin/env python3
+"""
+One-time backfill of the numeric metadata fields
+
+Opportunities written before the pipelines stored numeric fields only have the
+raw strings (initial_investment, time_to_market, revenue_claim). This script:
+1. Reads the metadata of every document in the collection, in pages
+2. Parses the strings once with parse_investment.numeric_metadata
+3. Updates the metadata of documents whose numeric fields are missing or
+   stale (documents and embeddings are left untouched)
+4. Updates the trend aggregates and profile score index to match
+
+Running it again only rewrites documents whose fields changed.
+
+Usage:
+    python3 backfill_numeric_fields.py --dry-run
+    python3 backfill_numeric_fields.py
+    python3 backfill_numeric_fields.py --local data/chroma_db --collection business_opportunities
+"""
+
+import argparse
+import sys
+from pathlib import Path
+from typing import Dict, List, Optional
+
+import chromadb
+
+from config_chromadb import get_chroma_client
+from credit_integration.score_index import ProfileScoreIndex
+from parse_investment import NUMERIC_FIELDS, numeric_metadata
+from trend_aggregates import TrendAggregates
+
+DEFAULT_COLLECTION = "business_opportunities"
+PAGE_SIZE = 1000
+
+
+def backfilled_metadata(metadata: Dict) -> Optional[Dict]:
+    """Metadata with fresh numeric fields, or None if it is already current"""
+    numbers = numeric_metadata(
+        metadata.get("initial_investment"),
+        metadata.get("time_to_market"),
+        metadata.get("revenue_claim"),
+        revenue_amount=metadata.get("revenue_amount"),
+        revenue_period=metadata.get("revenue_period"),
+    )
+    current = {field: metadata[field] for field in NUMERIC_FIELDS if field in metadata}
+    if current == numbers:
+        return None
+
+    updated = {key: value for key, value in metadata.items() if key not in NUMERIC_FIELDS}
+    updated.update(numbers)
+    return updated
+
+
+def backfill_collection(collection, dry_run: bool = False,
+                        trend_aggregates: TrendAggregates = None,
+                        score_index: ProfileScoreIndex = None) -> Dict[str, int]:
+    """
+    Add numeric fields to every document that lacks them
+
+    Args:
+        collection: Open ChromaDB collection
+        dry_run: Only compute the report
+        trend_aggregates: Counters to keep in step with the rewrite (optional)
+        score_index: Profile match scores to keep in step (optional)
+
+    Returns:
+        Report counts
+    """
+    report = {"documents": 0, "updated": 0, "no_numbers": 0}
+
+    # Updates do not change the ID order, so paging by offset stays valid
+    offset = 0
+    while True:
+        page = collection.get(include=["metadatas"], limit=PAGE_SIZE, offset=offset)
+        if not page["ids"]:
+            return report
+        offset += len(page["ids"])
+        report["documents"] += len(page["ids"])
+
+        ids: List[str] = []
+        metadatas: List[Dict] = []
+        for doc_id, metadata in zip(page["ids"], page["metadatas"]):
+            updated = backfilled_metadata(metadata or {})
+            if not any(field in (updated or metadata or {}) for field in NUMERIC_FIELDS):
+                report["no_numbers"] += 1
+            if updated is None:
+                continue
+            ids.append(doc_id)
+            metadatas.append(updated)
+
+        report["updated"] += len(ids)
+        if dry_run or not ids:
+            continue
+
+        collection.update(ids=ids, metadatas=metadatas)
+        if trend_aggregates is not None:
+            trend_aggregates.record(ids, metadatas, collection)
+        if score_index is not None:
+            score_index.record(ids, metadatas, collection)
+        print(f"   💾 Updated {report['updated']} documents ({report['documents']} scanned)")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Add numeric investment/revenue fields to stored opportunities")
+    parser.add_argument('--collection', default=DEFAULT_COLLECTION,
+                        help=f'Collection to backfill (default: {DEFAULT_COLLECTION})')
+    parser.add_argument('--local', metavar='PATH',
+                        help='Backfill a local ChromaDB directory instead of the configured server')
+    parser.add_argument('--dry-run', action='store_true',
+                        help='Report what would change without writing')
+    args = parser.parse_args()
+
+    print("=" * 70)
+    print("NUMERIC FIELD BACKFILL" + (" (dry run)" if args.dry_run else ""))
+    print("=" * 70)
+
+    try:
+        if args.local:
+            print(f"📁 Using local ChromaDB at {args.local}")
+            client = chromadb.PersistentClient(path=str(Path(args.local)))
+        else:
+            client = get_chroma_client()
+        collection = client.get_collection(args.collection)
+    except Exception as e:
+        print(f"❌ Could not open collection {args.collection}: {e}")
+        sys.exit(1)
+
+    print(f"\n🔍 Scanning {args.collection} ({collection.count()} documents)...")
+    is_default = args.collection == DEFAULT_COLLECTION
+    trend_aggregates = TrendAggregates() if is_default else None
+    score_index = ProfileScoreIndex() if is_default else None
+    report = backfill_collection(collection, dry_run=args.dry_run,
+                                 trend_aggregates=trend_aggregates, score_index=score_index)
+
+    print(f"\n📊 Documents scanned:        {report['documents']}")
+    label = "Documents to update:" if args.dry_run else "Documents updated:"
+    print(f"   {label:<26}{report['updated']}")
+    print(f"   Nothing to parse:         {report['no_numbers']}")
+
+    if not args.dry_run:
+        print(f"\n✅ Numeric fields: {', '.join(NUMERIC_FIELDS)}")
+
+
+if __name__ == "__main__":
+    main()
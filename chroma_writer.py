@@ -0,0 +1,286 @@
+#!/usr/bin/env python3
+"""
+Buffered ChromaDB writer — one client/collection per run, batched writes.
+
+Design decisions:
+- The caller opens the client and collection ONCE and hands the collection in.
+  Nothing here reconnects; on the Xeon HttpClient that saves a heartbeat plus a
+  get_collection round trip per document.
+- Documents are buffered and written with one collection.add/upsert call per
+  batch_size documents. No collection.count() per insert.
+- If a batch call fails, the batch is retried one document at a time so one bad
+  record does not drop its neighbours.
+- Use as a context manager: the final partial batch is flushed on exit, whether
+  the run finished cleanly or raised.
+- Thread-safe: the modern pipeline feeds it from asyncio.to_thread workers.
+- Optional embedder: a callable that turns a batch of documents into vectors
+  (see embeddings.DocumentEmbedder). Vectors are computed once per flush and
+  passed as embeddings=; if the embedder returns None or fails, ChromaDB embeds
+  the documents itself as before.
+- Optional on_flush(ids, metadatas) callback, called after each flush with the
+  documents that were actually written. Use it for bookkeeping that must only
+  happen once a document is durably stored (e.g. the seen-URL index).
+- Document IDs are stable: make_doc_id() is uuid5 of the normalised URL, so
+  the same opportunity gets the same ID in every run and every pipeline. The
+  writer upserts by default, so reruns update documents in place instead of
+  adding duplicates. Adding an ID that is already buffered replaces the
+  buffered copy (a batch may not repeat an ID).
+
+Usage:
+    from chroma_writer import BufferedChromaWriter
+
+    with BufferedChromaWriter(collection, batch_size=64) as writer:
+        for opp in opportunities:
+            writer.add(make_doc_id(url), document, metadata)
+
+    print(writer.written, writer.failed)
+"""
+
+import logging
+import threading
+import time
+import uuid
+from typing import Any, Callable, Dict, List, Optional
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_BATCH_SIZE = 64
+
+# Query parameters that only track where a click came from
+_TRACKING_PARAMS = {"fbclid", "gclid", "ref", "ref_src"}
+_DEFAULT_PORTS = {"http": 80, "https": 443}
+
+# Sources that extract several opportunities from one page (the ideas in an
+# Ask HN thread); their IDs are keyed on URL + title instead of URL alone
+MULTI_OPPORTUNITY_SOURCES = {"Hacker News (Ask HN)"}
+
+
+# ---------------------------------------------------------------------------
+# Document IDs
+# ---------------------------------------------------------------------------
+
+def normalize_url(url: str) -> str:
+    """
+    Canonical form of an opportunity URL, so trivially different links to the
+    same page map to one document.
+
+    Lowercases scheme and host, drops "www.", default ports, the fragment,
+    tracking parameters (utm_*, ref, fbclid, ...) and a trailing slash, and
+    sorts the remaining query parameters.
+    """
+    parts = urlsplit(url.strip())
+    scheme = parts.scheme.lower()
+
+    host = (parts.hostname or "").lower()
+    if host.startswith("www."):
+        host = host[4:]
+    try:
+        port = parts.port
+    except ValueError:
+        port = None
+    netloc = host if port is None or _DEFAULT_PORTS.get(scheme) == port else f"{host}:{port}"
+
+    path = parts.path.rstrip("/")
+
+    query = sorted(
+        (key, value)
+        for key, value in parse_qsl(parts.query, keep_blank_values=True)
+        if key.lower() not in _TRACKING_PARAMS and not key.lower().startswith("utm_")
+    )
+
+    return urlunsplit((scheme, netloc, path, urlencode(query), ""))
+
+
+def make_doc_id(url: str, discriminator: Optional[str] = None) -> str:
+    """
+    Stable ChromaDB document ID for an opportunity: uuid5 of its normalised URL.
+
+    Args:
+        url: Opportunity source URL
+        discriminator: Extra key for sources that yield several opportunities
+            per URL (see opportunity_doc_id)
+    """
+    name = normalize_url(url)
+    if discriminator:
+        name = f"{name}#{discriminator.strip().lower()}"
+    return str(uuid.uuid5(uuid.NAMESPACE_URL, name))
+
+
+def opportunity_doc_id(url: str, source: str = "", title: str = "") -> str:
+    """Document ID for an opportunity (or its stored metadata) from any pipeline."""
+    if source in MULTI_OPPORTUNITY_SOURCES:
+        return make_doc_id(url, title)
+    return make_doc_id(url)
+
+
+def collection_identity(collection: Any) -> str:
+    """
+    Which store a collection lives in, as "<name>/<collection UUID>". The UUID
+    differs between the local PersistentClient and the Xeon server (and after a
+    collection is recreated), so stores derived from one collection can refuse
+    writes meant for another.
+    """
+    return f"{collection.name}/{collection.id}"
+
+
+# ---------------------------------------------------------------------------
+# Writer
+# ---------------------------------------------------------------------------
+
+
+class BufferedChromaWriter:
+    """Accumulate documents and write them to a ChromaDB collection in batches"""
+
+    def __init__(
+        self,
+        collection: Any,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+        mode: str = "upsert",
+        embedder: Optional[Callable[[List[str]], Optional[List[List[float]]]]] = None,
+        on_flush: Optional[Callable[[List[str], List[Dict[str, Any]]], None]] = None,
+    ):
+        """
+        Args:
+            collection: Open ChromaDB collection, reused for the whole run
+            batch_size: Documents per add/upsert call
+            mode: "upsert" (reruns update in place) or "add" (duplicates ignored)
+            embedder: Batch embedding function; None lets ChromaDB embed
+            on_flush: Called with (ids, metadatas) of each written batch
+        """
+        if mode not in ("add", "upsert"):
+            raise ValueError(f"mode must be 'add' or 'upsert', got {mode!r}")
+        if batch_size < 1:
+            raise ValueError(f"batch_size must be >= 1, got {batch_size}")
+
+        self.collection = collection
+        self.batch_size = batch_size
+        self.mode = mode
+        self.embedder = embedder
+        self.on_flush = on_flush
+
+        self._lock = threading.Lock()
+        self._ids: List[str] = []
+        self._documents: List[str] = []
+        self._metadatas: List[Dict[str, Any]] = []
+        self._positions: Dict[str, int] = {}  # buffered doc ID -> index
+        self._oldest_at: Optional[float] = None
+
+        # Run statistics
+        self.written = 0
+        self.failed = 0
+        self.batches = 0
+        self.write_seconds = 0.0
+        self.first_write_at: Optional[float] = None  # time.perf_counter() of first stored batch
+
+    def add(self, doc_id: str, document: str, metadata: Dict[str, Any]) -> None:
+        """Buffer one document; writes a batch once batch_size is reached."""
+        with self._lock:
+            position = self._positions.get(doc_id)
+            if position is not None:
+                # Same document twice before a flush: keep the newest copy
+                self._documents[position] = document
+                self._metadatas[position] = metadata
+                return
+
+            if not self._ids:
+                self._oldest_at = time.perf_counter()
+            self._positions[doc_id] = len(self._ids)
+            self._ids.append(doc_id)
+            self._documents.append(document)
+            self._metadatas.append(metadata)
+
+            if len(self._ids) >= self.batch_size:
+                self._flush_locked()
+
+    @property
+    def pending(self) -> int:
+        """Documents buffered but not yet written"""
+        return len(self._ids)
+
+    @property
+    def pending_age(self) -> float:
+        """Seconds the oldest buffered document has been waiting (0 if none)"""
+        oldest_at = self._oldest_at
+        if not self._ids or oldest_at is None:
+            return 0.0
+        return time.perf_counter() - oldest_at
+
+    def flush(self) -> int:
+        """Write everything buffered. Returns the number of documents written."""
+        with self._lock:
+            return self._flush_locked()
+
+    def close(self) -> None:
+        """Flush the final partial batch."""
+        self.flush()
+
+    def __enter__(self) -> "BufferedChromaWriter":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.close()
+
+    def _flush_locked(self) -> int:
+        if not self._ids:
+            return 0
+
+        ids, documents, metadatas = self._ids, self._documents, self._metadatas
+        self._ids, self._documents, self._metadatas = [], [], []
+        self._positions = {}
+        self._oldest_at = None
+
+        write = getattr(self.collection, self.mode)
+        embeddings = self._embed(documents)
+        start_time = time.perf_counter()
+
+        try:
+            if embeddings is None:
+                write(ids=ids, documents=documents, metadatas=metadatas)
+            else:
+                write(ids=ids, documents=documents, metadatas=metadatas, embeddings=embeddings)
+            written_ids, written_metadatas = ids, metadatas
+        except Exception as e:
+            logger.warning(f"⚠️  Batch {self.mode} of {len(ids)} documents failed ({e}), retrying one by one")
+            written_ids, written_metadatas = [], []
+            for i, (doc_id, document, metadata) in enumerate(zip(ids, documents, metadatas)):
+                try:
+                    if embeddings is None:
+                        write(ids=[doc_id], documents=[document], metadatas=[metadata])
+                    else:
+                        write(ids=[doc_id], documents=[document], metadatas=[metadata],
+                              embeddings=[embeddings[i]])
+                    written_ids.append(doc_id)
+                    written_metadatas.append(metadata)
+                except Exception as item_error:
+                    self.failed += 1
+                    logger.error(f"❌ Error storing {doc_id}: {item_error}")
+
+        elapsed = time.perf_counter() - start_time
+        written = len(written_ids)
+        self.write_seconds += elapsed
+        self.written += written
+        self.batches += 1
+        if written and self.first_write_at is None:
+            self.first_write_at = time.perf_counter()
+
+        logger.info(f"💾 Flushed {written}/{len(ids)} documents in {elapsed:.2f}s (batch {self.batches})")
+
+        if self.on_flush is not None and written_ids:
+            try:
+                self.on_flush(written_ids, written_metadatas)
+            except Exception as e:
+                logger.warning(f"⚠️  on_flush callback failed: {e}")
+
+        return written
+
+    def _embed(self, documents: List[str]) -> Optional[List[List[float]]]:
+        """Precompute vectors for a batch; None means let ChromaDB embed."""
+        if self.embedder is None:
+            return None
+
+        try:
+            return self.embedder(documents)
+        except Exception as e:
+            logger.warning(f"⚠️  Embedding {len(documents)} documents failed ({e}), leaving it to ChromaDB")
+            return None
@@ -0,0 +1,203 @@
+#!/usr/bin/env python3
+"""
+One-time compaction of the opportunity RAG store
+
+Older pipeline runs stored each opportunity under a fresh, timestamp-based ID,
+so every rerun added another copy. This script:
+1. Reads the IDs and metadata of every document in the collection
+2. Groups documents by their stable ID (chroma_writer.opportunity_doc_id)
+3. Keeps the newest copy of each opportunity and upserts it under the stable ID
+   (documents, metadata and existing embeddings are carried over unchanged)
+4. Deletes the remaining copies and updates the trend aggregates and profile
+   score index to match
+
+The survivor is written before anything is deleted, so an interrupted run
+loses nothing and can simply be run again. Documents without a "url" in their
+metadata are left alone.
+
+Usage:
+    python3 compact_chromadb.py --dry-run
+    python3 compact_chromadb.py
+    python3 compact_chromadb.py --local data/chroma_db --collection business_opportunities
+"""
+
+import argparse
+import sys
+from collections import defaultdict
+from pathlib import Path
+from typing import Dict, List
+
+import chromadb
+
+from chroma_writer import opportunity_doc_id
+from config_chromadb import get_chroma_client
+from credit_integration.score_index import ProfileScoreIndex
+from trend_aggregates import TrendAggregates
+
+DEFAULT_COLLECTION = "business_opportunities"
+PAGE_SIZE = 1000
+
+
+def _recency(metadata: Dict) -> str:
+    """Sort key for picking the newest copy (ISO timestamps sort as strings)"""
+    return max(str(metadata.get("analyzed_at") or ""), str(metadata.get("created_at") or ""))
+
+
+def _read_all_metadata(collection) -> Dict[str, Dict]:
+    """Doc ID -> metadata for the whole collection, read in pages"""
+    metadatas: Dict[str, Dict] = {}
+    offset = 0
+    while True:
+        page = collection.get(include=["metadatas"], limit=PAGE_SIZE, offset=offset)
+        if not page["ids"]:
+            return metadatas
+        for doc_id, metadata in zip(page["ids"], page["metadatas"]):
+            metadatas[doc_id] = metadata or {}
+        offset += len(page["ids"])
+
+
+def plan_compaction(metadatas: Dict[str, Dict]) -> Dict[str, List[str]]:
+    """
+    Group documents by stable ID
+
+    Returns:
+        Stable ID -> current IDs with the newest copy first, for every group
+        that needs rewriting (duplicates, or a single copy under an old ID)
+    """
+    groups: Dict[str, List[str]] = defaultdict(list)
+    for doc_id, metadata in metadatas.items():
+        url = metadata.get("url")
+        if not url:
+            continue
+        stable_id = opportunity_doc_id(url, metadata.get("source", ""), metadata.get("title", ""))
+        groups[stable_id].append(doc_id)
+
+    plan = {}
+    for stable_id, doc_ids in groups.items():
+        if doc_ids == [stable_id]:
+            continue
+        plan[stable_id] = sorted(doc_ids, key=lambda doc_id: _recency(metadatas[doc_id]), reverse=True)
+    return plan
+
+
+def compact_collection(collection, dry_run: bool = False,
+                       trend_aggregates: TrendAggregates = None,
+                       score_index: ProfileScoreIndex = None) -> Dict[str, int]:
+    """
+    Collapse duplicate opportunities in one collection
+
+    Args:
+        collection: Open ChromaDB collection
+        dry_run: Only compute the report
+        trend_aggregates: Counters to keep in step with the rewrite (optional)
+        score_index: Profile match scores to keep in step (optional)
+
+    Returns:
+        Report counts
+    """
+    metadatas = _read_all_metadata(collection)
+    plan = plan_compaction(metadatas)
+
+    to_delete = [
+        doc_id
+        for stable_id, doc_ids in plan.items()
+        for doc_id in doc_ids
+        if doc_id != stable_id
+    ]
+    report = {
+        "documents": len(metadatas),
+        "without_url": sum(1 for metadata in metadatas.values() if not metadata.get("url")),
+        "rewritten": len(plan),
+        "duplicate_groups": sum(1 for doc_ids in plan.values() if len(doc_ids) > 1),
+        "deleted": len(to_delete),
+    }
+
+    if dry_run or not plan:
+        return report
+
+    # 1. Upsert the newest copy of each opportunity under its stable ID
+    stable_ids = list(plan)
+    for i in range(0, len(stable_ids), PAGE_SIZE):
+        batch = stable_ids[i:i + PAGE_SIZE]
+        newest_ids = [plan[stable_id][0] for stable_id in batch]
+
+        newest = collection.get(ids=newest_ids, include=["documents", "metadatas", "embeddings"])
+        by_id = {
+            doc_id: (document, metadata, embedding)
+            for doc_id, document, metadata, embedding in zip(
+                newest["ids"], newest["documents"], newest["metadatas"], newest["embeddings"]
+            )
+        }
+        rows = [(stable_id, by_id[doc_id]) for stable_id, doc_id in zip(batch, newest_ids)]
+
+        collection.upsert(
+            ids=[stable_id for stable_id, _ in rows],
+            documents=[document for _, (document, _, _) in rows],
+            metadatas=[metadata for _, (_, metadata, _) in rows],
+            embeddings=[embedding for _, (_, _, embedding) in rows],
+        )
+        rewritten_ids = [stable_id for stable_id, _ in rows]
+        rewritten_metadatas = [metadata for _, (_, metadata, _) in rows]
+        if trend_aggregates is not None:
+            trend_aggregates.record(rewritten_ids, rewritten_metadatas, collection)
+        if score_index is not None:
+            score_index.record(rewritten_ids, rewritten_metadatas, collection)
+        print(f"   💾 Rewrote {min(i + PAGE_SIZE, len(stable_ids))}/{len(stable_ids)} opportunities")
+
+    # 2. Delete the superseded copies
+    for i in range(0, len(to_delete), PAGE_SIZE):
+        collection.delete(ids=to_delete[i:i + PAGE_SIZE])
+        if trend_aggregates is not None:
+            trend_aggregates.remove(to_delete[i:i + PAGE_SIZE], collection)
+        if score_index is not None:
+            score_index.remove(to_delete[i:i + PAGE_SIZE], collection)
+    print(f"   🗑️  Deleted {len(to_delete)} superseded documents")
+
+    return report
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Collapse duplicate opportunities in ChromaDB")
+    parser.add_argument('--collection', default=DEFAULT_COLLECTION,
+                        help=f'Collection to compact (default: {DEFAULT_COLLECTION})')
+    parser.add_argument('--local', metavar='PATH',
+                        help='Compact a local ChromaDB directory instead of the configured server')
+    parser.add_argument('--dry-run', action='store_true',
+                        help='Report what would change without writing')
+    args = parser.parse_args()
+
+    print("=" * 70)
+    print("CHROMADB COMPACTION" + (" (dry run)" if args.dry_run else ""))
+    print("=" * 70)
+
+    try:
+        if args.local:
+            print(f"📁 Using local ChromaDB at {args.local}")
+            client = chromadb.PersistentClient(path=str(Path(args.local)))
+        else:
+            client = get_chroma_client()
+        collection = client.get_collection(args.collection)
+    except Exception as e:
+        print(f"❌ Could not open collection {args.collection}: {e}")
+        sys.exit(1)
+
+    print(f"\n🔍 Scanning {args.collection} ({collection.count()} documents)...")
+    is_default = args.collection == DEFAULT_COLLECTION
+    trend_aggregates = TrendAggregates() if is_default else None
+    score_index = ProfileScoreIndex() if is_default else None
+    report = compact_collection(collection, dry_run=args.dry_run,
+                                trend_aggregates=trend_aggregates, score_index=score_index)
+
+    print(f"\n📊 Documents scanned:        {report['documents']}")
+    print(f"   Without URL (untouched):  {report['without_url']}")
+    print(f"   Opportunities re-keyed:   {report['rewritten']}")
+    print(f"   Duplicate groups:         {report['duplicate_groups']}")
+    label = "Documents to delete:" if args.dry_run else "Documents deleted:"
+    print(f"   {label:<26}{report['deleted']}")
+
+    if not args.dry_run:
+        print(f"\n✅ Collection now has {collection.count()} documents")
+
+
+if __name__ == "__main__":
+    main()
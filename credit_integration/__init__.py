@@ -15,9 +15,11 @@ from .personalization_engine import (
 )
 from .credit_scorer import (
     CreditScorer,
+    OpportunityColumns,
     OpportunityRequirements,
     MatchScore
 )
+from .score_index import ProfileScoreIndex
 
 __all__ = [
     'FICOParser',
@@ -27,6 +29,8 @@ __all__ = [
     'PersonalizationEngine',
     'PersonalizedRecommendation',
     'CreditScorer',
+    'OpportunityColumns',
     'OpportunityRequirements',
-    'MatchScore'
+    'MatchScore',
+    'ProfileScoreIndex'
 ]
@@ -2,12 +2,47 @@
 """
 Credit-Based Scoring System
 Scores opportunities based on user's financial capacity and risk profile
+
+Two implementations of the same rules:
+- score_opportunity: one opportunity, full MatchScore with reasoning
+- score_totals: columnar NumPy version computing only the weighted totals for
+  a whole candidate set. batch_score_opportunities ranks with it and builds
+  full MatchScores (reasoning included) only for the top-k survivors
+
+Parsing the opportunity strings is the expensive part; OpportunityColumns
+holds the parsed columns so a candidate set can be scored against many
+profiles while parsing it only once.
 """
 
 from dataclasses import dataclass
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+
+from parse_investment import (
+    INVESTMENT_MAX_FIELD, INVESTMENT_MIN_FIELD, NUMERIC_FIELDS, REVENUE_MONTHLY_FIELD,
+    TIME_TO_REVENUE_FIELD, numeric_metadata,
+)
+
 from .fico_parser import CreditProfile, RiskProfile, BusinessType
 
+# Weights of the four component scores in total_score
+WEIGHTS = (0.40, 0.25, 0.20, 0.15)  # affordability, risk match, business type, timeline
+
+# Component scores by profile risk level, for low / medium / high risk opportunities
+_RISK_MATCH_SCORES = {
+    RiskProfile.CONSERVATIVE: (100, 50, 20),
+    RiskProfile.MODERATE: (90, 100, 60),
+    RiskProfile.AGGRESSIVE: (70, 90, 100),
+}
+
+# Timeline scores by profile risk level: (month limits, scores, score beyond the limits)
+_TIMELINE_SCORES = {
+    RiskProfile.CONSERVATIVE: ((3, 6), (100, 70), 40),
+    RiskProfile.MODERATE: ((6, 12), (100, 75), 50),
+    RiskProfile.AGGRESSIVE: ((12, 24), (100, 85), 60),
+}
+
 
 @dataclass
 class OpportunityRequirements:
@@ -15,7 +50,7 @@ class OpportunityRequirements:
     min_investment: float
     max_investment: float
     expected_revenue: float
-    time_to_revenue_months: int
+    time_to_revenue_months: float
     risk_level: str  # 'low', 'medium', 'high'
     requires_credit: bool = False
     automation_score: int = 0
@@ -34,6 +69,26 @@ class MatchScore:
     reasoning: List[str]  # Why this score?
 
 
+class OpportunityColumns:
+    """Parsed requirement columns for a set of opportunities (input order)"""
+
+    def __init__(self, opportunities: List[Dict]):
+        parsed = [CreditScorer._parse_requirements(opp) for opp in opportunities]
+        columns = [np.asarray(column, dtype=float) for column in zip(*parsed)] or [np.zeros(0)] * 5
+        self.investment, self.months, self.automation, self.legitimacy, self.revenue = columns
+
+        # 0 = low, 1 = medium, 2 = high (same rule as _extract_requirements)
+        self.risk_level = np.select(
+            [(self.legitimacy >= 80) & (self.automation >= 70),
+             (self.legitimacy >= 60) & (self.automation >= 50)],
+            [0, 1],
+            2
+        )
+
+    def __len__(self) -> int:
+        return len(self.investment)
+
+
 class CreditScorer:
     """Score opportunities based on credit profile"""
 
@@ -75,7 +130,7 @@ class CreditScorer:
             credit_profile, opportunity_req, reasoning
         )
 
-        # Calculate weighted total score
+        # Calculate weighted total score (see WEIGHTS)
         total_score = (
             affordability_score * 0.40 +      # 40% weight - most important
             risk_match_score * 0.25 +         # 25% weight
@@ -308,65 +363,211 @@ class CreditScorer:
         return score
 
     @staticmethod
-    def batch_score_opportunities(
+    def score_opportunities(
         credit_profile: CreditProfile,
         opportunities: List[Dict]
+    ) -> List[MatchScore]:
+        """
+        Score multiple opportunities, keeping their order
+
+        Args:
+            credit_profile: User's credit profile
+            opportunities: List of opportunity dictionaries
+
+        Returns:
+            One MatchScore per opportunity, in input order
+        """
+
+        return [
+            # Extract or estimate requirements, then score the match
+            CreditScorer.score_opportunity(credit_profile, CreditScorer._extract_requirements(opp))
+            for opp in opportunities
+        ]
+
+    @staticmethod
+    def batch_score_opportunities(
+        credit_profile: CreditProfile,
+        opportunities: List[Dict],
+        top_k: Optional[int] = None,
+        min_score: Optional[float] = None
     ) -> List[tuple]:
         """
         Score multiple opportunities and return sorted by match score
 
+        Totals for the whole set are computed in vectorized form; only the
+        survivors get a full MatchScore (component scores and reasoning).
+
         Args:
             credit_profile: User's credit profile
             opportunities: List of opportunity dictionaries
+            top_k: Return at most this many (None = all)
+            min_score: Drop opportunities with a lower total_score (None = keep all)
 
         Returns:
-            List of (opportunity, MatchScore) tuples, sorted by total_score descending
+            List of (opportunity, MatchScore) tuples, sorted by total_score
+            descending (ties keep input order)
         """
 
-        scored_opportunities = []
+        totals = CreditScorer.score_totals(credit_profile, opportunities)
+        survivors = [opportunities[i] for i in CreditScorer.rank(totals, top_k, min_score)]
 
-        for opp in opportunities:
-            # Extract or estimate requirements
-            requirements = CreditScorer._extract_requirements(opp)
+        return list(zip(survivors, CreditScorer.score_opportunities(credit_profile, survivors)))
 
-            # Score the match
-            match_score = CreditScorer.score_opportunity(credit_profile, requirements)
+    @staticmethod
+    def score_totals(
+        credit_profile: CreditProfile,
+        opportunities
+    ) -> np.ndarray:
+        """
+        Total match score of every opportunity, vectorized over columns
 
-            scored_opportunities.append((opp, match_score))
+        Applies the same rules, weights and rounding as score_opportunity, so
+        each value equals score_opportunity(...).total_score exactly, but
+        builds no dataclasses or reasoning strings.
 
-        # Sort by total score (highest first)
-        scored_opportunities.sort(key=lambda x: x[1].total_score, reverse=True)
+        Args:
+            credit_profile: User's credit profile
+            opportunities: List of opportunity dictionaries, or their
+                OpportunityColumns (reuse these to skip re-parsing)
 
-        return scored_opportunities
+        Returns:
+            Float array of total scores, in input order
+        """
+
+        columns = opportunities if isinstance(opportunities, OpportunityColumns) else OpportunityColumns(opportunities)
+        n = len(columns)
+        if n == 0:
+            return np.zeros(0)
+
+        investment, months, automation, legitimacy, revenue, risk_level = (
+            columns.investment, columns.months, columns.automation,
+            columns.legitimacy, columns.revenue, columns.risk_level
+        )
+
+        # 1. Affordability
+        max_investment = credit_profile.max_investment_recommendation
+        if max_investment > 0:
+            percentage_used = (investment / max_investment) * 100
+        else:
+            percentage_used = np.full(n, 100.0)
+        affordability = np.select(
+            [percentage_used <= 25, percentage_used <= 50, percentage_used <= 75],
+            [100.0, 85.0, 65.0],
+            40.0
+        )
+        credit_buffer = credit_profile.available_credit >= investment * 2
+        affordability = np.where(credit_buffer, np.minimum(100.0, affordability + 10), affordability)
+        affordability = np.where(investment > max_investment, 0.0, affordability)
+
+        profile_risk = credit_profile.risk_profile
+
+        # 2. Risk match
+        if not profile_risk:
+            risk_match = np.full(n, 50.0)
+        else:
+            risk_match = np.asarray(_RISK_MATCH_SCORES[profile_risk], dtype=float)[risk_level]
+            risk_match = np.where(legitimacy < 60, risk_match * 0.5, risk_match)
+
+        # 3. Business type
+        business_type = credit_profile.business_type
+        if business_type == BusinessType.NON_PROFIT:
+            business = np.where(revenue < 10000, 90.0, 40.0)
+        elif business_type == BusinessType.C_CORP:
+            business = np.full(n, 100.0)
+        elif business_type in [BusinessType.S_CORP, BusinessType.LLC]:
+            business = np.full(n, 95.0)
+        else:  # SOLE_PROP: requires_credit is investment > 1000
+            business = np.where(investment > 1000, 60.0, 85.0)
+
+        # 4. Timeline
+        if not profile_risk:
+            timeline = np.full(n, 50.0)
+        else:
+            (short, long), (short_score, long_score), beyond = _TIMELINE_SCORES[profile_risk]
+            timeline = np.select([months <= short, months <= long], [short_score, long_score], beyond)
+            timeline = np.where(automation >= 80, np.minimum(100, timeline + 15), timeline)
+
+        # Same operation order as score_opportunity, so the floats match bit for bit
+        totals = (
+            affordability * WEIGHTS[0] +
+            risk_match * WEIGHTS[1] +
+            business * WEIGHTS[2] +
+            timeline * WEIGHTS[3]
+        )
+
+        # Python's round() on the few distinct totals (np.round rounds differently)
+        distinct, inverse = np.unique(totals, return_inverse=True)
+        return np.array([round(float(total), 2) for total in distinct])[inverse]
 
     @staticmethod
-    def _extract_requirements(opportunity: Dict) -> OpportunityRequirements:
-        """Extract opportunity requirements from opportunity data"""
+    def rank(
+        totals: np.ndarray,
+        top_k: Optional[int] = None,
+        min_score: Optional[float] = None
+    ) -> List[int]:
+        """
+        Indices of the best totals, highest first, ties in input order
 
-        # Parse investment from initial_investment field
-        investment_str = opportunity.get('initial_investment', '$500')
-        try:
-            investment = float(investment_str.replace('$', '').replace(',', ''))
-        except:
-            investment = 500  # Default
+        Uses a partial sort (np.partition) so only the survivors are fully sorted.
+        """
 
-        # Parse time to market
-        time_str = opportunity.get('time_to_market', '1 month')
-        if 'week' in time_str.lower():
+        candidates = np.arange(len(totals))
+        if min_score is not None:
+            candidates = candidates[totals >= min_score]
+
+        if top_k is not None and top_k < len(candidates):
+            if top_k <= 0:
+                return []
+            values = totals[candidates]
+            # k-th best total; keep everything at least that good (ties resolved below)
+            threshold = -np.partition(-values, top_k - 1)[top_k - 1]
+            candidates = candidates[values >= threshold]
+
+        # Stable descending order: by -total, then by input position
+        order = candidates[np.lexsort((candidates, -totals[candidates]))]
+        return order[:top_k].tolist() if top_k is not None else order.tolist()
+
+    @staticmethod
+    def _parse_requirements(opportunity: Dict) -> Tuple[float, float, float, float, float]:
+        """Parse (investment, months to revenue, automation, legitimacy, revenue) from opportunity data"""
+
+        # Numeric fields are stored at write time; documents written before
+        # that only have the strings, which are parsed here the same way
+        numbers = opportunity
+        if not any(field in opportunity for field in NUMERIC_FIELDS):
+            numbers = numeric_metadata(
+                opportunity.get('initial_investment'),
+                opportunity.get('time_to_market'),
+                opportunity.get('revenue_claim'),
+            )
+
+        # Lower bound of the investment range
+        investment = numbers.get(INVESTMENT_MIN_FIELD, numbers.get(INVESTMENT_MAX_FIELD, 500))
+
+        # Months until first revenue (no estimate at all counts as a month)
+        if TIME_TO_REVENUE_FIELD in numbers:
+            months = numbers[TIME_TO_REVENUE_FIELD]
+        elif opportunity.get('time_to_market') is None:
             months = 1
-        elif 'month' in time_str.lower():
-            # Extract number
-            try:
-                months = int(''.join(filter(str.isdigit, time_str.split('-')[0])))
-            except:
-                months = 2
         else:
             months = 3
 
-        # Determine risk level from scores
+        # Scores that determine the risk level
         automation = opportunity.get('automation_score', 50)
         legitimacy = opportunity.get('legitimacy_score', 50)
 
+        # Monthly revenue from revenue_claim
+        revenue = numbers.get(REVENUE_MONTHLY_FIELD, 1000)
+
+        return investment, months, automation, legitimacy, revenue
+
+    @staticmethod
+    def _extract_requirements(opportunity: Dict) -> OpportunityRequirements:
+        """Extract opportunity requirements from opportunity data"""
+
+        investment, months, automation, legitimacy, revenue = CreditScorer._parse_requirements(opportunity)
+
+        # Determine risk level from scores
         if legitimacy >= 80 and automation >= 70:
             risk = 'low'
         elif legitimacy >= 60 and automation >= 50:
@@ -374,13 +575,6 @@ class CreditScorer:
         else:
             risk = 'high'
 
-        # Estimate revenue from revenue_claim
-        revenue_str = opportunity.get('revenue_claim', '$1000/month')
-        try:
-            revenue = float(revenue_str.replace('$', '').replace('/month', '').replace(',', ''))
-        except:
-            revenue = 1000
-
         return OpportunityRequirements(
             min_investment=investment,
             max_investment=investment * 1.5,
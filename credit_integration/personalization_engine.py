@@ -5,11 +5,35 @@ Personalizes opportunity recommendations based on credit profile
 """
 
 import chromadb
+import numpy as np
 from dataclasses import dataclass
-from typing import List, Dict, Optional
+from typing import List, Dict, Optional, Tuple
 from pathlib import Path
+from parse_investment import INVESTMENT_MAX_FIELD, INVESTMENT_MIN_FIELD
 from .fico_parser import CreditProfile, RiskProfile, BusinessType
 from .credit_scorer import CreditScorer, MatchScore
+from .score_index import ProfileScoreIndex
+
+COLLECTION_NAME = "business_opportunities"
+
+# Only show opportunities with at least this match score
+MIN_MATCH_SCORE = 40
+
+# Semantic hits considered per requested result. Scoring hits is a lookup when
+# the profile score index is available, so the window can be much wider.
+SEARCH_WINDOW_FACTOR = 2
+INDEXED_SEARCH_WINDOW_FACTOR = 10
+
+# A query with too few qualifying hits is re-run with a window this many times
+# wider, up to MAX_SEARCH_WINDOW hits
+SEARCH_WINDOW_GROWTH = 4
+MAX_SEARCH_WINDOW = 1000
+
+# Minimum (legitimacy, automation) scores per risk tolerance, pushed into the
+# vector query when risk_filter is on. Conservative profiles then only see
+# opportunities CreditScorer rates low or medium risk (legitimacy >= 60 and
+# automation >= 50); by default risk only lowers the match score.
+RISK_SCORE_FLOORS = {RiskProfile.CONSERVATIVE: (60, 50)}
 
 
 @dataclass
@@ -26,19 +50,194 @@ class PersonalizationEngine:
     """
     Personalizes opportunity recommendations based on user's
     credit profile, business type, and risk tolerance
+
+    The ChromaDB client and collection are opened on the first search and
+    reused for every later one, so repeated searches only pay vector-search
+    time. Call close() (or use the engine as a context manager) when done.
+
+    With a profile_key, match scores come from the per-profile score index
+    (see score_index.py), synced on first use, instead of being recomputed
+    per search. That also enables get_top_matches() over the whole collection.
+
+    Searches apply the profile's investment budget as a ChromaDB metadata
+    filter, so the candidate window is spent on opportunities the profile can
+    afford. If a window holds fewer than n_results qualifying matches, the
+    query is re-run with a wider window. The filter uses the numeric
+    investment fields, which documents stored before
+    backfill_numeric_fields.py has run do not have; a query still short once
+    the filtered matches are exhausted is topped up with an unfiltered search,
+    so those documents are ranked as before.
+
+    With risk_filter, conservative profiles also exclude opportunities below
+    RISK_SCORE_FLOORS outright. This is a behavior change from ranking them
+    lower, so it is off by default.
     """
 
-    def __init__(self, credit_profile: CreditProfile, rag_db_path: Path):
+    def __init__(
+        self,
+        credit_profile: CreditProfile,
+        rag_db_path: Path,
+        profile_key: Optional[str] = None,
+        score_index: Optional[ProfileScoreIndex] = None,
+        prefilter: bool = True,
+        risk_filter: bool = False
+    ):
         """
         Initialize personalization engine
 
         Args:
             credit_profile: User's business credit profile
             rag_db_path: Path to ChromaDB business opportunities database
+            profile_key: Name of the profile in the score index (e.g. 'isnbiz');
+                None scores every search on the fly
+            score_index: Profile score index (default: data/profile_scores.db
+                when profile_key is given)
+            prefilter: Apply the profile's budget as a metadata filter
+            risk_filter: Exclude opportunities outside the profile's risk band
+                (RISK_SCORE_FLOORS) instead of only scoring them lower
         """
         self.credit_profile = credit_profile
         self.rag_db_path = rag_db_path
         self.scorer = CreditScorer()
+        self.profile_key = profile_key
+        self.score_index = score_index or (ProfileScoreIndex() if profile_key else None)
+        self.prefilter = prefilter
+        self.risk_filter = risk_filter
+
+        # Opened lazily by the collection property, reused across searches
+        self._client = None
+        self._collection = None
+        self._index_synced = False
+
+    @property
+    def collection(self):
+        """Business opportunities collection, opened on first use"""
+        if self._collection is None:
+            if self._client is None:
+                self._client = chromadb.PersistentClient(path=str(self.rag_db_path))
+            self._collection = self._client.get_collection(COLLECTION_NAME)
+        return self._collection
+
+    def close(self):
+        """Release the ChromaDB client (reopened on the next search)"""
+        client, self._client, self._collection = self._client, None, None
+        close = getattr(client, "close", None)  # Client.close() needs chromadb >= 1.1
+        if close is not None:
+            close()
+
+    def __enter__(self) -> "PersonalizationEngine":
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+    def _index_ready(self) -> bool:
+        """Sync the profile's score index once per engine; False if unavailable"""
+        if self.score_index is None or not self.score_index.enabled or not self.profile_key:
+            return False
+
+        if not self._index_synced:
+            try:
+                self.score_index.sync_profile(self.profile_key, self.credit_profile, self.collection)
+                self._index_synced = True
+            except Exception as e:
+                print(f"Profile score index unavailable, scoring on the fly: {e}")
+                self.score_index = None
+                return False
+
+        return True
+
+    def _search_window(self, n_results: int) -> int:
+        """Semantic hits to fetch for n_results recommendations"""
+        factor = INDEXED_SEARCH_WINDOW_FACTOR if self._index_ready() else SEARCH_WINDOW_FACTOR
+        return min(n_results * factor, MAX_SEARCH_WINDOW)
+
+    def _metadata_filter(self, budget: bool = True) -> Optional[Dict]:
+        """
+        ChromaDB where clause for the profile's hard constraints (None if there
+        are none); budget=False leaves out the investment budget
+        """
+        conditions = []
+
+        # Affordable: the scorer uses the range's lower bound, or the upper
+        # bound when that is all that is known
+        max_inv = self.credit_profile.max_investment_recommendation
+        if budget and self.prefilter and max_inv > 0:
+            conditions.append({"$or": [
+                {INVESTMENT_MIN_FIELD: {"$lte": max_inv}},
+                {INVESTMENT_MAX_FIELD: {"$lte": max_inv}},
+            ]})
+
+        # Within the profile's risk band
+        floors = RISK_SCORE_FLOORS.get(self.credit_profile.risk_profile) if self.risk_filter else None
+        if floors:
+            min_legitimacy, min_automation = floors
+            conditions.append({"legitimacy_score": {"$gte": min_legitimacy}})
+            conditions.append({"automation_score": {"$gte": min_automation}})
+
+        if not conditions:
+            return None
+        return conditions[0] if len(conditions) == 1 else {"$and": conditions}
+
+    def _search(
+        self,
+        queries: List[str],
+        n_results: int,
+        min_score: float = MIN_MATCH_SCORE
+    ) -> List[List[Tuple[str, Dict]]]:
+        """
+        Filtered semantic hits per query, widened until each query has
+        n_results qualifying matches, runs out of matching documents, or
+        reaches MAX_SEARCH_WINDOW
+
+        Queries still short after that get the hits of a search without the
+        budget filter appended, which reaches documents lacking the numeric
+        investment fields.
+        """
+        where = self._metadata_filter()
+        window = self._search_window(n_results)
+        hits_per_query = self._query_rag_many(queries, window, where)
+
+        pending = [i for i, hits in enumerate(hits_per_query)
+                   if self._needs_wider_window(hits, window, n_results, min_score)]
+        while pending and window < MAX_SEARCH_WINDOW:
+            window = min(window * SEARCH_WINDOW_GROWTH, MAX_SEARCH_WINDOW)
+            wider = self._query_rag_many([queries[i] for i in pending], window, where)
+            for i, hits in zip(pending, wider):
+                hits_per_query[i] = hits
+            pending = [i for i in pending
+                       if self._needs_wider_window(hits_per_query[i], window, n_results, min_score)]
+
+        fallback_where = self._metadata_filter(budget=False)
+        if where != fallback_where:
+            short = [i for i, hits in enumerate(hits_per_query)
+                     if self._qualifying(hits, min_score) < n_results]
+            unfiltered = self._query_rag_many(
+                [queries[i] for i in short], self._search_window(n_results), fallback_where
+            )
+            for i, hits in zip(short, unfiltered):
+                seen = {doc_id for doc_id, _ in hits_per_query[i]}
+                hits_per_query[i] += [hit for hit in hits if hit[0] not in seen]
+
+        return hits_per_query
+
+    def _needs_wider_window(
+        self,
+        hits: List[Tuple[str, Dict]],
+        window: int,
+        n_results: int,
+        min_score: float
+    ) -> bool:
+        """True if a full window of hits still has fewer than n_results qualifying matches"""
+        if len(hits) < window:
+            return False  # every matching document was returned
+
+        return self._qualifying(hits, min_score) < n_results
+
+    def _qualifying(self, hits: List[Tuple[str, Dict]], min_score: float) -> int:
+        """Number of hits scoring at least min_score"""
+        totals = self._match_totals(dict(hits))
+        return sum(total >= min_score for total in totals.values())
 
     def get_personalized_recommendations(
         self,
@@ -56,56 +255,184 @@ class PersonalizationEngine:
             List of PersonalizedRecommendation objects, sorted by match score
         """
 
-        # Step 1: Query RAG database (semantic search)
-        opportunities = self._query_rag(query, n_results * 2)  # Get more, then filter
+        # Step 1: Query RAG database (filtered semantic search), more hits than needed
+        hits = self._search([query], n_results)[0]
+
+        # Steps 2-4: Score, filter and build recommendations
+        return self._recommend_many([hits], n_results)[0]
 
-        if not opportunities:
+    def get_top_matches(
+        self,
+        n_results: int = 10,
+        min_score: float = MIN_MATCH_SCORE
+    ) -> List[PersonalizedRecommendation]:
+        """
+        Best matches for the profile across the whole collection (no query)
+
+        Served from the profile score index; without it every stored
+        opportunity is scored on the fly.
+
+        Args:
+            n_results: Number of results to return
+            min_score: Minimum match score
+
+        Returns:
+            List of PersonalizedRecommendation objects, sorted by match score
+        """
+        try:
+            if self._index_ready():
+                top_ids = [doc_id for doc_id, _ in self.score_index.top(self.profile_key, n_results, min_score)]
+                if not top_ids:
+                    return []
+                results = self.collection.get(ids=top_ids, include=['metadatas'])
+                by_id = dict(zip(results['ids'], results['metadatas']))
+                hits = [(doc_id, by_id[doc_id]) for doc_id in top_ids if doc_id in by_id]
+            else:
+                results = self.collection.get(include=['metadatas'])
+                hits = sorted(zip(results['ids'], results['metadatas']), key=lambda hit: hit[0])  # ties break by ID, as in the index
+        except Exception as e:
+            print(f"Error querying RAG: {e}")
             return []
 
-        # Step 2: Score opportunities based on credit profile
-        scored_opportunities = self.scorer.batch_score_opportunities(
-            self.credit_profile,
-            opportunities
-        )
+        return self._recommend_many([hits], n_results, min_score)[0]
+
+    def get_personalized_recommendations_many(
+        self,
+        queries: List[str],
+        n_results: int = 10
+    ) -> Dict[str, List[PersonalizedRecommendation]]:
+        """
+        Personalized recommendations for several queries in one round trip
+
+        All enhanced queries are embedded and searched in a single
+        collection.query call. The union of the hits is scored once
+        (vectorized totals), results are split per query, and full match
+        scores and recommendations are built once per surviving opportunity.
+        Each query's list matches what get_personalized_recommendations
+        returns for it.
+
+        Args:
+            queries: User's search queries (e.g. comparison categories)
+            n_results: Number of results to return per query
+
+        Returns:
+            Query -> list of PersonalizedRecommendation objects, sorted by match score
+        """
+        unique_queries = list(dict.fromkeys(queries))
+        hits_per_query = self._search(unique_queries, n_results)
+
+        results = dict(zip(unique_queries, self._recommend_many(hits_per_query, n_results)))
+        return {query: results[query] for query in queries}
+
+    def _recommend_many(
+        self,
+        hits_per_query: List[List[Tuple[str, Dict]]],
+        n_results: int,
+        min_score: float = MIN_MATCH_SCORE
+    ) -> List[List[PersonalizedRecommendation]]:
+        """
+        Rank each query's (ID, opportunity) hits by match score and build the
+        top recommendations
+
+        Distinct candidates are scored once (index lookup or vectorized
+        totals); full match scores and recommendations are built once per
+        surviving opportunity.
+        """
+
+        # Score every distinct candidate once
+        candidates: Dict[str, Dict] = {}
+        for hits in hits_per_query:
+            for doc_id, opportunity in hits:
+                candidates.setdefault(doc_id, opportunity)
 
-        # Step 3: Filter by minimum score and take top N
-        min_score = 40  # Only show opportunities with 40+ match score
-        filtered = [(opp, score) for opp, score in scored_opportunities if score.total_score >= min_score]
-        top_opportunities = filtered[:n_results]
+        totals = self._match_totals(candidates)
 
-        # Step 4: Generate personalized insights
-        recommendations = []
-        for opportunity, match_score in top_opportunities:
-            recommendation = self._create_recommendation(opportunity, match_score)
-            recommendations.append(recommendation)
+        # Split back per query
+        top_ids_per_query = []
+        for hits in hits_per_query:
+            hit_ids = [doc_id for doc_id, _ in hits]
+            order = self.scorer.rank(
+                np.array([totals[doc_id] for doc_id in hit_ids]), n_results, min_score
+            )
+            top_ids_per_query.append([hit_ids[i] for i in order])
 
-        return recommendations
+        # Full match scores and recommendations only for the survivors, once each
+        survivor_ids = list(dict.fromkeys(doc_id for top_ids in top_ids_per_query for doc_id in top_ids))
+        match_scores = self.scorer.score_opportunities(
+            self.credit_profile, [candidates[doc_id] for doc_id in survivor_ids]
+        )
+        recommendations = {
+            doc_id: self._create_recommendation(candidates[doc_id], match_score)
+            for doc_id, match_score in zip(survivor_ids, match_scores)
+        }
+
+        return [
+            [recommendations[doc_id] for doc_id in top_ids]
+            for top_ids in top_ids_per_query
+        ]
+
+    def _match_totals(self, candidates: Dict[str, Dict]) -> Dict[str, float]:
+        """Total match score per document ID: from the score index, else computed"""
+
+        totals: Dict[str, float] = {}
+        if candidates and self._index_ready():
+            try:
+                totals = self.score_index.scores(self.profile_key, list(candidates))
+            except Exception as e:
+                print(f"Profile score index lookup failed, scoring on the fly: {e}")
+
+        missing = [doc_id for doc_id in candidates if doc_id not in totals]
+        if missing:
+            computed = self.scorer.score_totals(
+                self.credit_profile, [candidates[doc_id] for doc_id in missing]
+            )
+            totals.update(zip(missing, computed.tolist()))
+
+        return totals
 
     def _query_rag(self, query: str, n_results: int) -> List[Dict]:
         """Query the business opportunities RAG database"""
+        return [opportunity for _, opportunity in self._query_rag_many([query], n_results)[0]]
 
-        try:
-            client = chromadb.PersistentClient(path=str(self.rag_db_path))
-            collection = client.get_collection("business_opportunities")
+    def _query_rag_many(
+        self,
+        queries: List[str],
+        n_results: int,
+        where: Optional[Dict] = None
+    ) -> List[List[Tuple[str, Dict]]]:
+        """
+        Query the RAG database for several queries in one collection.query call
 
-            # Enhance query based on credit profile
-            enhanced_query = self._enhance_query(query)
+        All enhanced queries are embedded together and searched in one round
+        trip, restricted to documents matching the where clause (if any).
+        Returns one list of (document ID, opportunity metadata) pairs per
+        query, in similarity order.
+        """
+        if not queries:
+            return []
 
-            results = collection.query(
-                query_texts=[enhanced_query],
-                n_results=n_results
+        try:
+            # Enhance queries based on credit profile
+            enhanced_queries = [self._enhance_query(query) for query in queries]
+
+            results = self.collection.query(
+                query_texts=enhanced_queries,
+                n_results=n_results,
+                where=where,
+                include=['metadatas']
             )
 
-            # Convert to list of opportunity dicts
-            opportunities = []
-            for metadata in results['metadatas'][0]:
-                opportunities.append(metadata)
-
-            return opportunities
+            # Convert to lists of (ID, opportunity dict)
+            return [
+                list(zip(ids, metadatas))
+                for ids, metadatas in zip(results['ids'], results['metadatas'])
+            ]
 
         except Exception as e:
             print(f"Error querying RAG: {e}")
-            return []
+            # The collection may have been recreated; reopen it on the next search
+            self._collection = None
+            return [[] for _ in queries]
 
     def _enhance_query(self, query: str) -> str:
         """Enhance search query based on credit profile"""
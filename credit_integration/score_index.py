@@ -0,0 +1,335 @@
+#!/usr/bin/env python3
+"""
+Materialized per-profile match-score index.
+
+Design decisions:
+- Storage is SQLite (WAL) with connections from llm_cache's helpers. One row
+  per (profile, document) holding CreditScorer's total match score, indexed
+  by (profile_key, total_score) so "best matches for this profile" is an
+  index range scan over the whole collection.
+- Profiles are registered with their JSON and a fingerprint (sha256 of the
+  profile JSON plus SCORING_VERSION). sync_profile() rescores the whole
+  collection when the fingerprint changes (profile JSON edited, scoring rules
+  bumped) or when the row count no longer matches the collection.
+- New documents are scored incrementally. Pipelines call record(ids,
+  metadatas, collection) from the writer's on_flush hook; the batch is parsed
+  once (OpportunityColumns) and scored for every registered profile with the
+  vectorized CreditScorer.score_totals.
+- Each profile remembers the collection it was scored against
+  (chroma_writer.collection_identity). The production pipeline writes to the
+  Xeon server and PersonalizationEngine reads the local store, so record() and
+  remove() only touch profiles that mirror the collection written to, and
+  sync_profile() rescores a profile that was built from another collection.
+- Scores are exactly CreditScorer's total_score, so search can look them up
+  instead of re-scoring. Index errors are logged and callers fall back to
+  scoring on the fly; the index must never fail a pipeline run or a search.
+
+Usage:
+    from credit_integration.score_index import ProfileScoreIndex
+
+    index = ProfileScoreIndex()
+    index.sync_profile("isnbiz", profile, collection)  # rescore if stale
+    index.record(ids, metadatas, collection)            # e.g. from on_flush
+
+    index.scores("isnbiz", ["id1", "id2"])   # {"id1": 87.5, "id2": 61.25}
+    index.top("isnbiz", 10, min_score=40)    # [("id7", 97.0), ...]
+"""
+
+import hashlib
+import json
+import logging
+import sqlite3
+import time
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+import llm_cache
+from chroma_writer import collection_identity
+
+from .credit_scorer import CreditScorer, OpportunityColumns
+from .fico_parser import CreditProfile
+
+logger = logging.getLogger(__name__)
+
+_DEFAULT_DB_PATH = Path(__file__).parent.parent / "data" / "profile_scores.db"
+
+# Bump when CreditScorer's rules change so every profile is rescored
+SCORING_VERSION = 2
+
+_PAGE_SIZE = 1000
+_SQL_CHUNK = 500  # stays under SQLite's bound-variable limit
+
+
+# ---------------------------------------------------------------------------
+# Schema
+# ---------------------------------------------------------------------------
+
+def init_score_index(db_path: Path = _DEFAULT_DB_PATH) -> None:
+    """Create the index database and schema if they do not exist (idempotent)."""
+    db_path.parent.mkdir(parents=True, exist_ok=True)
+
+    # journal_mode must be set outside a transaction (see llm_cache.init_cache_db)
+    conn = sqlite3.connect(str(db_path), timeout=llm_cache._CONNECT_TIMEOUT_SECONDS)
+    try:
+        conn.execute(f"PRAGMA busy_timeout = {llm_cache._BUSY_TIMEOUT_MS}")
+        conn.execute("PRAGMA journal_mode = WAL")
+        conn.executescript("""
+            CREATE TABLE IF NOT EXISTS profiles (
+                profile_key  TEXT PRIMARY KEY,  -- e.g. "isnbiz"
+                fingerprint  TEXT NOT NULL,     -- profile_fingerprint()
+                profile_json TEXT NOT NULL,     -- CreditProfile.to_dict()
+                scored_at    TEXT NOT NULL,     -- ISO-8601 UTC of the last full rescore
+                collection   TEXT               -- collection_identity() it mirrors
+            );
+
+            CREATE TABLE IF NOT EXISTS match_scores (
+                profile_key TEXT NOT NULL,
+                doc_id      TEXT NOT NULL,
+                total_score REAL NOT NULL,      -- MatchScore.total_score
+                PRIMARY KEY (profile_key, doc_id)
+            );
+
+            CREATE INDEX IF NOT EXISTS idx_match_scores_rank
+                ON match_scores (profile_key, total_score DESC);
+        """)
+
+        # Indexes created before profiles were bound to a collection: NULL
+        # until the next full rescore, and updated by every record() until then
+        columns = {row[1] for row in conn.execute("PRAGMA table_info(profiles)")}
+        if "collection" not in columns:
+            conn.execute("ALTER TABLE profiles ADD COLUMN collection TEXT")
+        conn.commit()
+    finally:
+        conn.close()
+
+
+def profile_fingerprint(profile: CreditProfile) -> str:
+    """Changes whenever the profile JSON or the scoring rules change."""
+    payload = json.dumps({"profile": profile.to_dict(), "version": SCORING_VERSION}, sort_keys=True)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+# ---------------------------------------------------------------------------
+# Index
+# ---------------------------------------------------------------------------
+
+class ProfileScoreIndex:
+    """Precomputed CreditScorer totals for every stored opportunity, per profile."""
+
+    def __init__(self, db_path: Path = _DEFAULT_DB_PATH, enabled: bool = True):
+        """
+        Args:
+            db_path: Path to the index SQLite database
+            enabled: Set False to disable the index (callers score on the fly)
+        """
+        self.db_path = db_path
+        self.enabled = enabled
+
+        if self.enabled:
+            try:
+                init_score_index(self.db_path)
+            except Exception as e:
+                logger.warning(f"⚠️  Profile score index unavailable: {e}")
+                self.enabled = False
+
+    # -- Profiles ------------------------------------------------------------
+
+    def sync_profile(self, profile_key: str, profile: CreditProfile, collection: Any) -> bool:
+        """
+        Make sure profile_key's scores cover collection with the current profile.
+
+        Returns:
+            True if the profile was (re)scored, False if the index was current
+        """
+        if not self.enabled:
+            return False
+
+        fingerprint = profile_fingerprint(profile)
+
+        def _state():
+            with llm_cache._sqlite_connection(self.db_path) as conn:
+                row = conn.execute(
+                    "SELECT fingerprint, collection FROM profiles WHERE profile_key = ?", (profile_key,)
+                ).fetchone()
+                count = conn.execute(
+                    "SELECT COUNT(*) FROM match_scores WHERE profile_key = ?", (profile_key,)
+                ).fetchone()[0]
+                return (tuple(row) if row else (None, None)), count
+
+        (stored_fingerprint, mirrored), count = llm_cache._with_retry(_state)
+        if (
+            stored_fingerprint == fingerprint
+            and mirrored == collection_identity(collection)
+            and count == collection.count()
+        ):
+            return False
+
+        self.rebuild_profile(profile_key, profile, collection)
+        return True
+
+    def rebuild_profile(self, profile_key: str, profile: CreditProfile, collection: Any) -> int:
+        """
+        Rescore every document in collection for profile (replacing old scores).
+
+        Returns:
+            Number of documents scored
+        """
+        start_time = time.perf_counter()
+
+        ids: List[str] = []
+        metadatas: List[Dict] = []
+        offset = 0
+        while True:
+            page = collection.get(include=["metadatas"], limit=_PAGE_SIZE, offset=offset)
+            if not page["ids"]:
+                break
+            ids.extend(page["ids"])
+            metadatas.extend(metadata or {} for metadata in page["metadatas"])
+            offset += len(page["ids"])
+
+        totals = CreditScorer.score_totals(profile, metadatas).tolist()
+        scored_at = time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime())
+
+        def _replace():
+            with llm_cache._sqlite_connection(self.db_path) as conn:
+                conn.execute("DELETE FROM match_scores WHERE profile_key = ?", (profile_key,))
+                conn.executemany(
+                    "INSERT INTO match_scores (profile_key, doc_id, total_score) VALUES (?, ?, ?)",
+                    [(profile_key, doc_id, total) for doc_id, total in zip(ids, totals)],
+                )
+                conn.execute(
+                    "INSERT OR REPLACE INTO profiles "
+                    "(profile_key, fingerprint, profile_json, scored_at, collection) "
+                    "VALUES (?, ?, ?, ?, ?)",
+                    (profile_key, profile_fingerprint(profile), json.dumps(profile.to_dict()),
+                     scored_at, collection_identity(collection)),
+                )
+
+        llm_cache._with_retry(_replace)
+        logger.info(
+            f"🎯 Scored {len(ids)} opportunities for profile {profile_key} "
+            f"in {time.perf_counter() - start_time:.2f}s"
+        )
+        return len(ids)
+
+    def _profiles(self, source: Optional[str] = None) -> List[Tuple[str, CreditProfile]]:
+        """Registered profiles; with source, only those mirroring that collection (or none yet)"""
+        def _select():
+            with llm_cache._sqlite_connection(self.db_path) as conn:
+                return conn.execute(
+                    "SELECT profile_key, profile_json FROM profiles "
+                    "WHERE ? IS NULL OR collection IS NULL OR collection = ?",
+                    (source, source),
+                ).fetchall()
+
+        return [
+            (row["profile_key"], CreditProfile.from_dict(json.loads(row["profile_json"])))
+            for row in llm_cache._with_retry(_select)
+        ]
+
+    # -- Incremental updates -------------------------------------------------
+
+    def record(
+        self,
+        ids: Iterable[str],
+        metadatas: Iterable[Dict[str, Any]],
+        collection: Any = None,
+    ) -> None:
+        """
+        Score newly written (or updated) documents for every registered profile.
+
+        Args:
+            collection: The collection they were written to; profiles scored
+                against another collection are skipped (None scores them all)
+        """
+        if not self.enabled:
+            return
+
+        ids = list(ids)
+        if not ids:
+            return
+
+        try:
+            profiles = self._profiles(None if collection is None else collection_identity(collection))
+            if not profiles:
+                return
+
+            columns = OpportunityColumns([metadata or {} for metadata in metadatas])
+            rows = [
+                (profile_key, doc_id, total)
+                for profile_key, profile in profiles
+                for doc_id, total in zip(ids, CreditScorer.score_totals(profile, columns).tolist())
+            ]
+
+            def _upsert():
+                with llm_cache._sqlite_connection(self.db_path) as conn:
+                    conn.executemany(
+                        "INSERT OR REPLACE INTO match_scores (profile_key, doc_id, total_score) "
+                        "VALUES (?, ?, ?)",
+                        rows,
+                    )
+
+            llm_cache._with_retry(_upsert)
+        except Exception as e:
+            logger.warning(f"⚠️  Profile score index update failed for {len(ids)} documents: {e}")
+
+    def remove(self, ids: Iterable[str], collection: Any = None) -> None:
+        """Drop the scores of deleted documents (collection as in record())."""
+        if not self.enabled:
+            return
+
+        source = None if collection is None else collection_identity(collection)
+        rows = [(doc_id, source, source) for doc_id in ids]
+        if not rows:
+            return
+
+        def _delete():
+            with llm_cache._sqlite_connection(self.db_path) as conn:
+                conn.executemany(
+                    "DELETE FROM match_scores WHERE doc_id = ? AND profile_key IN ("
+                    "SELECT profile_key FROM profiles "
+                    "WHERE ? IS NULL OR collection IS NULL OR collection = ?)",
+                    rows,
+                )
+
+        try:
+            llm_cache._with_retry(_delete)
+        except Exception as e:
+            logger.warning(f"⚠️  Profile score index update failed for {len(rows)} deleted documents: {e}")
+
+    # -- Reads ---------------------------------------------------------------
+
+    def scores(self, profile_key: str, ids: List[str]) -> Dict[str, float]:
+        """Indexed total scores for ids (documents not in the index are omitted)."""
+        def _select(chunk):
+            with llm_cache._sqlite_connection(self.db_path) as conn:
+                placeholders = ",".join("?" * len(chunk))
+                return conn.execute(
+                    f"SELECT doc_id, total_score FROM match_scores "
+                    f"WHERE profile_key = ? AND doc_id IN ({placeholders})",
+                    (profile_key, *chunk),
+                ).fetchall()
+
+        found: Dict[str, float] = {}
+        for i in range(0, len(ids), _SQL_CHUNK):
+            for row in llm_cache._with_retry(_select, ids[i:i + _SQL_CHUNK]):
+                found[row["doc_id"]] = row["total_score"]
+        return found
+
+    def top(
+        self,
+        profile_key: str,
+        limit: int,
+        min_score: Optional[float] = None,
+    ) -> List[Tuple[str, float]]:
+        """Best-matching documents for profile_key across the whole collection."""
+        def _select():
+            with llm_cache._sqlite_connection(self.db_path) as conn:
+                return conn.execute(
+                    "SELECT doc_id, total_score FROM match_scores "
+                    "WHERE profile_key = ? AND total_score >= ? "
+                    "ORDER BY total_score DESC, doc_id LIMIT ?",
+                    (profile_key, float("-inf") if min_score is None else min_score, limit),
+                ).fetchall()
+
+        return [(row["doc_id"], row["total_score"]) for row in llm_cache._with_retry(_select)]
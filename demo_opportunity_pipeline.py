@@ -11,15 +11,31 @@ import chromadb
 from datetime import datetime
 from pathlib import Path
 
+from analysis_cache import AnalysisCache, analysis_fingerprint, analysis_key
+from chroma_writer import make_doc_id
+from trend_aggregates import TrendAggregates
+from credit_integration.score_index import ProfileScoreIndex
+from parse_investment import numeric_metadata
+
 # Configuration
 WORKSPACE = Path(__file__).parent.absolute()  # opportunity-research-bot directory
 LLAMA_SERVER = "http://localhost:8080"
 EMBEDDING_SERVER = "http://localhost:8001"
 RAG_BUSINESS_DB = WORKSPACE / "data" / "chroma_db"
 
+# Bump when the analysis prompt changes so cached analyses are invalidated.
+# The template id keeps this pipeline's analyses apart from the other
+# pipelines' in the shared cache (different prompt and result schema).
+ANALYSIS_TEMPLATE = "demo"
+ANALYSIS_PROMPT_VERSION = 1
+LLM_MODEL = "qwen-2.5-7b"
+
 class OpportunityPipeline:
     def __init__(self):
         self.opportunities = []
+        self.analysis_cache = AnalysisCache()
+        self.trend_aggregates = TrendAggregates()
+        self.score_index = ProfileScoreIndex()
 
     def scrape_opportunities(self):
         """Step 1: Scrape opportunities from multiple sources"""
@@ -65,6 +81,21 @@ class OpportunityPipeline:
         """Step 2: Analyze opportunity with local Qwen LLM"""
         print(f"\n🤖 Analyzing: {opportunity['title']}")
 
+        fingerprint = analysis_fingerprint(
+            opportunity['title'],
+            opportunity['description'],
+            opportunity['revenue_claim'],
+            opportunity['tech_stack'],
+            template=ANALYSIS_TEMPLATE,
+            prompt_version=ANALYSIS_PROMPT_VERSION,
+            model=LLM_MODEL
+        )
+        cache_key = analysis_key(opportunity['url'], opportunity['source'], opportunity['title'])
+        cached = self.analysis_cache.get(cache_key, fingerprint)
+        if cached is not None:
+            print(f"   💾 Cached analysis, Automation Score: {cached.get('automation_score', 'N/A')}/100")
+            return cached
+
         # Build analysis prompt
         prompt = f"""You are an expert business analyst specializing in AI automation opportunities.
 
@@ -122,6 +153,7 @@ Respond ONLY with valid JSON."""
                     analysis = json.loads(analysis_text)
                     print(f"   Automation Score: {analysis.get('automation_score', 'N/A')}/100")
                     print(f"   Legitimacy: {analysis.get('legitimacy_score', 'N/A')}/100")
+                    self.analysis_cache.put(cache_key, fingerprint, analysis)
                     return analysis
                 except json.JSONDecodeError:
                     print(f"   ⚠️  Failed to parse JSON, using fallback")
@@ -204,28 +236,38 @@ Respond ONLY with valid JSON."""
 - Discovered: {datetime.now().isoformat()}
 """
 
-            # Generate document ID
-            doc_id = f"opp_{datetime.now().timestamp()}"
+            # Stable document ID from the URL: reruns update in place
+            doc_id = make_doc_id(opportunity['url'])
+
+            metadata = {
+                "title": opportunity['title'],
+                "source": opportunity['source'],
+                "url": opportunity['url'],
+                "revenue_claim": opportunity['revenue_claim'],
+                "automation_score": analysis['automation_score'],
+                "legitimacy_score": analysis['legitimacy_score'],
+                "tech_stack": opportunity['tech_stack'],
+                "time_to_market": analysis['time_to_market'],
+                "initial_investment": analysis['initial_investment'],
+                "created_at": datetime.now().isoformat(),
+                "category": "ai-automation"
+            }
+            # Numeric investment/revenue/time fields, parsed once here
+            metadata.update(numeric_metadata(
+                analysis['initial_investment'], analysis['time_to_market'], opportunity['revenue_claim']
+            ))
 
-            # Add to collection
-            collection.add(
+            # Insert or update in collection
+            collection.upsert(
                 ids=[doc_id],
                 documents=[document],
-                metadatas=[{
-                    "title": opportunity['title'],
-                    "source": opportunity['source'],
-                    "url": opportunity['url'],
-                    "revenue_claim": opportunity['revenue_claim'],
-                    "automation_score": analysis['automation_score'],
-                    "legitimacy_score": analysis['legitimacy_score'],
-                    "tech_stack": opportunity['tech_stack'],
-                    "time_to_market": analysis['time_to_market'],
-                    "initial_investment": analysis['initial_investment'],
-                    "created_at": datetime.now().isoformat(),
-                    "category": "ai-automation"
-                }]
+                metadatas=[metadata]
             )
 
+            # Keep the trends report counters and profile match scores in step
+            self.trend_aggregates.record([doc_id], [metadata], collection)
+            self.score_index.record([doc_id], [metadata], collection)
+
             print(f"✅ Stored opportunity ID: {doc_id}")
             print(f"   Collection now has {collection.count()} opportunities")
 
@@ -263,6 +305,8 @@ Respond ONLY with valid JSON."""
         print("🚀 OPPORTUNITY RESEARCH BOT - FULL PIPELINE DEMO")
         print("=" * 60)
 
+        self.analysis_cache.reset_stats()
+
         # Step 1: Scrape
         opportunities = self.scrape_opportunities()
 
@@ -281,6 +325,8 @@ Respond ONLY with valid JSON."""
         print("\n" + "=" * 60)
         print("✅ PIPELINE COMPLETE!")
         print("=" * 60)
+        cache_stats = self.analysis_cache.stats()
+        print(f"\n💾 LLM cache: {cache_stats['hits']} hits, {cache_stats['misses']} misses")
         print(f"\n💡 Next Steps:")
         print(f"   1. Start llama-cpp-docker for real Qwen analysis:")
         print(f"      cd llama-cpp-docker && docker-compose up -d")
@@ -1,17 +1,25 @@
 #!/usr/bin/env python3
 """
 Generate comprehensive trends and insights report from ChromaDB
+- Reads the materialized counters in trend_aggregates (milliseconds) instead of
+  scanning every document in the collection
+- The aggregates are seeded from the local ChromaDB collection automatically,
+  and reseeded when they were built from another store or their total no longer
+  matches the collection (pipelines keep them current in between); --rebuild
+  forces a recompute
 """
 
+import argparse
 import sys
 import os
 from pathlib import Path
 from collections import Counter
-import statistics
 from datetime import datetime
 import chromadb
 import json
 
+from trend_aggregates import TrendAggregates, HIGH_AUTOMATION, HIGH_LEGITIMACY
+
 # Force UTF-8 encoding for Windows console
 if sys.platform == 'win32':
     import io
@@ -21,14 +29,30 @@ if sys.platform == 'win32':
 WORKSPACE = Path(__file__).parent.absolute()
 LOCAL_CHROMA_PATH = WORKSPACE / "data" / "chroma_db"
 
-def generate_report():
+def open_collection():
+    """The local ChromaDB collection the report covers"""
+    client = chromadb.PersistentClient(path=str(LOCAL_CHROMA_PATH))
+    return client.get_collection("business_opportunities")
+
+
+def rebuild_aggregates(aggregates: TrendAggregates, collection) -> int:
+    """Recompute the trend aggregates from the local ChromaDB collection"""
+    print(f"Rebuilding trend aggregates from ChromaDB at {LOCAL_CHROMA_PATH}\n")
+    return aggregates.rebuild(collection)
+
+
+def generate_report(rebuild: bool = False):
     """Generate comprehensive trends report"""
 
-    print(f"Connecting to ChromaDB at {LOCAL_CHROMA_PATH}\n")
-    client = chromadb.PersistentClient(path=str(LOCAL_CHROMA_PATH))
-    collection = client.get_collection("business_opportunities")
+    aggregates = TrendAggregates()
+    collection = open_collection()
+    if rebuild:
+        rebuild_aggregates(aggregates, collection)
+    elif aggregates.sync(collection):
+        print(f"Trend aggregates were out of date; rebuilt from ChromaDB at {LOCAL_CHROMA_PATH}\n")
 
-    total_count = collection.count()
+    counters = aggregates.counters()
+    total_count = aggregates.total()
 
     # Create report
     report = []
@@ -45,46 +69,24 @@ def generate_report():
         print("\n".join(report))
         return
 
-    # Fetch all data
-    results = collection.get(include=['metadatas', 'documents'])
-    metadatas = results['metadatas']
-
-    # Analysis containers
-    automation_scores = []
-    legitimacy_scores = []
-    sources = []
-    categories = []
-    investments = {}
-    time_to_markets = {}
-    revenues = {}
+    # Materialized counters (see trend_aggregates.py)
+    def _counts(dimension):
+        return {key: int(c['count']) for key, c in counters.get(dimension, {}).items()}
 
-    # Parse all opportunities
-    for metadata in metadatas:
-        auto = float(metadata.get('automation_score', 0))
-        leg = float(metadata.get('legitimacy_score', 0))
-        automation_scores.append(auto)
-        legitimacy_scores.append(leg)
-        sources.append(metadata.get('source', 'unknown'))
-
-        if 'category' in metadata:
-            categories.append(metadata['category'])
-
-        inv = metadata.get('initial_investment', 'Unknown')
-        investments[inv] = investments.get(inv, 0) + 1
-
-        ttm = metadata.get('time_to_market', 'Unknown')
-        time_to_markets[ttm] = time_to_markets.get(ttm, 0) + 1
-
-        rev = metadata.get('revenue_claim', 'Unknown')
-        revenues[rev] = revenues.get(rev, 0) + 1
+    totals = counters['total']['']
+    flags = _counts('flag')
+    categories = Counter(_counts('category'))
+    investment_buckets = _counts('investment_bucket')
+    time_buckets = _counts('time_bucket')
+    revenues = _counts('revenue_claim')
 
     # === TREND 1: Automation vs Legitimacy ===
     report.append("\n")
     report.append("TREND #1: AUTOMATION VS LEGITIMACY BALANCE")
     report.append("-" * 80)
 
-    avg_auto = statistics.mean(automation_scores)
-    avg_leg = statistics.mean(legitimacy_scores)
+    avg_auto = totals['sum_automation'] / total_count
+    avg_leg = totals['sum_legitimacy'] / total_count
 
     report.append(f"Average Automation Score: {avg_auto:.1f}/100")
     report.append(f"Average Legitimacy Score: {avg_leg:.1f}/100")
@@ -101,12 +103,12 @@ def generate_report():
         report.append("ACTION: Continue current scraping strategy.")
 
     # High scorers
-    high_both = sum(1 for a, l in zip(automation_scores, legitimacy_scores) if a > 80 and l > 85)
-    high_auto = sum(1 for a in automation_scores if a > 80)
-    high_leg = sum(1 for l in legitimacy_scores if l > 85)
+    high_both = flags.get('high_both', 0)
+    high_auto = flags.get('high_automation', 0)
+    high_leg = flags.get('high_legitimacy', 0)
 
-    report.append(f"\nHigh Automation (>80): {high_auto} ({high_auto/total_count*100:.1f}%)")
-    report.append(f"High Legitimacy (>85): {high_leg} ({high_leg/total_count*100:.1f}%)")
+    report.append(f"\nHigh Automation (>{HIGH_AUTOMATION}): {high_auto} ({high_auto/total_count*100:.1f}%)")
+    report.append(f"High Legitimacy (>{HIGH_LEGITIMACY}): {high_leg} ({high_leg/total_count*100:.1f}%)")
     report.append(f"Both High: {high_both} ({high_both/total_count*100:.1f}%)")
 
     if high_both < 5:
@@ -118,29 +120,17 @@ def generate_report():
     report.append("TREND #2: SOURCE PERFORMANCE")
     report.append("-" * 80)
 
-    source_counts = Counter(sources)
+    source_counts = Counter(_counts('source'))
     report.append(f"Total Sources: {len(source_counts)}")
 
-    # Calculate average scores per source
-    source_scores = {}
-    for metadata in metadatas:
-        source = metadata.get('source', 'unknown')
-        auto = float(metadata.get('automation_score', 0))
-        leg = float(metadata.get('legitimacy_score', 0))
-
-        if source not in source_scores:
-            source_scores[source] = {'auto': [], 'leg': []}
-
-        source_scores[source]['auto'].append(auto)
-        source_scores[source]['leg'].append(leg)
-
+    # Average scores per source, from the per-source score sums
     report.append("\nSource Performance (sorted by quality):")
     source_quality = []
-    for source, scores in source_scores.items():
-        avg_auto = statistics.mean(scores['auto'])
-        avg_leg = statistics.mean(scores['leg'])
+    for source, scores in counters.get('source', {}).items():
+        count = int(scores['count'])
+        avg_auto = scores['sum_automation'] / count
+        avg_leg = scores['sum_legitimacy'] / count
         combined = avg_auto + avg_leg
-        count = source_counts[source]
 
         source_quality.append({
             'source': source,
@@ -165,17 +155,17 @@ def generate_report():
     report.append("TREND #3: INVESTMENT PATTERNS")
     report.append("-" * 80)
 
-    # Categorize investments
-    zero_investment = sum(count for inv, count in investments.items() if '$0' in inv or 'minimal' in inv.lower())
-    low_investment = sum(count for inv, count in investments.items() if any(x in inv for x in ['$100', '$200', '$300', '$400', '$500']))
-    mid_investment = sum(count for inv, count in investments.items() if any(x in inv for x in ['$1000', '$2000', '$3000', '$5000']))
-    high_investment = sum(count for inv, count in investments.items() if any(x in inv for x in ['$10000', '$20000', '$50000']))
-    unknown_investment = investments.get('Unknown', 0)
+    # Investment buckets by the parsed lower bound (see trend_aggregates._investment_bucket)
+    zero_investment = investment_buckets.get('zero', 0)
+    low_investment = investment_buckets.get('low', 0)
+    mid_investment = investment_buckets.get('mid', 0)
+    high_investment = investment_buckets.get('high', 0)
+    unknown_investment = investment_buckets.get('unknown', 0)
 
     report.append(f"Zero Investment ($0): {zero_investment} ({zero_investment/total_count*100:.1f}%)")
     report.append(f"Low Investment (<$1K): {low_investment} ({low_investment/total_count*100:.1f}%)")
     report.append(f"Mid Investment ($1K-$10K): {mid_investment} ({mid_investment/total_count*100:.1f}%)")
-    report.append(f"High Investment (>$10K): {high_investment} ({high_investment/total_count*100:.1f}%)")
+    report.append(f"High Investment ($10K+): {high_investment} ({high_investment/total_count*100:.1f}%)")
     report.append(f"Unknown: {unknown_investment} ({unknown_investment/total_count*100:.1f}%)")
 
     if unknown_investment > total_count * 0.4:
@@ -193,14 +183,11 @@ def generate_report():
     report.append("TREND #4: TIME TO MARKET ANALYSIS")
     report.append("-" * 80)
 
-    # Categorize time to market
-    quick_wins = sum(count for ttm, count in time_to_markets.items()
-                     if any(x in ttm.lower() for x in ['week', 'days', '1-2']))
-    moderate_time = sum(count for ttm, count in time_to_markets.items()
-                       if any(x in ttm.lower() for x in ['month', '2-3', '3-4']))
-    long_term = sum(count for ttm, count in time_to_markets.items()
-                   if any(x in ttm.lower() for x in ['6', 'year', 'quarter']))
-    unknown_time = time_to_markets.get('Unknown', 0)
+    # Time buckets by parsed months to revenue (see trend_aggregates._time_bucket)
+    quick_wins = time_buckets.get('quick', 0)
+    moderate_time = time_buckets.get('moderate', 0)
+    long_term = time_buckets.get('long', 0)
+    unknown_time = time_buckets.get('unknown', 0)
 
     report.append(f"Quick Wins (<1 month): {quick_wins} ({quick_wins/total_count*100:.1f}%)")
     report.append(f"Moderate (1-3 months): {moderate_time} ({moderate_time/total_count*100:.1f}%)")
@@ -325,12 +312,8 @@ def generate_report():
     report.append("DATABASE HEALTH")
     report.append("-" * 80)
 
-    # Calculate completeness
-    complete_opportunities = sum(
-        1 for m in metadatas
-        if all(k in m and m[k] not in ['Unknown', 'Not specified', '']
-               for k in ['title', 'source', 'automation_score', 'legitimacy_score'])
-    )
+    # Completeness (title, source and both scores present)
+    complete_opportunities = flags.get('complete', 0)
 
     completeness = (complete_opportunities / total_count) * 100 if total_count > 0 else 0
 
@@ -363,4 +346,9 @@ def generate_report():
     print(f"\nReport saved to: {report_file}")
 
 if __name__ == "__main__":
-    generate_report()
+    parser = argparse.ArgumentParser(description="Generate the opportunity trends report")
+    parser.add_argument('--rebuild', action='store_true',
+                        help='Recompute the trend aggregates from ChromaDB before reporting')
+    args = parser.parse_args()
+
+    generate_report(rebuild=args.rebuild)
@@ -3,9 +3,14 @@
 LLM Analysis Result Cache — SQLite-backed, WAL mode, multi-process safe.
 
 Design decisions:
-- One connection per operation (not a persistent shared connection): correct for
-  ProcessPoolExecutor where each worker is a separate OS process. SQLite's WAL
-  file-level locking handles cross-process serialization; no Python lock needed.
+- Pooled connections: each thread of each process keeps one open connection per
+  database file and reuses it for every operation, so the per-connection PRAGMAs
+  run once and sqlite3's prepared-statement cache is actually reused. Nothing is
+  shared across threads or processes: a forked ProcessPoolExecutor worker drops
+  the connections it inherited and opens its own. SQLite's WAL file-level
+  locking handles cross-process serialization; no Python lock needed.
+  Set LLM_CACHE_POOL=0 (or call set_connection_pooling(False)) to go back to
+  one connection per operation.
 - WAL journal mode: set once at DB creation, persists across all future connections.
 - PRAGMA synchronous = NORMAL: safe with WAL for a cache (not financial data).
   A transaction may roll back after a power loss, but the DB will never corrupt.
@@ -14,7 +19,36 @@ Design decisions:
 - Exponential backoff retry: thin wrapper over busy_timeout for OperationalError
   cases that slip through (e.g. SQLITE_BUSY_SNAPSHOT in WAL mode).
 - Key: uuid5(NAMESPACE_URL, url) as TEXT PRIMARY KEY — deterministic, collision-free.
-- Value: JSON-serialized analysis result stored as TEXT.
+- Value: JSON-serialized analysis result, stored as TEXT by default.
+  Compression is opt-in: with LLM_CACHE_CODEC=zlib (or zstd, when the
+  zstandard package is installed) values of _COMPRESS_MIN_BYTES or more are
+  stored compressed, as a BLOB, with the codec recorded in the codec column.
+  Rows with no codec are plain JSON TEXT, so rows written before compression
+  existed, or with it off, stay readable. compress_entries()
+  can train a shared dictionary on recent values (analyses repeat the same
+  keys and phrasing, which a per-value compressor cannot exploit) and rewrites
+  every row; a smaller file keeps more of the cache inside mmap_size and the
+  page cache.
+- Optional content_hash: fingerprint of the inputs the result was computed from.
+  A lookup with a different content_hash is a miss; the next cache_result for
+  that URL replaces the stale row, so there is still one row per URL.
+- Bounded size: entries may carry a TTL (expires_at; LLM_CACHE_TTL_DAYS sets
+  the default) and the table may be capped by rows (LLM_CACHE_MAX_ROWS) and
+  by bytes of used pages, indexes included (LLM_CACHE_MAX_MB). evict_entries()
+  deletes expired rows, then least-recently-used rows (last_accessed, epoch
+  seconds, bumped by the hit UPDATE that already runs) until both bounds hold.
+  It runs every _EVICT_EVERY_WRITES writes per process and in run_maintenance(),
+  whose incremental vacuum then returns the freed pages to the OS.
+- Lookup counters: hits and misses are counted in memory and added to the
+  llm_cache_counters table in batches, so a miss never takes the write lock.
+  cache_stats() reports the hit rate, expired/evicted counts and sizes.
+- Two tiers: a bounded in-process LRU (L1, LLM_CACHE_L1_SIZE entries, 0 turns
+  it off) sits in front of SQLite (L2). Lookups try L1 first; L2 hits and
+  every write are copied into it (write-through), and delete_cached_result()
+  invalidates it. L1 hits skip SQLite entirely; their hit_count/last_accessed
+  updates are batched with the counters. L1 is per process, so a result that
+  another process rewrote is only seen here once the lookup's content_hash
+  no longer matches (or the entry expires or is pushed out).
 
 Usage:
     from llm_cache import get_cached_result, cache_result, init_cache_db
@@ -25,16 +59,47 @@ Usage:
     if result is None:
         result = call_llm(url)
         cache_result(url, result)
+
+    # Invalidate automatically when the inputs change:
+    result = get_cached_result(url, content_hash=fingerprint)
+
+    # Per-entry lifetime (default: LLM_CACHE_TTL_DAYS; 0 = never expires):
+    cache_result(url, result, ttl_seconds=7 * 86400)
+
+    # Many URLs in one round trip per chunk:
+    hits = get_cached_results(urls, content_hashes={url: fingerprint, ...})
+    cache_results({url: result, ...}, content_hashes={url: fingerprint, ...})
+
+    close_connections()   # optional, at shutdown
+
+Compress existing rows (optionally training a dictionary first) and report
+the bytes saved:
+    python3 llm_cache.py --compress zstd --train-dict
+
+Benchmark (pooled vs one connection per operation):
+    python3 llm_cache.py --bench 20000
 """
 
+import atexit
+import collections
 import json
 import logging
+import math
+import os
 import sqlite3
+import threading
 import time
 import uuid
+import weakref
+import zlib
 from contextlib import contextmanager
 from pathlib import Path
-from typing import Any, Generator, Optional
+from typing import Any, Callable, Dict, Generator, Iterable, List, Mapping, Optional, Tuple
+
+try:
+    import zstandard
+except ImportError:  # optional: LLM_CACHE_CODEC=zlib needs only the stdlib
+    zstandard = None
 
 logger = logging.getLogger(__name__)
 
@@ -60,6 +125,86 @@ _BUSY_TIMEOUT_MS: int = 30_000
 _MAX_RETRIES: int = 3
 _RETRY_INITIAL_DELAY: float = 0.1  # seconds; doubles each attempt
 
+# Reuse one connection per thread and database file (see _ConnectionPool).
+_POOL_CONNECTIONS: bool = os.getenv("LLM_CACHE_POOL", "1") != "0"
+
+# Prepared statements kept per connection (sqlite3's LRU statement cache). Every
+# query in this module and its users is a constant string, so they all fit.
+_CACHED_STATEMENTS: int = 256
+
+# Keys per "WHERE cache_key IN (...)" query in the bulk API. SQLite builds before
+# 3.32 allow at most 999 bound parameters per statement; stay well below that.
+_IN_CHUNK_SIZE: int = 500
+
+
+def _env_bound(name: str, scale: float = 1) -> Optional[int]:
+    """Positive number from an environment variable (times scale), else None."""
+    raw = os.getenv(name, "").strip()
+    if not raw:
+        return None
+    try:
+        value = float(raw)
+    except ValueError:
+        logger.warning("Ignoring %s=%r: not a number", name, raw)
+        return None
+    return int(value * scale) if value > 0 else None
+
+
+# Lifetime of entries written without an explicit ttl_seconds; None = no expiry.
+_DEFAULT_TTL_SECONDS: Optional[int] = _env_bound("LLM_CACHE_TTL_DAYS", 86400)
+
+# Size bounds enforced by evict_entries(); None = unbounded.
+_MAX_ROWS: Optional[int] = _env_bound("LLM_CACHE_MAX_ROWS")
+_MAX_BYTES: Optional[int] = _env_bound("LLM_CACHE_MAX_MB", 1024 * 1024)
+
+# Each process runs an eviction pass after this many writes to a database.
+_EVICT_EVERY_WRITES: int = 1000
+
+# Buffered hit/miss counts are written to llm_cache_counters after this many lookups.
+_COUNTER_FLUSH_EVERY: int = 256
+
+# Entries in the in-process L1 tier (see _MemoryTier); 0 disables it.
+_L1_MAX_ENTRIES: int = (
+    (_env_bound("LLM_CACHE_L1_SIZE") or 0) if "LLM_CACHE_L1_SIZE" in os.environ else 1024
+)
+
+# Value compression: codec for new values (see _resolve_codec), the smallest
+# value worth compressing (UTF-8 bytes; below it the codec's header and a
+# BLOB gain nothing) and the codec levels.
+_CODECS = ("none", "zlib", "zstd")
+_COMPRESS_MIN_BYTES: int = 256
+_ZLIB_LEVEL: int = 6
+_ZSTD_LEVEL: int = 3
+
+
+def _resolve_codec(name: str) -> str:
+    """A usable codec name: unknown names fall back to zlib, so does zstd without zstandard."""
+    name = (name or "none").strip().lower()
+    if name not in _CODECS:
+        logger.warning("Unknown LLM cache codec %r, using zlib", name)
+        return "zlib"
+    if name == "zstd" and zstandard is None:
+        logger.warning("zstandard not installed, compressing LLM cache values with zlib "
+                       "(pip install zstandard)")
+        return "zlib"
+    return name
+
+
+_CODEC: str = _resolve_codec(os.getenv("LLM_CACHE_CODEC", "none"))
+
+# Shared dictionaries: size, and the recent values they are trained on. zlib
+# only looks back 32 KB, so its preset dictionary cannot usefully be larger.
+_DICT_SIZE: int = 32 * 1024
+_DICT_SAMPLES: int = 2000
+_DICT_MIN_SAMPLES: int = 20
+
+# Rows per transaction when compress_entries() rewrites the table.
+_REWRITE_PAGE_SIZE: int = 500
+
+# Upper bound on delete rounds when shrinking to max_bytes (each round removes
+# the estimated excess, so one or two rounds are normally enough).
+_MAX_EVICTION_ROUNDS: int = 8
+
 
 # ---------------------------------------------------------------------------
 # Pragma block — which settings persist, which must be set per connection
@@ -80,34 +225,28 @@ _RETRY_INITIAL_DELAY: float = 0.1  # seconds; doubles each attempt
 
 
 # ---------------------------------------------------------------------------
-# Core context manager
+# Connections
 # ---------------------------------------------------------------------------
 
-@contextmanager
-def _sqlite_connection(
-    db_path: Path = _DEFAULT_DB_PATH,
-) -> Generator[sqlite3.Connection, None, None]:
+def _open_connection(db_path: Path) -> sqlite3.Connection:
     """
-    Open a SQLite connection with production-safe PRAGMAs, yield it inside an
-    explicit transaction, commit on clean exit, roll back on any exception, and
-    always close the connection.
+    Open a SQLite connection with production-safe PRAGMAs.
 
-    This is the ONLY place connections are created in this module. Every call
-    opens a fresh connection — correct for ProcessPoolExecutor workers (separate
-    OS processes), where connection objects cannot be pickled or shared.
+    This is the ONLY place connections are created in this module.
 
     Isolation level is set to None (autocommit off is Python default, but we
     manage transactions manually with explicit BEGIN/COMMIT/ROLLBACK for clarity).
     """
-    conn: Optional[sqlite3.Connection] = None
+    conn = sqlite3.connect(
+        str(db_path),
+        timeout=_CONNECT_TIMEOUT_SECONDS,  # Python-level wait before connect raises
+        check_same_thread=False,            # safe: used by one thread at a time; lets
+                                            # the pool close a dead thread's connection
+        isolation_level=None,               # disable Python's implicit transaction mgmt
+                                            # we issue BEGIN/COMMIT/ROLLBACK ourselves
+        cached_statements=_CACHED_STATEMENTS,
+    )
     try:
-        conn = sqlite3.connect(
-            str(db_path),
-            timeout=_CONNECT_TIMEOUT_SECONDS,  # Python-level wait before connect raises
-            check_same_thread=False,            # safe: one connection per process/call
-            isolation_level=None,               # disable Python's implicit transaction mgmt
-                                                # we issue BEGIN/COMMIT/ROLLBACK ourselves
-        )
         conn.row_factory = sqlite3.Row
 
         # --- Per-connection PRAGMAs (must be set on every new connection) ---
@@ -129,6 +268,159 @@ def _sqlite_connection(
 
         # Memory-mapped I/O up to 128 MB — reduces syscall overhead on reads.
         conn.execute("PRAGMA mmap_size = 134217728")
+    except Exception:
+        conn.close()
+        raise
+
+    return conn
+
+
+class _ConnectionPool:
+    """
+    One open connection per (thread, database file), for the current process.
+
+    - Lookups go through a threading.local, so the hot path takes no lock.
+    - Fork detection: the pool remembers the PID it was filled in. A child
+      process (ProcessPoolExecutor with the fork start method) finds a different
+      PID and starts empty. Inherited connections are abandoned, never used or
+      closed: SQLite forbids carrying an open connection across fork().
+    - Connections of threads that have exited are closed the next time any
+      thread opens a connection, so short-lived worker threads do not leak.
+    """
+
+    def __init__(self):
+        self._reset()
+
+    def _reset(self) -> None:
+        self._pid = os.getpid()
+        self._lock = threading.Lock()
+        self._local = threading.local()
+        self._generation = 0  # bumped by close_all(); stale thread caches reopen
+        # (owning thread, db path, connection) for every connection handed out
+        self._open: List[Tuple[weakref.ref, str, sqlite3.Connection]] = []
+
+    def _connections(self) -> Dict[str, sqlite3.Connection]:
+        """This thread's db path -> connection map"""
+        if self._pid != os.getpid():
+            self._reset()
+
+        local = self._local
+        if getattr(local, "generation", None) != self._generation:
+            local.generation = self._generation
+            local.connections = {}
+        return local.connections
+
+    def get(self, db_path: Path) -> sqlite3.Connection:
+        """This thread's connection to db_path, opened on first use"""
+        connections = self._connections()
+        key = str(db_path)
+        conn = connections.get(key)
+        if conn is None:
+            conn = connections[key] = _open_connection(db_path)
+            with self._lock:
+                self._close_orphans()
+                self._open.append((weakref.ref(threading.current_thread()), key, conn))
+        return conn
+
+    def discard(self, db_path: Path, conn: sqlite3.Connection) -> None:
+        """Close a connection left in an unknown state; the next get() reopens"""
+        self._connections().pop(str(db_path), None)
+        with self._lock:
+            self._open = [entry for entry in self._open if entry[2] is not conn]
+        _close_quietly(conn)
+
+    def close_all(self) -> int:
+        """Close every pooled connection of this process; returns how many"""
+        if self._pid != os.getpid():
+            self._reset()
+            return 0
+
+        with self._lock:
+            open_connections, self._open = self._open, []
+            self._generation += 1
+        for _, _, conn in open_connections:
+            _close_quietly(conn)
+        return len(open_connections)
+
+    def size(self) -> int:
+        """Number of open pooled connections in this process"""
+        if self._pid != os.getpid():
+            return 0
+        with self._lock:
+            return len(self._open)
+
+    def _close_orphans(self) -> None:
+        """Close connections whose thread has exited (caller holds the lock)"""
+        alive = []
+        for entry in self._open:
+            thread = entry[0]()
+            if thread is not None and thread.is_alive():
+                alive.append(entry)
+            else:
+                _close_quietly(entry[2])
+        self._open = alive
+
+
+def _close_quietly(conn: sqlite3.Connection) -> None:
+    try:
+        conn.close()
+    except sqlite3.Error:
+        pass
+
+
+_POOL = _ConnectionPool()
+
+if hasattr(os, "register_at_fork"):
+    # Also reset eagerly, in case the child forked while another thread held the lock
+    os.register_at_fork(after_in_child=_POOL._reset)
+
+
+def set_connection_pooling(enabled: bool) -> None:
+    """Turn connection reuse on or off for this process (closes pooled connections when off)."""
+    global _POOL_CONNECTIONS
+    _POOL_CONNECTIONS = enabled
+    if not enabled:
+        _POOL.close_all()
+
+
+def close_connections() -> int:
+    """
+    Close this process's pooled connections (e.g. at shutdown, or before
+    replacing a database file). Returns how many were closed. Threads reopen
+    on their next operation.
+
+    Do not call while other threads are in the middle of a cache operation.
+    """
+    _DICTIONARIES.clear()  # a replaced file may reuse dictionary IDs
+    return _POOL.close_all()
+
+
+# ---------------------------------------------------------------------------
+# Core context manager
+# ---------------------------------------------------------------------------
+
+@contextmanager
+def _sqlite_connection(
+    db_path: Path = _DEFAULT_DB_PATH,
+) -> Generator[sqlite3.Connection, None, None]:
+    """
+    Yield this thread's pooled connection (or, with pooling off, a fresh one)
+    inside an explicit transaction, commit on clean exit, roll back on any
+    exception. Fresh connections are always closed; a pooled connection that
+    cannot be rolled back is discarded instead of being reused.
+
+    Nested use on one thread (a second _sqlite_connection for the same file
+    while the first transaction is open) gets a separate fresh connection.
+    """
+    conn: Optional[sqlite3.Connection] = None
+    pooled = _POOL_CONNECTIONS
+    try:
+        if pooled:
+            conn = _POOL.get(db_path)
+            if conn.in_transaction:
+                pooled = False
+        if not pooled:
+            conn = _open_connection(db_path)
 
         # Begin an explicit transaction. WAL mode allows concurrent readers here.
         conn.execute("BEGIN")
@@ -157,7 +449,11 @@ def _sqlite_connection(
 
     finally:
         if conn is not None:
-            conn.close()
+            if not pooled:
+                conn.close()
+            elif conn.in_transaction:
+                # Interrupted (e.g. KeyboardInterrupt) or the rollback failed
+                _POOL.discard(db_path, conn)
 
 
 # ---------------------------------------------------------------------------
@@ -228,6 +524,12 @@ def init_cache_db(db_path: Path = _DEFAULT_DB_PATH) -> None:
     try:
         conn.execute(f"PRAGMA busy_timeout = {_BUSY_TIMEOUT_MS}")
 
+        # Enable incremental auto-vacuum so the file shrinks over time without
+        # a full VACUUM. Only takes effect before the file is first written,
+        # which switching to WAL does, so it must come first. Databases created
+        # without it are converted once by run_maintenance().
+        conn.execute("PRAGMA auto_vacuum = INCREMENTAL")
+
         # Set WAL mode. This is PERSISTENT — written into the DB file.
         # All future connections (including from worker processes) inherit it.
         # Safe to call repeatedly; SQLite returns the current mode as a result.
@@ -237,20 +539,22 @@ def init_cache_db(db_path: Path = _DEFAULT_DB_PATH) -> None:
 
         conn.execute("PRAGMA synchronous = NORMAL")
 
-        # Enable incremental auto-vacuum so the file shrinks over time without
-        # a full VACUUM. Set at creation; cannot be changed after DB has data.
-        conn.execute("PRAGMA auto_vacuum = INCREMENTAL")
-
         # Schema — idempotent.
         conn.executescript("""
             CREATE TABLE IF NOT EXISTS llm_cache (
                 cache_key   TEXT PRIMARY KEY,   -- uuid5(NAMESPACE_URL, url)
                 url         TEXT NOT NULL,       -- original URL for debugging
-                result_json TEXT NOT NULL,       -- JSON-serialized LLM output
+                result_json TEXT NOT NULL,       -- JSON-serialized LLM output, or
+                                                 -- a compressed BLOB (see codec)
                 created_at  TEXT NOT NULL        -- ISO-8601 timestamp
                     DEFAULT (strftime('%Y-%m-%dT%H:%M:%SZ', 'now')),
                 hit_count   INTEGER NOT NULL DEFAULT 0,
-                last_hit_at TEXT                 -- ISO-8601 timestamp of last read
+                last_hit_at TEXT,                -- ISO-8601 timestamp of last read
+                content_hash TEXT,               -- fingerprint of the analysed inputs
+                last_accessed INTEGER,           -- epoch seconds of last write/read (LRU)
+                expires_at  INTEGER,             -- epoch seconds; NULL = never expires
+                codec       TEXT                 -- NULL = plain JSON; "zlib", "zstd",
+                                                 -- "<codec>:<dict_id>" with a dictionary
             );
 
             CREATE INDEX IF NOT EXISTS idx_llm_cache_url
@@ -258,6 +562,50 @@ def init_cache_db(db_path: Path = _DEFAULT_DB_PATH) -> None:
 
             CREATE INDEX IF NOT EXISTS idx_llm_cache_created
                 ON llm_cache (created_at);
+
+            -- Running totals: l1_hits (memory), hits (SQLite), misses, expired, evicted
+            CREATE TABLE IF NOT EXISTS llm_cache_counters (
+                name  TEXT PRIMARY KEY,
+                value INTEGER NOT NULL DEFAULT 0
+            );
+
+            -- Shared compression dictionaries, trained by compress_entries()
+            CREATE TABLE IF NOT EXISTS llm_cache_dictionaries (
+                dict_id    INTEGER PRIMARY KEY,
+                codec      TEXT NOT NULL,        -- "zlib" or "zstd"
+                data       BLOB NOT NULL,
+                created_at TEXT NOT NULL
+                    DEFAULT (strftime('%Y-%m-%dT%H:%M:%SZ', 'now'))
+            );
+        """)
+
+        # Databases created before content_hash existed: add the column.
+        # NULL content_hash rows still answer lookups that pass no hash.
+        columns = {row[1] for row in conn.execute("PRAGMA table_info(llm_cache)")}
+        if "content_hash" not in columns:
+            conn.execute("ALTER TABLE llm_cache ADD COLUMN content_hash TEXT")
+
+        # Databases created before eviction existed: existing rows never
+        # expire and start out as recent as their last read or write.
+        if "last_accessed" not in columns:
+            conn.execute("ALTER TABLE llm_cache ADD COLUMN last_accessed INTEGER")
+            conn.execute("""
+                UPDATE llm_cache
+                SET last_accessed = CAST(strftime('%s', COALESCE(last_hit_at, created_at)) AS INTEGER)
+            """)
+        if "expires_at" not in columns:
+            conn.execute("ALTER TABLE llm_cache ADD COLUMN expires_at INTEGER")
+
+        # Databases created before compression existed: every row is plain JSON.
+        if "codec" not in columns:
+            conn.execute("ALTER TABLE llm_cache ADD COLUMN codec TEXT")
+
+        conn.executescript("""
+            CREATE INDEX IF NOT EXISTS idx_llm_cache_last_accessed
+                ON llm_cache (last_accessed);
+
+            CREATE INDEX IF NOT EXISTS idx_llm_cache_expires
+                ON llm_cache (expires_at) WHERE expires_at IS NOT NULL;
         """)
 
         conn.commit()
@@ -276,6 +624,377 @@ def _make_cache_key(url: str) -> str:
     return str(uuid.uuid5(uuid.NAMESPACE_URL, url))
 
 
+def _chunks(items: List[str], size: int = _IN_CHUNK_SIZE) -> Generator[List[str], None, None]:
+    """Consecutive slices of at most `size` items (bound-parameter limit)."""
+    for start in range(0, len(items), size):
+        yield items[start:start + size]
+
+
+def _expires_at(ttl_seconds: Optional[float], now: int) -> Optional[int]:
+    """expires_at for a write: None uses _DEFAULT_TTL_SECONDS; 0 means never."""
+    if ttl_seconds is None:
+        ttl_seconds = _DEFAULT_TTL_SECONDS
+    return int(now + ttl_seconds) if ttl_seconds else None
+
+
+# ---------------------------------------------------------------------------
+# Value encoding
+# ---------------------------------------------------------------------------
+
+# (db path, dict_id) -> (codec, dictionary), loaded on first use. Dictionaries
+# are never modified once written, so entries only go stale when the database
+# file is replaced (close_connections() clears them).
+_DICTIONARIES: Dict[Tuple[str, int], Tuple[str, Any]] = {}
+
+
+def set_compression(codec: str) -> str:
+    """
+    Codec for values written by this process from now on: "zlib", "zstd" or
+    "none". Returns the codec in effect (zstd falls back to zlib when the
+    zstandard package is missing). Existing rows keep their codec until
+    compress_entries() rewrites them.
+    """
+    global _CODEC
+    _CODEC = _resolve_codec(codec)
+    return _CODEC
+
+
+def _dictionary(conn: sqlite3.Connection, db_path: Path, dict_id: int) -> Tuple[str, Any]:
+    """(codec, dictionary) for a dict_id, ready to pass to _compress/_decompress."""
+    slot = (str(db_path), dict_id)
+    entry = _DICTIONARIES.get(slot)
+    if entry is None:
+        row = conn.execute(
+            "SELECT codec, data FROM llm_cache_dictionaries WHERE dict_id = ?", (dict_id,)
+        ).fetchone()
+        if row is None:
+            raise ValueError(f"LLM cache dictionary {dict_id} is missing from {db_path}")
+        codec, data = row[0], bytes(row[1])
+        if codec == "zstd":
+            _require_zstandard()
+            data = zstandard.ZstdCompressionDict(data)
+        entry = _DICTIONARIES[slot] = (codec, data)
+    return entry
+
+
+def _require_zstandard() -> None:
+    if zstandard is None:
+        raise RuntimeError("LLM cache holds zstd-compressed values; pip install zstandard to read them")
+
+
+def _compress(codec: str, data: bytes, dictionary: Any = None) -> bytes:
+    if codec == "zstd":
+        return zstandard.ZstdCompressor(level=_ZSTD_LEVEL, dict_data=dictionary).compress(data)
+    if dictionary is None:
+        return zlib.compress(data, _ZLIB_LEVEL)
+    compressor = zlib.compressobj(_ZLIB_LEVEL, zdict=dictionary)
+    return compressor.compress(data) + compressor.flush()
+
+
+def _decompress(codec: str, blob: bytes, dictionary: Any = None) -> bytes:
+    if codec == "zstd":
+        _require_zstandard()
+        return zstandard.ZstdDecompressor(dict_data=dictionary).decompress(blob)
+    if codec != "zlib":
+        raise ValueError(f"Unknown LLM cache codec {codec!r}")
+    if dictionary is None:
+        return zlib.decompress(blob)
+    decompressor = zlib.decompressobj(zdict=dictionary)
+    return decompressor.decompress(blob) + decompressor.flush()
+
+
+def _encoder(
+    conn: sqlite3.Connection,
+    db_path: Path,
+    codec: str,
+) -> Callable[[str], Tuple[Any, Optional[str]]]:
+    """
+    Encoding for the writes of one transaction: JSON text -> (stored value,
+    codec marker). Uses the newest dictionary trained for the codec, if any.
+    Short values, and values that do not shrink, stay plain TEXT.
+    """
+    if codec == "none":
+        return lambda result_json: (result_json, None)
+
+    dict_id = conn.execute(
+        "SELECT MAX(dict_id) FROM llm_cache_dictionaries WHERE codec = ?", (codec,)
+    ).fetchone()[0]
+    dictionary = None if dict_id is None else _dictionary(conn, db_path, dict_id)[1]
+    marker = codec if dict_id is None else f"{codec}:{dict_id}"
+
+    def encode(result_json: str) -> Tuple[Any, Optional[str]]:
+        data = result_json.encode("utf-8")
+        if len(data) < _COMPRESS_MIN_BYTES:
+            return result_json, None
+        blob = _compress(codec, data, dictionary)
+        if len(blob) >= len(data):
+            return result_json, None
+        return blob, marker
+
+    return encode
+
+
+def _decode(conn: sqlite3.Connection, db_path: Path, value: Any, marker: Optional[str]) -> str:
+    """JSON text of a stored value (marker = its codec column)."""
+    if marker is None:
+        return value  # plain TEXT, including every row written before compression
+    codec, _, dict_id = marker.partition(":")
+    dictionary = _dictionary(conn, db_path, int(dict_id))[1] if dict_id else None
+    return _decompress(codec, value, dictionary).decode("utf-8")
+
+
+# ---------------------------------------------------------------------------
+# Buffered counters
+# ---------------------------------------------------------------------------
+
+class _PendingCounts:
+    """
+    Per-process, per-database counts not yet written to llm_cache_counters,
+    the L1 hits per entry not yet applied to hit_count/last_accessed, and the
+    write count that triggers eviction. A forked child starts from zero so the
+    parent's counts are not written twice.
+    """
+
+    def __init__(self):
+        self._reset()
+
+    def _reset(self) -> None:
+        self._pid = os.getpid()
+        self._lock = threading.Lock()
+        self._counts: Dict[str, Dict[str, int]] = {}
+        self._touched: Dict[str, Dict[str, int]] = {}
+        self._writes: Dict[str, int] = {}
+
+    def _check_fork(self) -> None:
+        if self._pid != os.getpid():
+            self._reset()
+
+    def add(self, db_path: Path, touched: Iterable[str] = (), **counts: int) -> bool:
+        """
+        Buffer counts, and L1 hits on the `touched` cache keys; True once
+        _COUNTER_FLUSH_EVERY lookups are pending
+        """
+        self._check_fork()
+        with self._lock:
+            pending = self._counts.setdefault(str(db_path), {})
+            for name, value in counts.items():
+                if value:
+                    pending[name] = pending.get(name, 0) + value
+            if touched:
+                hits = self._touched.setdefault(str(db_path), {})
+                for key in touched:
+                    hits[key] = hits.get(key, 0) + 1
+            return sum(pending.values()) >= _COUNTER_FLUSH_EVERY
+
+    def take(self, db_path: Path) -> Tuple[Dict[str, int], Dict[str, int]]:
+        """Remove and return (counts, L1 hits per cache key) for one database"""
+        self._check_fork()
+        with self._lock:
+            return self._counts.pop(str(db_path), {}), self._touched.pop(str(db_path), {})
+
+    def take_all(self) -> Dict[str, Tuple[Dict[str, int], Dict[str, int]]]:
+        self._check_fork()
+        with self._lock:
+            paths = set(self._counts) | set(self._touched)
+            pending = {
+                path: (self._counts.pop(path, {}), self._touched.pop(path, {}))
+                for path in paths
+            }
+            return pending
+
+    def wrote(self, db_path: Path, rows: int) -> bool:
+        """Count written rows; True every _EVICT_EVERY_WRITES rows"""
+        self._check_fork()
+        with self._lock:
+            key = str(db_path)
+            self._writes[key] = self._writes.get(key, 0) + rows
+            if self._writes[key] < _EVICT_EVERY_WRITES:
+                return False
+            self._writes[key] = 0
+            return True
+
+
+_PENDING = _PendingCounts()
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_PENDING._reset)
+
+
+def _add_counters(conn: sqlite3.Connection, counts: Dict[str, int]) -> None:
+    """Add counts to llm_cache_counters inside the caller's transaction."""
+    conn.executemany(
+        """
+        INSERT INTO llm_cache_counters (name, value) VALUES (?, ?)
+        ON CONFLICT(name) DO UPDATE SET value = value + excluded.value
+        """,
+        [(name, value) for name, value in counts.items() if value],
+    )
+
+
+def _write_counters(db_path: Path, counts: Dict[str, int], touched: Dict[str, int]) -> None:
+    """
+    Add buffered counts to the database and apply the L1 hits to each entry's
+    hit statistics (best-effort: a cache must not fail a run).
+    """
+    if not counts and not touched:
+        return
+
+    def _write():
+        now = int(time.time())
+        with _sqlite_connection(db_path) as conn:
+            _add_counters(conn, counts)
+            conn.executemany(
+                """
+                UPDATE llm_cache
+                SET hit_count     = hit_count + ?,
+                    last_hit_at   = strftime('%Y-%m-%dT%H:%M:%SZ', 'now'),
+                    last_accessed = ?
+                WHERE cache_key = ?
+                """,
+                [(hits, now, key) for key, hits in touched.items()],
+            )
+
+    try:
+        _with_retry(_write)
+    except sqlite3.Error as exc:
+        logger.warning("Could not save LLM cache counters for %s: %s", db_path, exc)
+
+
+def _flush_counters(db_path: Path) -> None:
+    _write_counters(db_path, *_PENDING.take(db_path))
+
+
+@atexit.register
+def _flush_all_counters() -> None:
+    for path, (counts, touched) in _PENDING.take_all().items():
+        if Path(path).exists():  # skip databases removed since (e.g. temporary ones)
+            _write_counters(Path(path), counts, touched)
+
+
+def _record_lookups(
+    db_path: Path,
+    l1_hits: Iterable[str] = (),
+    hits: int = 0,
+    misses: int = 0,
+) -> None:
+    """Count lookups: cache keys answered by L1, SQLite hits, misses"""
+    l1_hits = list(l1_hits)
+    if _PENDING.add(db_path, touched=l1_hits, l1_hits=len(l1_hits), hits=hits, misses=misses):
+        _flush_counters(db_path)
+
+
+# ---------------------------------------------------------------------------
+# In-process L1 tier
+# ---------------------------------------------------------------------------
+
+class _MemoryTier:
+    """
+    Bounded LRU of recently read or written entries, in front of SQLite.
+
+    Holds the JSON text (each hit deserializes a fresh copy, so callers can
+    mutate what they get) with its content_hash and expires_at, keyed by
+    (database, cache_key). Per process: a forked child starts empty.
+    """
+
+    def __init__(self, max_entries: int):
+        self.max_entries = max_entries
+        self._reset()
+
+    def _reset(self) -> None:
+        self._pid = os.getpid()
+        self._lock = threading.Lock()
+        # (db path, cache_key) -> (content_hash, expires_at, result_json), oldest first
+        self._entries: collections.OrderedDict = collections.OrderedDict()
+
+    def _check_fork(self) -> None:
+        if self._pid != os.getpid():
+            self._reset()
+
+    def get(self, db_path: Path, key: str, content_hash: Optional[str], now: int) -> Optional[str]:
+        """The entry's JSON text, or None if absent, expired or cached under another hash"""
+        if not self.max_entries:
+            return None
+        self._check_fork()
+
+        slot = (str(db_path), key)
+        with self._lock:
+            entry = self._entries.get(slot)
+            if entry is None:
+                return None
+
+            stored_hash, expires_at, result_json = entry
+            if expires_at is not None and expires_at <= now:
+                del self._entries[slot]
+                return None
+            if content_hash is not None and stored_hash != content_hash:
+                return None  # SQLite may hold a newer result; let L2 decide
+
+            self._entries.move_to_end(slot)
+            return result_json
+
+    def put(
+        self,
+        db_path: Path,
+        key: str,
+        content_hash: Optional[str],
+        expires_at: Optional[int],
+        result_json: str,
+    ) -> None:
+        if not self.max_entries:
+            return
+        self._check_fork()
+
+        slot = (str(db_path), key)
+        with self._lock:
+            self._entries[slot] = (content_hash, expires_at, result_json)
+            self._entries.move_to_end(slot)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def invalidate(self, db_path: Path, key: str) -> None:
+        self.invalidate_many(db_path, (key,))
+
+    def invalidate_many(self, db_path: Path, keys: Iterable[str]) -> None:
+        self._check_fork()
+        path = str(db_path)
+        with self._lock:
+            for key in keys:
+                self._entries.pop((path, key), None)
+
+    def resize(self, max_entries: int) -> None:
+        self._check_fork()
+        with self._lock:
+            self.max_entries = max_entries
+            while len(self._entries) > max_entries:
+                self._entries.popitem(last=False)
+
+    def __len__(self) -> int:
+        self._check_fork()
+        with self._lock:
+            return len(self._entries)
+
+
+_L1 = _MemoryTier(_L1_MAX_ENTRIES)
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_L1._reset)
+
+
+def set_l1_cache_size(max_entries: int) -> None:
+    """Resize this process's in-memory L1 tier; 0 disables (and empties) it."""
+    _L1.resize(max(0, max_entries))
+
+
+def _record_writes(db_path: Path, rows: int) -> None:
+    """Run an eviction pass every _EVICT_EVERY_WRITES writes (best-effort)."""
+    if not _PENDING.wrote(db_path, rows):
+        return
+    try:
+        evict_entries(db_path)
+    except sqlite3.Error as exc:
+        logger.warning("LLM cache eviction failed for %s: %s", db_path, exc)
+
+
 # ---------------------------------------------------------------------------
 # Public API
 # ---------------------------------------------------------------------------
@@ -283,47 +1002,78 @@ def _make_cache_key(url: str) -> str:
 def get_cached_result(
     url: str,
     db_path: Path = _DEFAULT_DB_PATH,
+    content_hash: Optional[str] = None,
 ) -> Optional[Any]:
     """
     Look up a cached LLM result by URL.
 
     Returns the deserialized Python object on a cache hit, or None on a miss.
-    Updates hit_count and last_hit_at in the same transaction.
+    Tries the in-process L1 tier first; a SQLite hit updates hit_count and
+    last_hit_at in the same transaction and is copied into L1.
+
+    If content_hash is given, a row cached under a different hash (the post or
+    the prompt changed since) counts as a miss. So does an expired row.
 
     Called from the main pipeline process before dispatching to the LLM.
     """
     key = _make_cache_key(url)
+    now = int(time.time())
+
+    result_json = _L1.get(db_path, key, content_hash, now)
+    if result_json is not None:
+        _record_lookups(db_path, l1_hits=[key])
+        return json.loads(result_json)
 
     def _get():
         with _sqlite_connection(db_path) as conn:
             row = conn.execute(
-                "SELECT result_json FROM llm_cache WHERE cache_key = ?",
-                (key,),
+                """
+                SELECT result_json, codec, content_hash, expires_at FROM llm_cache
+                WHERE cache_key = ? AND (expires_at IS NULL OR expires_at > ?)
+                """,
+                (key, now),
             ).fetchone()
 
             if row is None:
                 return None
 
-            # Update hit statistics (best-effort; failure here is not critical).
+            if content_hash is not None and row["content_hash"] != content_hash:
+                return None  # stale: inputs changed since this was cached
+
+            # Update hit statistics and LRU position (one write per hit, as before).
             conn.execute(
                 """
                 UPDATE llm_cache
-                SET hit_count   = hit_count + 1,
-                    last_hit_at = strftime('%Y-%m-%dT%H:%M:%SZ', 'now')
+                SET hit_count     = hit_count + 1,
+                    last_hit_at   = strftime('%Y-%m-%dT%H:%M:%SZ', 'now'),
+                    last_accessed = ?
                 WHERE cache_key = ?
                 """,
-                (key,),
+                (now, key),
+            )
+
+            return (
+                _decode(conn, db_path, row["result_json"], row["codec"]),
+                row["content_hash"],
+                row["expires_at"],
             )
 
-            return json.loads(row["result_json"])
+    hit = _with_retry(_get)
+    _record_lookups(db_path, hits=int(hit is not None), misses=int(hit is None))
+    if hit is None:
+        return None
 
-    return _with_retry(_get)
+    result_json, stored_hash, expires_at = hit
+    _L1.put(db_path, key, stored_hash, expires_at, result_json)
+    return json.loads(result_json)
 
 
 def cache_result(
     url: str,
     result: Any,
     db_path: Path = _DEFAULT_DB_PATH,
+    content_hash: Optional[str] = None,
+    ttl_seconds: Optional[float] = None,
 ) -> None:
     """
     Store an LLM analysis result for a URL.
@@ -337,24 +1087,173 @@ def cache_result(
         url:    The source URL that was analysed.
         result: Any JSON-serializable Python object (dict, list, str, etc.).
         db_path: Path to the SQLite database file.
+        content_hash: Optional fingerprint of the inputs behind this result.
+        ttl_seconds: Lifetime of the entry; None uses the default
+            (LLM_CACHE_TTL_DAYS), 0 means it never expires.
     """
     key = _make_cache_key(url)
     result_json = json.dumps(result, ensure_ascii=False)
+    now = int(time.time())
+    expires_at = _expires_at(ttl_seconds, now)
 
     def _set():
         with _sqlite_connection(db_path) as conn:
+            value, codec = _encoder(conn, db_path, _CODEC)(result_json)
             conn.execute(
                 """
                 INSERT OR REPLACE INTO llm_cache
-                    (cache_key, url, result_json, created_at, hit_count, last_hit_at)
+                    (cache_key, url, result_json, codec, created_at, hit_count, last_hit_at,
+                     content_hash, last_accessed, expires_at)
                 VALUES
-                    (?, ?, ?, strftime('%Y-%m-%dT%H:%M:%SZ', 'now'), 0, NULL)
+                    (?, ?, ?, ?, strftime('%Y-%m-%dT%H:%M:%SZ', 'now'), 0, NULL, ?, ?, ?)
                 """,
-                (key, url, result_json),
+                (key, url, value, codec, content_hash, now, expires_at),
             )
 
     _with_retry(_set)
+    _L1.put(db_path, key, content_hash, expires_at, result_json)
     logger.debug("Cached result for: %s (key=%s)", url, key)
+    _record_writes(db_path, 1)
+
+
+def get_cached_results(
+    urls: Iterable[str],
+    db_path: Path = _DEFAULT_DB_PATH,
+    content_hashes: Optional[Mapping[str, Optional[str]]] = None,
+) -> Dict[str, Any]:
+    """
+    Look up many URLs at once: one SELECT ... WHERE cache_key IN (...) per chunk
+    of _IN_CHUNK_SIZE keys, all inside a single transaction.
+
+    Returns {url: deserialized result} for the hits only; misses (including
+    expired rows) are absent. Keys found in the L1 tier are not queried. Hit
+    statistics and LRU positions are updated for every hit, and SQLite hits
+    are copied into L1, as in get_cached_result().
+
+    Args:
+        urls: URLs to look up (duplicates are looked up once).
+        db_path: Path to the SQLite database file.
+        content_hashes: Optional {url: expected content_hash}. A row cached
+            under a different hash is a miss; URLs without an entry (or with
+            None) accept any row, like get_cached_result(content_hash=None).
+    """
+    keys = {_make_cache_key(url): url for url in urls}
+    if not keys:
+        return {}
+    content_hashes = content_hashes or {}
+    now = int(time.time())
+
+    results: Dict[str, Any] = {}
+    l1_keys: List[str] = []
+    for key, url in keys.items():
+        result_json = _L1.get(db_path, key, content_hashes.get(url), now)
+        if result_json is not None:
+            results[url] = json.loads(result_json)
+            l1_keys.append(key)
+    l2_keys = [key for key in keys if keys[key] not in results]
+
+    def _get_many():
+        rows_hit = []
+        with _sqlite_connection(db_path) as conn:
+            for chunk in _chunks(l2_keys):
+                placeholders = ",".join("?" * len(chunk))
+                rows = conn.execute(
+                    f"SELECT cache_key, result_json, codec, content_hash, expires_at FROM llm_cache "
+                    f"WHERE cache_key IN ({placeholders}) "
+                    f"AND (expires_at IS NULL OR expires_at > ?)",
+                    [*chunk, now],
+                ).fetchall()
+
+                hit_keys = []
+                for row in rows:
+                    expected = content_hashes.get(keys[row["cache_key"]])
+                    if expected is not None and row["content_hash"] != expected:
+                        continue  # stale: inputs changed since this was cached
+                    rows_hit.append((
+                        row["cache_key"],
+                        _decode(conn, db_path, row["result_json"], row["codec"]),
+                        row["content_hash"],
+                        row["expires_at"],
+                    ))
+                    hit_keys.append(row["cache_key"])
+
+                if hit_keys:
+                    conn.execute(
+                        f"""
+                        UPDATE llm_cache
+                        SET hit_count     = hit_count + 1,
+                            last_hit_at   = strftime('%Y-%m-%dT%H:%M:%SZ', 'now'),
+                            last_accessed = ?
+                        WHERE cache_key IN ({",".join("?" * len(hit_keys))})
+                        """,
+                        [now, *hit_keys],
+                    )
+        return rows_hit
+
+    rows_hit = _with_retry(_get_many) if l2_keys else []
+    for key, result_json, stored_hash, expires_at in rows_hit:
+        _L1.put(db_path, key, stored_hash, expires_at, result_json)
+        results[keys[key]] = json.loads(result_json)
+
+    _record_lookups(db_path, l1_hits=l1_keys, hits=len(rows_hit), misses=len(keys) - len(results))
+    return results
+
+
+def cache_results(
+    results: Mapping[str, Any],
+    db_path: Path = _DEFAULT_DB_PATH,
+    content_hashes: Optional[Mapping[str, Optional[str]]] = None,
+    ttl_seconds: Optional[float] = None,
+) -> int:
+    """
+    Store many LLM analysis results in one transaction (a single executemany).
+
+    Same semantics per URL as cache_result(). Returns the number of rows written.
+
+    Args:
+        results: {url: JSON-serializable result}.
+        db_path: Path to the SQLite database file.
+        content_hashes: Optional {url: fingerprint of the inputs behind its result}.
+        ttl_seconds: Lifetime of every entry, as in cache_result().
+    """
+    content_hashes = content_hashes or {}
+    rows = [
+        (
+            _make_cache_key(url),
+            url,
+            json.dumps(result, ensure_ascii=False),
+            content_hashes.get(url),
+        )
+        for url, result in results.items()
+    ]
+    if not rows:
+        return 0
+    now = int(time.time())
+    expires_at = _expires_at(ttl_seconds, now)
+
+    def _set_many():
+        with _sqlite_connection(db_path) as conn:
+            encode = _encoder(conn, db_path, _CODEC)
+            conn.executemany(
+                """
+                INSERT OR REPLACE INTO llm_cache
+                    (cache_key, url, result_json, codec, created_at, hit_count, last_hit_at,
+                     content_hash, last_accessed, expires_at)
+                VALUES
+                    (?, ?, ?, ?, strftime('%Y-%m-%dT%H:%M:%SZ', 'now'), 0, NULL, ?, ?, ?)
+                """,
+                [
+                    (key, url, *encode(result_json), content_hash, now, expires_at)
+                    for key, url, result_json, content_hash in rows
+                ],
+            )
+
+    _with_retry(_set_many)
+    for key, _, result_json, content_hash in rows:
+        _L1.put(db_path, key, content_hash, expires_at, result_json)
+    logger.debug("Cached %d results", len(rows))
+    _record_writes(db_path, len(rows))
+    return len(rows)
 
 
 def delete_cached_result(
@@ -362,7 +1261,8 @@ def delete_cached_result(
     db_path: Path = _DEFAULT_DB_PATH,
 ) -> bool:
     """
-    Remove a cached result by URL. Returns True if a row was deleted.
+    Remove a cached result by URL (from SQLite and this process's L1 tier).
+    Returns True if a row was deleted.
     Useful when re-running analysis on a URL that has stale data.
     """
     key = _make_cache_key(url)
@@ -374,7 +1274,9 @@ def delete_cached_result(
             )
             return cursor.rowcount > 0
 
-    return _with_retry(_delete)
+    deleted = _with_retry(_delete)
+    _L1.invalidate(db_path, key)  # after the delete, so a concurrent read cannot re-add it
+    return deleted
 
 
 def cache_stats(db_path: Path = _DEFAULT_DB_PATH) -> dict:
@@ -384,12 +1286,24 @@ def cache_stats(db_path: Path = _DEFAULT_DB_PATH) -> dict:
     Example output:
         {
             "total_entries": 1543,
-            "total_hits": 87234,
+            "total_hits": 87234,          # hits on the current entries
             "oldest_entry": "2026-01-15T08:00:00Z",
             "newest_entry": "2026-02-26T12:34:56Z",
-            "db_size_bytes": 4194304,
+            "db_size_bytes": 4194304,     # file size
+            "data_bytes": 3801088,        # pages in use (tables + indexes)
+            "hits": 90112,                # all lookups since counters began
+            "l1_hits": 61020,             # answered from memory
+            "l2_hits": 29092,             # answered from SQLite
+            "misses": 2210,
+            "hit_rate": 0.976,
+            "l1_entries": 1024,           # entries in this process's L1 tier
+            "expired": 310,               # rows removed by TTL
+            "evicted": 1200,              # rows removed by the size bounds (LRU)
+            "compressed_entries": 1490,   # rows stored as a compressed BLOB
         }
     """
+    _flush_counters(db_path)
+
     def _stats():
         with _sqlite_connection(db_path) as conn:
             row = conn.execute("""
@@ -397,23 +1311,131 @@ def cache_stats(db_path: Path = _DEFAULT_DB_PATH) -> dict:
                     COUNT(*)          AS total_entries,
                     SUM(hit_count)    AS total_hits,
                     MIN(created_at)   AS oldest_entry,
-                    MAX(created_at)   AS newest_entry
+                    MAX(created_at)   AS newest_entry,
+                    COUNT(codec)      AS compressed_entries
                 FROM llm_cache
             """).fetchone()
+            counters = dict(conn.execute("SELECT name, value FROM llm_cache_counters").fetchall())
+            l1_hits, l2_hits = counters.get("l1_hits", 0), counters.get("hits", 0)
+            hits, misses = l1_hits + l2_hits, counters.get("misses", 0)
             return {
                 "total_entries": row["total_entries"] or 0,
                 "total_hits":    row["total_hits"] or 0,
                 "oldest_entry":  row["oldest_entry"],
                 "newest_entry":  row["newest_entry"],
                 "db_size_bytes": db_path.stat().st_size if db_path.exists() else 0,
+                "data_bytes":    _used_bytes(conn),
+                "hits":          hits,
+                "l1_hits":       l1_hits,
+                "l2_hits":       l2_hits,
+                "misses":        misses,
+                "hit_rate":      hits / (hits + misses) if hits + misses else 0.0,
+                "l1_entries":    len(_L1),
+                "expired":       counters.get("expired", 0),
+                "evicted":       counters.get("evicted", 0),
+                "compressed_entries": row["compressed_entries"] or 0,
             }
 
     return _with_retry(_stats)
 
 
-def run_maintenance(db_path: Path = _DEFAULT_DB_PATH) -> None:
+def _used_bytes(conn: sqlite3.Connection) -> int:
+    """Bytes in pages holding data or indexes (the file minus its free pages)."""
+    page_size = conn.execute("PRAGMA page_size").fetchone()[0]
+    page_count = conn.execute("PRAGMA page_count").fetchone()[0]
+    free_pages = conn.execute("PRAGMA freelist_count").fetchone()[0]
+    return (page_count - free_pages) * page_size
+
+
+def _delete_keys(conn: sqlite3.Connection, where: str, params: tuple) -> List[str]:
+    """Delete the rows selected by `where`; returns their cache keys."""
+    keys = [
+        row[0] for row in conn.execute(f"SELECT cache_key FROM llm_cache {where}", params)
+    ]
+    conn.executemany("DELETE FROM llm_cache WHERE cache_key = ?", [(key,) for key in keys])
+    return keys
+
+
+def _delete_lru(conn: sqlite3.Connection, count: int) -> List[str]:
+    """Delete the `count` least recently used rows; returns their cache keys."""
+    return _delete_keys(conn, "ORDER BY last_accessed LIMIT ?", (count,))
+
+
+def evict_entries(
+    db_path: Path = _DEFAULT_DB_PATH,
+    max_rows: Optional[int] = None,
+    max_bytes: Optional[int] = None,
+) -> Dict[str, int]:
+    """
+    Delete expired entries, then least-recently-used entries until the table
+    holds at most max_rows rows and max_bytes bytes of used pages.
+
+    Runs automatically every _EVICT_EVERY_WRITES writes per process and from
+    run_maintenance(). Freed pages are reused by later writes; the incremental
+    vacuum in run_maintenance() returns them to the OS. Deleted entries are
+    dropped from this process's L1 tier as well.
+
+    Args:
+        db_path: Path to the SQLite database file.
+        max_rows: Row bound; None uses LLM_CACHE_MAX_ROWS, 0 means unbounded.
+        max_bytes: Size bound; None uses LLM_CACHE_MAX_MB, 0 means unbounded.
+
+    Returns:
+        {"expired": rows past their TTL, "evicted": rows removed by the bounds}
+    """
+    max_rows = _MAX_ROWS if max_rows is None else max_rows
+    max_bytes = _MAX_BYTES if max_bytes is None else max_bytes
+
+    deleted_keys: List[str] = []
+
+    def _evict():
+        report = {"expired": 0, "evicted": 0}
+        deleted_keys.clear()  # a retried attempt starts over
+        with _sqlite_connection(db_path) as conn:
+            expired = _delete_keys(conn, "WHERE expires_at <= ?", (int(time.time()),))
+            report["expired"] = len(expired)
+            deleted_keys.extend(expired)
+
+            rows = conn.execute("SELECT COUNT(*) FROM llm_cache").fetchone()[0]
+            if max_rows and rows > max_rows:
+                evicted = _delete_lru(conn, rows - max_rows)
+                report["evicted"] += len(evicted)
+                deleted_keys.extend(evicted)
+                rows = max_rows
+
+            for _ in range(_MAX_EVICTION_ROUNDS if max_bytes else 0):
+                used = _used_bytes(conn)
+                if used <= max_bytes or rows == 0:
+                    break
+                # Delete the estimated excess (average bytes per row) in one go
+                excess = math.ceil((used - max_bytes) / (used / rows))
+                evicted = _delete_lru(conn, max(1, excess))
+                report["evicted"] += len(evicted)
+                deleted_keys.extend(evicted)
+                rows -= len(evicted)
+
+            _add_counters(conn, report)
+        return report
+
+    report = _with_retry(_evict)
+    # After the delete, so a concurrent read cannot re-add them
+    _L1.invalidate_many(db_path, deleted_keys)
+    if report["expired"] or report["evicted"]:
+        logger.info(
+            "LLM cache eviction: %d expired, %d evicted (%s)",
+            report["expired"], report["evicted"], db_path,
+        )
+    return report
+
+
+def run_maintenance(
+    db_path: Path = _DEFAULT_DB_PATH,
+    max_rows: Optional[int] = None,
+    max_bytes: Optional[int] = None,
+) -> Dict[str, int]:
     """
-    Perform routine maintenance: WAL checkpoint and incremental vacuum.
+    Perform routine maintenance: eviction (see evict_entries), WAL checkpoint
+    and incremental vacuum. Returns the eviction report.
 
     Schedule periodically (e.g. once per day via systemd timer or at daemon
     startup). The WAL file can grow unboundedly without checkpointing; this
@@ -423,35 +1445,301 @@ def run_maintenance(db_path: Path = _DEFAULT_DB_PATH) -> None:
     Do NOT call this from worker processes — call from the main process only
     when no concurrent writes are expected (e.g., at startup or shutdown).
     """
+    _flush_counters(db_path)
+    report = evict_entries(db_path, max_rows=max_rows, max_bytes=max_bytes)
+
     conn = sqlite3.connect(str(db_path), timeout=_CONNECT_TIMEOUT_SECONDS)
     try:
         conn.execute(f"PRAGMA busy_timeout = {_BUSY_TIMEOUT_MS}")
-        # Checkpoint: flush WAL into the main DB file, then reset WAL to zero.
+        # Databases created without incremental auto-vacuum: convert once. This
+        # needs a full VACUUM (one file rewrite); afterwards the file shrinks
+        # incrementally.
+        if conn.execute("PRAGMA auto_vacuum").fetchone()[0] != 2:  # 2 = INCREMENTAL
+            conn.execute("PRAGMA auto_vacuum = INCREMENTAL")
+            conn.execute("VACUUM")
+            logger.info("LLM cache converted to incremental auto-vacuum: %s", db_path)
+        # Reclaim freed pages (requires auto_vacuum = INCREMENTAL). The pragma
+        # frees one page per step and execute() steps once; executescript()
+        # runs it to completion.
+        conn.executescript("PRAGMA incremental_vacuum;")
+        # Checkpoint: flush WAL (including the vacuum) into the main DB file,
+        # then reset WAL to zero.
         conn.execute("PRAGMA wal_checkpoint(TRUNCATE)")
-        # Reclaim freed pages (requires auto_vacuum = INCREMENTAL).
-        conn.execute("PRAGMA incremental_vacuum")
-        conn.commit()
         logger.info("LLM cache maintenance complete: %s", db_path)
     finally:
         conn.close()
 
+    return report
+
+
+def _train_dictionary(codec: str, samples: List[bytes]) -> bytes:
+    """A shared dictionary for codec, from sample values (most recent last)."""
+    if codec == "zstd":
+        return zstandard.train_dictionary(_DICT_SIZE, samples).as_bytes()
+    # zlib has no trainer: its preset dictionary is text the values are likely
+    # to repeat, the most likely last. Recent values are exactly that.
+    return b"".join(samples)[-_DICT_SIZE:]
+
+
+def _stored_bytes(value: Any) -> int:
+    return len(value) if isinstance(value, bytes) else len(value.encode("utf-8"))
+
+
+def _checkpointed_size(db_path: Path) -> int:
+    """Size of the database file once the WAL has been checkpointed into it."""
+    if not db_path.exists():
+        return 0
+    conn = sqlite3.connect(str(db_path), timeout=_CONNECT_TIMEOUT_SECONDS)
+    try:
+        conn.execute(f"PRAGMA busy_timeout = {_BUSY_TIMEOUT_MS}")
+        conn.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+    finally:
+        conn.close()
+    return db_path.stat().st_size
+
+
+def compress_entries(
+    db_path: Path = _DEFAULT_DB_PATH,
+    codec: Optional[str] = None,
+    train_dictionary: bool = False,
+) -> Dict[str, Any]:
+    """
+    Rewrite every stored value with one codec and report the bytes saved.
+
+    Rows are rewritten _REWRITE_PAGE_SIZE at a time, one transaction each, so
+    other processes can keep using the cache. Dictionaries that no row uses
+    any more (except the newest per codec) are deleted, then run_maintenance()
+    and, if rows were rewritten, a full VACUUM return the freed space to the
+    OS. Like run_maintenance(), call from the main process.
+
+    Args:
+        db_path: Path to the SQLite database file.
+        codec: "zlib", "zstd", or "none" to store plain TEXT again; None uses
+            the configured codec (LLM_CACHE_CODEC / set_compression()).
+        train_dictionary: First train a shared dictionary for the codec on the
+            _DICT_SAMPLES most recently used values. Every later write with
+            that codec, in any process, uses it.
+
+    Returns:
+        {"codec", "dictionary_id" (None unless one was trained), "entries",
+         "rewritten", "json_bytes" (values uncompressed), "stored_bytes_before",
+         "stored_bytes_after", "file_bytes_before", "file_bytes_after"}
+    """
+    codec = _resolve_codec(codec or _CODEC)
+    report: Dict[str, Any] = {
+        "codec": codec,
+        "dictionary_id": None,
+        "entries": 0,
+        "rewritten": 0,
+        "json_bytes": 0,
+        "stored_bytes_before": 0,
+        "stored_bytes_after": 0,
+        # Checkpointed first: pages still in the -wal file are part of the cache
+        "file_bytes_before": _checkpointed_size(db_path),
+    }
+
+    def _add_dictionary() -> Optional[int]:
+        with _sqlite_connection(db_path) as conn:
+            rows = conn.execute(
+                "SELECT result_json, codec FROM llm_cache ORDER BY last_accessed DESC LIMIT ?",
+                (_DICT_SAMPLES,),
+            ).fetchall()
+            if len(rows) < _DICT_MIN_SAMPLES:
+                logger.warning(
+                    "Not training an LLM cache dictionary: %d entries, need %d",
+                    len(rows), _DICT_MIN_SAMPLES,
+                )
+                return None
+            samples = [
+                _decode(conn, db_path, value, marker).encode("utf-8")
+                for value, marker in reversed(rows)
+            ]
+            data = _train_dictionary(codec, samples)
+            return conn.execute(
+                "INSERT INTO llm_cache_dictionaries (codec, data) VALUES (?, ?)", (codec, data)
+            ).lastrowid
+
+    def _rewrite_page(after: str) -> Tuple[Optional[str], Dict[str, int]]:
+        counts = dict.fromkeys(
+            ("entries", "rewritten", "json_bytes", "stored_bytes_before", "stored_bytes_after"), 0
+        )
+        with _sqlite_connection(db_path) as conn:
+            rows = conn.execute(
+                """
+                SELECT cache_key, result_json, codec FROM llm_cache
+                WHERE cache_key > ? ORDER BY cache_key LIMIT ?
+                """,
+                (after, _REWRITE_PAGE_SIZE),
+            ).fetchall()
+            if not rows:
+                return None, counts
+
+            encode = _encoder(conn, db_path, codec)
+            updates = []
+            for key, value, marker in rows:
+                result_json = _decode(conn, db_path, value, marker)
+                new_value, new_marker = encode(result_json)
+                counts["entries"] += 1
+                counts["json_bytes"] += len(result_json.encode("utf-8"))
+                counts["stored_bytes_before"] += _stored_bytes(value)
+                counts["stored_bytes_after"] += _stored_bytes(new_value)
+                if (new_value, new_marker) != (value, marker):
+                    updates.append((new_value, new_marker, key))
+
+            conn.executemany(
+                "UPDATE llm_cache SET result_json = ?, codec = ? WHERE cache_key = ?", updates
+            )
+            counts["rewritten"] = len(updates)
+            return rows[-1]["cache_key"], counts
+
+    def _drop_unused_dictionaries() -> int:
+        with _sqlite_connection(db_path) as conn:
+            return conn.execute(
+                """
+                DELETE FROM llm_cache_dictionaries
+                WHERE dict_id NOT IN (
+                    SELECT MAX(dict_id) FROM llm_cache_dictionaries GROUP BY codec
+                )
+                AND NOT EXISTS (
+                    SELECT 1 FROM llm_cache
+                    WHERE llm_cache.codec = llm_cache_dictionaries.codec || ':' || llm_cache_dictionaries.dict_id
+                )
+                """
+            ).rowcount
+
+    if train_dictionary and codec != "none":
+        report["dictionary_id"] = _with_retry(_add_dictionary)
+
+    last_key: Optional[str] = ""
+    while True:
+        last_key, counts = _with_retry(_rewrite_page, last_key)
+        if last_key is None:
+            break
+        for name, value in counts.items():
+            report[name] += value
+        logger.info("LLM cache compression: %d entries scanned, %d rewritten",
+                    report["entries"], report["rewritten"])
+
+    dropped = _with_retry(_drop_unused_dictionaries)
+    if dropped:
+        logger.info("Deleted %d unused LLM cache dictionaries", dropped)
+
+    run_maintenance(db_path)
+    if report["rewritten"]:
+        # Shrunken rows leave part-empty B-tree pages behind, which the
+        # incremental vacuum cannot return; one full VACUUM repacks them.
+        conn = sqlite3.connect(str(db_path), timeout=_CONNECT_TIMEOUT_SECONDS)
+        try:
+            conn.execute(f"PRAGMA busy_timeout = {_BUSY_TIMEOUT_MS}")
+            conn.execute("VACUUM")
+            conn.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+        finally:
+            conn.close()
+
+    report["file_bytes_after"] = _checkpointed_size(db_path)
+    return report
+
 
 # ---------------------------------------------------------------------------
 # Module-level convenience: allow `python llm_cache.py` for quick inspection
 # ---------------------------------------------------------------------------
 
+def _bench(lookups: int) -> None:
+    """Lookups/sec: one connection per operation, pooled connections, pooled + L1."""
+    import random
+    import tempfile
+
+    pooling, l1_size = _POOL_CONNECTIONS, _L1.max_entries
+    set_l1_cache_size(0)
+    with tempfile.TemporaryDirectory() as tmp:
+        bench_db = Path(tmp) / "bench_cache.db"
+        init_cache_db(bench_db)
+
+        # Each URL is looked up ~4 times, as in one pipeline run (dedup
+        # passes, retries, re-analysis after a storage failure)
+        entries = max(1, min(lookups // 4, 5000))
+        urls = [f"https://example.com/post/{i}" for i in range(entries)]
+        sample = {"score": 7, "insights": ["repeatable niche"] * 5, "risks": ["competition"] * 3}
+        for url in urls:
+            cache_result(url, sample, bench_db, content_hash="bench")
+
+        keys = [random.choice(urls) for _ in range(lookups)]
+        print(f"Benchmark: {lookups:,} lookups over {entries:,} entries")
+
+        rates = {}
+        modes = (("per-operation", False, 0), ("pooled", True, 0), ("pooled + L1", True, l1_size))
+        for label, enabled, l1_entries in modes:
+            set_connection_pooling(enabled)
+            set_l1_cache_size(l1_entries)
+            start = time.perf_counter()
+            for url in keys:
+                get_cached_result(url, bench_db, content_hash="bench")
+            elapsed = time.perf_counter() - start
+            rates[label] = lookups / elapsed
+            print(f"  {label:<14} {rates[label]:>10,.0f} lookups/s  ({elapsed:.2f} s)")
+
+        _flush_counters(bench_db)
+        close_connections()
+        print(f"  speedup        {rates['pooled'] / rates['per-operation']:>10.1f}x pooled, "
+              f"{rates['pooled + L1'] / rates['per-operation']:.1f}x with L1 "
+              f"({l1_size:,} entries)")
+
+    set_connection_pooling(pooling)
+    set_l1_cache_size(l1_size)
+
+
 if __name__ == "__main__":
-    import sys
+    import argparse
 
     logging.basicConfig(level=logging.INFO, format="%(levelname)s %(message)s")
 
-    db_path = Path(sys.argv[1]) if len(sys.argv) > 1 else _DEFAULT_DB_PATH
+    parser = argparse.ArgumentParser(description="Inspect or benchmark the LLM cache")
+    parser.add_argument("db_path", nargs="?", type=Path, default=_DEFAULT_DB_PATH,
+                        help=f"Cache database (default: {_DEFAULT_DB_PATH})")
+    parser.add_argument("--bench", type=int, metavar="N", nargs="?", const=10_000,
+                        help="Time N lookups (default 10000) on a temporary database, "
+                             "pooled vs one connection per operation")
+    parser.add_argument("--compress", metavar="CODEC", nargs="?", const="",
+                        help="Rewrite every value with CODEC (zlib, zstd or none; default "
+                             "LLM_CACHE_CODEC) and report the bytes saved")
+    parser.add_argument("--train-dict", action="store_true",
+                        help="With --compress: first train a shared dictionary on recent values")
+    args = parser.parse_args()
+
+    if args.bench:
+        logging.getLogger().setLevel(logging.WARNING)
+        _bench(args.bench)
+        raise SystemExit(0)
+
+    db_path = args.db_path
     print(f"Cache DB: {db_path}")
 
     init_cache_db(db_path)
+
+    if args.compress is not None:
+        report = compress_entries(db_path, args.compress or None, train_dictionary=args.train_dict)
+        saved = report["stored_bytes_before"] - report["stored_bytes_after"]
+        print(f"Codec   : {report['codec']}"
+              + (f" (dictionary {report['dictionary_id']})" if report["dictionary_id"] else ""))
+        print(f"Entries : {report['entries']:,} ({report['rewritten']:,} rewritten)")
+        print(f"Values  : {report['stored_bytes_before'] / 1024:.1f} KB -> "
+              f"{report['stored_bytes_after'] / 1024:.1f} KB stored, "
+              f"{report['json_bytes'] / 1024:.1f} KB as JSON "
+              f"(saved {saved / 1024:.1f} KB"
+              + (f", {saved / report['stored_bytes_before']:.0%})" if report["stored_bytes_before"] else ")"))
+        print(f"DB file : {report['file_bytes_before'] / 1024:.1f} KB -> "
+              f"{report['file_bytes_after'] / 1024:.1f} KB")
+        raise SystemExit(0)
     stats = cache_stats(db_path)
     print(f"Entries : {stats['total_entries']:,}")
     print(f"Hits    : {stats['total_hits']:,}")
     print(f"Oldest  : {stats['oldest_entry']}")
     print(f"Newest  : {stats['newest_entry']}")
-    print(f"DB size : {stats['db_size_bytes'] / 1024:.1f} KB")
+    print(f"DB size : {stats['db_size_bytes'] / 1024:.1f} KB "
+          f"({stats['data_bytes'] / 1024:.1f} KB in use)")
+    print(f"Lookups : {stats['hits']:,} hits ({stats['l1_hits']:,} memory, "
+          f"{stats['l2_hits']:,} SQLite) / {stats['misses']:,} misses "
+          f"({stats['hit_rate']:.1%} hit rate)")
+    print(f"Removed : {stats['expired']:,} expired, {stats['evicted']:,} evicted")
+    print(f"Codec   : {stats['compressed_entries']:,} entries compressed "
+          f"(new values: {_CODEC})")
@@ -117,7 +117,7 @@ def migrate_data():
                 if batch_embeddings:
                     add_kwargs['embeddings'] = batch_embeddings
 
-                xeon_coll.add(**add_kwargs)
+                xeon_coll.upsert(**add_kwargs)
                 print(f"       Uploaded batch {i//batch_size + 1} ({end_idx}/{len(all_data['ids'])})")
 
             print(f"     ✅ Migration complete for '{coll_name}'")
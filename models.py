@@ -9,6 +9,8 @@ from typing import List, Optional, Dict, Any
 from enum import Enum
 from pydantic import BaseModel, Field, HttpUrl, validator, field_validator
 
+from parse_investment import numeric_metadata
+
 
 class OpportunitySource(str, Enum):
     """Source platforms for opportunities"""
@@ -216,6 +218,15 @@ class Opportunity(BaseModel):
                 "analyzed_at": self.analysis.analyzed_at.isoformat(),
             })
 
+        # Numeric investment/revenue/time fields for filtering and scoring
+        meta.update(numeric_metadata(
+            initial_investment=self.analysis.initial_investment if self.analysis else None,
+            time_to_market=self.analysis.time_to_market if self.analysis else None,
+            revenue_claim=self.metadata.revenue_claim,
+            revenue_amount=self.metadata.revenue_amount,
+            revenue_period=self.metadata.revenue_period,
+        ))
+
         return meta
 
     class Config:
@@ -7,17 +7,28 @@ Uses Crawl4AI + Pydantic + ChromaDB for production-ready scraping
 import asyncio
 import json
 import logging
+import time
 from datetime import datetime
 from pathlib import Path
-from typing import List, Optional
+from typing import AsyncIterable, AsyncIterator, Iterable, List, Optional, Union
+import aiohttp
 import chromadb
 from chromadb.config import Settings
 
+from analysis_cache import AnalysisCache, analysis_fingerprint, content_hash
+from chroma_writer import BufferedChromaWriter, DEFAULT_BATCH_SIZE, make_doc_id
+from embeddings import DocumentEmbedder
+from seen_index import SeenIndex
+from trend_aggregates import TrendAggregates
+from credit_integration.score_index import ProfileScoreIndex
 from models import Opportunity, OpportunityAnalysis, TechnicalDifficulty
+from models import ScraperConfig
+from scrapers.crawl4ai_base import CrawlerPool
+from scrapers.rate_limit import RATE_LIMITERS
 from scrapers.reddit_scraper_modern import RedditScraperModern
 from scrapers.indiehackers_scraper_modern import IndieHackersScraperModern
 from scrapers.google_dorking_modern import GoogleDorkingScraperModern
-from scrapers.config import ScraperConfig
+from scrapers.streaming import merge_streams
 
 # Configure logging
 logging.basicConfig(
@@ -31,6 +42,26 @@ WORKSPACE = Path(__file__).parent.absolute()
 RAG_BUSINESS_DB = WORKSPACE / "data" / "chroma_db"
 LLAMA_SERVER = "http://localhost:8080"
 
+# In-flight LLM requests; size this to the llama.cpp server's --parallel slots
+DEFAULT_ANALYSIS_CONCURRENCY = 4
+
+# Longest a partial storage batch may wait while the pipeline is idle
+STORAGE_FLUSH_INTERVAL = 5.0
+
+# Bump when the analysis prompt changes so cached analyses are invalidated.
+# The template id keeps this pipeline's analyses apart from the other
+# pipelines' in the shared cache (different prompt and result schema).
+ANALYSIS_TEMPLATE = "modern"
+ANALYSIS_PROMPT_VERSION = 1
+LLM_MODEL = "qwen-2.5-7b"
+FALLBACK_MODEL = "heuristic-fallback"
+
+
+async def _iterate(items: Iterable[Opportunity]) -> AsyncIterator[Opportunity]:
+    """Present a list as an async stream"""
+    for item in items:
+        yield item
+
 
 class ModernOpportunityPipeline:
     """Production-ready opportunity research pipeline"""
@@ -38,7 +69,12 @@ class ModernOpportunityPipeline:
     def __init__(
         self,
         chroma_path: Optional[Path] = None,
-        llama_server: Optional[str] = None
+        llama_server: Optional[str] = None,
+        analysis_cache: Optional[AnalysisCache] = None,
+        embedder: Optional[DocumentEmbedder] = None,
+        seen_index: Optional[SeenIndex] = None,
+        trend_aggregates: Optional[TrendAggregates] = None,
+        score_index: Optional[ProfileScoreIndex] = None
     ):
         """
         Initialize modern pipeline
@@ -46,9 +82,25 @@ class ModernOpportunityPipeline:
         Args:
             chroma_path: Path to ChromaDB database
             llama_server: URL of local Llama server for analysis
+            analysis_cache: Read-through LLM result cache (default: llm_cache DB)
+            embedder: Batch embedding stage run before each ChromaDB write
+                (default: Opportunity.embedding_model on CPU)
+            seen_index: Persistent index of already-processed URLs, checked
+                before the LLM stage (default: data/seen_index.db)
+            trend_aggregates: Report counters updated as documents are
+                written (default: data/trend_aggregates.db)
+            score_index: Per-profile match scores updated as documents are
+                written (default: data/profile_scores.db)
         """
         self.chroma_path = chroma_path or RAG_BUSINESS_DB
         self.llama_server = llama_server or LLAMA_SERVER
+        self.analysis_cache = analysis_cache or AnalysisCache()
+        self.embedder = embedder or DocumentEmbedder(
+            model_name=Opportunity.model_fields['embedding_model'].default
+        )
+        self.seen_index = seen_index or SeenIndex()
+        self.trend_aggregates = trend_aggregates or TrendAggregates()
+        self.score_index = score_index or ProfileScoreIndex()
 
         # Ensure database directory exists
         self.chroma_path.mkdir(parents=True, exist_ok=True)
@@ -76,12 +128,16 @@ class ModernOpportunityPipeline:
             )
             logger.info("✅ Created new collection: business_opportunities")
 
-    async def scrape_all_sources(self) -> List[Opportunity]:
+    async def stream_all_sources(self) -> AsyncIterator[Opportunity]:
         """
-        Scrape all sources concurrently
+        Stream opportunities from all sources as they are parsed
 
-        Returns:
-            Combined list of validated opportunities
+        Sources run concurrently and their outputs are merged into one stream,
+        deduplicated by URL, so downstream stages can start on the first item
+        instead of waiting for the slowest source.
+
+        Yields:
+            Unique, validated opportunities in arrival order
         """
         logger.info("\n" + "=" * 80)
         logger.info("🚀 MODERN OPPORTUNITY SCRAPING PIPELINE")
@@ -95,59 +151,95 @@ class ModernOpportunityPipeline:
             render_js=True
         )
 
-        reddit_scraper = RedditScraperModern(config)
-        indie_scraper = IndieHackersScraperModern(config)
-        google_scraper = GoogleDorkingScraperModern(config)
-
-        # Run scrapers concurrently
-        logger.info("\n📡 Starting concurrent scraping...")
-
-        results = await asyncio.gather(
-            # Reddit scraping (sync wrapped in async)
-            asyncio.to_thread(reddit_scraper.scrape_all_subreddits),
-            # Indie Hackers scraping (async)
-            indie_scraper.scrape_all(),
-            # Google dorking (async)
-            google_scraper.scrape_all(enrich_content=False),
-            return_exceptions=True
-        )
-
-        # Combine results
-        all_opportunities = []
-        for i, result in enumerate(results):
-            if isinstance(result, Exception):
-                logger.error(f"❌ Scraper {i} failed: {result}")
-            else:
-                all_opportunities.extend(result)
-                logger.info(f"  ✅ Scraper {i}: {len(result)} opportunities")
-
-        # Remove duplicates by URL
-        seen_urls = set()
-        unique_opportunities = []
+        # One browser for the whole run, shared by every Crawl4AI scraper
+        async with CrawlerPool(config) as crawler_pool:
+            reddit_scraper = RedditScraperModern(config, crawler_pool=crawler_pool)
+            indie_scraper = IndieHackersScraperModern(config, crawler_pool=crawler_pool)
+            google_scraper = GoogleDorkingScraperModern(config, crawler_pool=crawler_pool)
+
+            # Run scrapers concurrently
+            logger.info("\n📡 Starting concurrent scraping...")
+
+            stream = merge_streams({
+                # Reddit scraping (async OAuth client, concurrent searches)
+                "Reddit": reddit_scraper.stream_all(),
+                # Indie Hackers scraping (async)
+                "Indie Hackers": indie_scraper.stream_all(),
+                # Google dorking (async)
+                "Google": google_scraper.stream_all(enrich_content=False),
+            })
+
+            # Remove duplicates by URL
+            seen_urls = set()
+            duplicates = 0
+
+            try:
+                async for opp in stream:
+                    url = str(opp.metadata.source_url)
+                    if url in seen_urls:
+                        duplicates += 1
+                        continue
+                    seen_urls.add(url)
+                    yield opp
+            finally:
+                await stream.aclose()
+
+                logger.info(f"\n✅ Total opportunities streamed: {len(seen_urls)}")
+                logger.info(f"   Removed {duplicates} duplicates")
+                for host, metrics in RATE_LIMITERS.metrics().items():
+                    logger.info(
+                        f"   ⏱️  {host}: {metrics['requests']} requests, "
+                        f"waited {metrics['waited_seconds']:.1f}s, "
+                        f"throttled {metrics['throttled']}"
+                    )
 
-        for opp in all_opportunities:
-            url = str(opp.metadata.source_url)
-            if url not in seen_urls:
-                seen_urls.add(url)
-                unique_opportunities.append(opp)
-
-        logger.info(f"\n✅ Total opportunities: {len(unique_opportunities)}")
-        logger.info(f"   Removed {len(all_opportunities) - len(unique_opportunities)} duplicates")
+    async def scrape_all_sources(self) -> List[Opportunity]:
+        """
+        Scrape all sources concurrently
 
-        return unique_opportunities
+        Returns:
+            Combined list of validated opportunities
+        """
+        return [opp async for opp in self.stream_all_sources()]
 
-    async def analyze_opportunity(self, opportunity: Opportunity) -> OpportunityAnalysis:
+    async def analyze_opportunity(
+        self,
+        opportunity: Opportunity,
+        session: Optional[aiohttp.ClientSession] = None
+    ) -> OpportunityAnalysis:
         """
         Analyze opportunity with local LLM
 
         Args:
             opportunity: Opportunity to analyze
+            session: Shared HTTP session (a temporary one is opened if omitted)
 
         Returns:
             OpportunityAnalysis with scores and insights
         """
         logger.info(f"🤖 Analyzing: {opportunity.metadata.title[:60]}...")
 
+        # Reuse a cached analysis if neither the post nor the prompt changed
+        url = str(opportunity.metadata.source_url)
+        fingerprint = analysis_fingerprint(
+            opportunity.metadata.title,
+            opportunity.metadata.description,
+            opportunity.metadata.revenue_claim,
+            opportunity.metadata.tech_stack,
+            template=ANALYSIS_TEMPLATE,
+            prompt_version=ANALYSIS_PROMPT_VERSION,
+            model=LLM_MODEL
+        )
+
+        cached = await asyncio.to_thread(self.analysis_cache.get, url, fingerprint)
+        if cached is not None:
+            try:
+                analysis = OpportunityAnalysis(**cached)
+                logger.info(f"  💾 Cache hit (automation: {analysis.automation_score}/100)")
+                return analysis
+            except Exception as e:
+                logger.warning(f"  ⚠️  Ignoring unreadable cache entry: {e}")
+
         # Build analysis prompt
         prompt = f"""You are an expert business analyst specializing in AI automation opportunities.
 
@@ -180,34 +272,14 @@ Provide analysis in JSON format:
 Respond ONLY with valid JSON."""
 
         try:
-            import requests
-
-            # Call local LLM
-            response = requests.post(
-                f"{self.llama_server}/v1/chat/completions",
-                json={
-                    "messages": [
-                        {"role": "system", "content": "You are a business analysis expert. Always respond with valid JSON."},
-                        {"role": "user", "content": prompt}
-                    ],
-                    "temperature": 0.3,
-                    "max_tokens": 1500
-                },
-                timeout=60
-            )
-
-            if response.status_code == 200:
-                result = response.json()
-                analysis_text = result['choices'][0]['message']['content']
-
-                # Parse JSON from response
-                if "```json" in analysis_text:
-                    analysis_text = analysis_text.split("```json")[1].split("```")[0].strip()
-                elif "```" in analysis_text:
-                    analysis_text = analysis_text.split("```")[1].split("```")[0].strip()
-
-                analysis_dict = json.loads(analysis_text)
+            # Call local LLM without blocking the event loop
+            if session is None:
+                async with aiohttp.ClientSession() as own_session:
+                    analysis_dict = await self._request_analysis(own_session, prompt)
+            else:
+                analysis_dict = await self._request_analysis(session, prompt)
 
+            if analysis_dict is not None:
                 # Validate with Pydantic
                 analysis = OpportunityAnalysis(
                     automation_score=analysis_dict['automation_score'],
@@ -221,7 +293,12 @@ Respond ONLY with valid JSON."""
                     risks=analysis_dict.get('risks', []),
                     competitive_advantages=analysis_dict.get('competitive_advantages', []),
                     target_market=analysis_dict.get('target_market'),
-                    market_size_estimate=analysis_dict.get('market_size_estimate')
+                    market_size_estimate=analysis_dict.get('market_size_estimate'),
+                    analysis_model=LLM_MODEL
+                )
+
+                await asyncio.to_thread(
+                    self.analysis_cache.put, url, fingerprint, analysis.model_dump(mode='json')
                 )
 
                 logger.info(
@@ -238,6 +315,44 @@ Respond ONLY with valid JSON."""
         # Fallback analysis
         return self._fallback_analysis(opportunity)
 
+    async def _request_analysis(
+        self,
+        session: aiohttp.ClientSession,
+        prompt: str
+    ) -> Optional[dict]:
+        """
+        POST the analysis prompt to the llama server
+
+        Returns:
+            Parsed JSON analysis, or None if the server did not answer with 200
+        """
+        async with session.post(
+            f"{self.llama_server}/v1/chat/completions",
+            json={
+                "messages": [
+                    {"role": "system", "content": "You are a business analysis expert. Always respond with valid JSON."},
+                    {"role": "user", "content": prompt}
+                ],
+                "temperature": 0.3,
+                "max_tokens": 1500
+            },
+            timeout=aiohttp.ClientTimeout(total=60)
+        ) as response:
+            if response.status != 200:
+                return None
+
+            result = await response.json()
+
+        analysis_text = result['choices'][0]['message']['content']
+
+        # Parse JSON from response
+        if "```json" in analysis_text:
+            analysis_text = analysis_text.split("```json")[1].split("```")[0].strip()
+        elif "```" in analysis_text:
+            analysis_text = analysis_text.split("```")[1].split("```")[0].strip()
+
+        return json.loads(analysis_text)
+
     def _fallback_analysis(self, opportunity: Opportunity) -> OpportunityAnalysis:
         """Generate fallback analysis when LLM is unavailable"""
         # Calculate basic scores from metadata
@@ -279,15 +394,25 @@ Respond ONLY with valid JSON."""
             competitive_advantages=[
                 "AI-powered features",
                 "Automated workflows"
-            ]
+            ],
+            analysis_model=FALLBACK_MODEL
         )
 
-    async def store_in_chromadb(self, opportunity: Opportunity):
+    async def store_in_chromadb(
+        self,
+        opportunity: Opportunity,
+        writer: Optional[BufferedChromaWriter] = None
+    ) -> Optional[str]:
         """
         Store opportunity in ChromaDB using Pydantic models
 
         Args:
             opportunity: Validated opportunity to store
+            writer: Run-wide buffered writer; without one the document is
+                written immediately on its own
+
+        Returns:
+            The document ID, or None if storing failed
         """
         logger.info(f"💾 Storing: {opportunity.metadata.title[:60]}...")
 
@@ -295,18 +420,26 @@ Respond ONLY with valid JSON."""
             # Convert to document and metadata using Pydantic methods
             document = opportunity.to_document()
             metadata = opportunity.to_metadata_dict()
+            # Stable per URL, so reruns update the stored document in place
+            doc_id = make_doc_id(str(opportunity.metadata.source_url))
 
-            # Add to collection
-            self.collection.add(
-                ids=[opportunity.id or f"opp_{datetime.now().timestamp()}"],
-                documents=[document],
-                metadatas=[metadata]
-            )
+            # Off the event loop so in-flight analyses keep going
+            if writer is not None:
+                await asyncio.to_thread(writer.add, doc_id, document, metadata)
+            else:
+                await asyncio.to_thread(
+                    self.collection.upsert,
+                    ids=[doc_id],
+                    documents=[document],
+                    metadatas=[metadata]
+                )
+                logger.info("  ✅ Stored")
 
-            logger.info(f"  ✅ Stored (total: {self.collection.count()})")
+            return doc_id
 
         except Exception as e:
             logger.error(f"  ❌ Error storing: {e}")
+            return None
 
     def query_opportunities(
         self,
@@ -357,10 +490,186 @@ Respond ONLY with valid JSON."""
             logger.error(f"❌ Query error: {e}")
             return []
 
+    async def analyze_and_store(
+        self,
+        opportunities: Union[Iterable[Opportunity], AsyncIterable[Opportunity]],
+        analyze_with_llm: bool = True,
+        concurrency: int = DEFAULT_ANALYSIS_CONCURRENCY,
+        storage_batch_size: int = DEFAULT_BATCH_SIZE,
+        max_opportunities: Optional[int] = None,
+        started_at: Optional[float] = None
+    ) -> List[Opportunity]:
+        """
+        Analyze opportunities on a bounded worker pool and store them in input order
+
+        Accepts a list or an async stream (see stream_all_sources). Each
+        opportunity is scheduled for analysis as soon as it arrives, unless the
+        seen-URL index says it was already processed with the same content; up to
+        `concurrency` LLM requests are in flight at once over a shared
+        keep-alive session. Storage consumes finished analyses in input order,
+        so storing item N overlaps with the analysis of the items after it.
+        Writes are buffered and flushed every `storage_batch_size` documents
+        and once more when the stage ends or fails. While storage sits idle
+        waiting on the scraper or LLM, a partial batch is flushed if nothing
+        has been stored yet or it is older than STORAGE_FLUSH_INTERVAL.
+
+        Args:
+            opportunities: Opportunities to process (list or async iterable)
+            analyze_with_llm: Whether to analyze with local LLM
+            concurrency: Max in-flight LLM requests
+            storage_batch_size: Documents per ChromaDB write
+            max_opportunities: Stop after this many (None = all)
+            started_at: time.perf_counter() the run started, for the
+                time-to-first-stored metric (default: now)
+
+        Returns:
+            The processed opportunities, in input order
+        """
+        if isinstance(opportunities, AsyncIterable):
+            stream = opportunities
+            total = None
+        else:
+            opportunities = list(opportunities)
+            stream = _iterate(opportunities)
+            total = len(opportunities)
+            if total == 0:
+                return opportunities
+
+        if max_opportunities and total is not None:
+            total = min(total, max_opportunities)
+
+        semaphore = asyncio.Semaphore(concurrency)
+        start_time = time.perf_counter()
+        started_at = started_at or start_time
+
+        logger.info(f"\n🤖 Analyzing and storing opportunities as they arrive (concurrency={concurrency})...")
+
+        # Doc ID -> (url, content hash), marked as seen once the write lands
+        pending_marks = {}
+
+        def _on_flush(ids: List[str], metadatas: List[dict]):
+            entries = [pending_marks.pop(doc_id) for doc_id in ids if doc_id in pending_marks]
+            self.seen_index.mark_many(entries, self.collection)
+            self.trend_aggregates.record(ids, metadatas, self.collection)
+            self.score_index.record(ids, metadatas, self.collection)
+
+        writer = BufferedChromaWriter(
+            self.collection,
+            batch_size=storage_batch_size,
+            embedder=self.embedder,
+            on_flush=_on_flush
+        )
+        digests = {}
+        processed: List[Opportunity] = []
+        tasks: List[asyncio.Task] = []
+        ready: asyncio.Queue = asyncio.Queue()
+
+        connector = aiohttp.TCPConnector(limit=concurrency)
+        async with aiohttp.ClientSession(connector=connector) as session:
+
+            async def _analyze(index: int, opp: Opportunity) -> Opportunity:
+                if analyze_with_llm:
+                    async with semaphore:
+                        progress = f"{index}/{total}" if total else f"{index}"
+                        logger.info(f"\n[{progress}] Processing: {opp.metadata.title[:60]}...")
+                        opp.analysis = await self.analyze_opportunity(opp, session)
+                return opp
+
+            async def _schedule():
+                try:
+                    async for opp in stream:
+                        url = str(opp.metadata.source_url)
+                        digest = content_hash(
+                            opp.metadata.title,
+                            opp.metadata.description,
+                            opp.metadata.revenue_claim,
+                            opp.metadata.tech_stack
+                        )
+                        if self.seen_index.is_fresh(url, digest, self.collection):
+                            logger.debug(f"⏭️  Unchanged, skipping: {opp.metadata.title[:60]}")
+                            continue
+                        digests[id(opp)] = digest
+
+                        task = asyncio.create_task(_analyze(len(tasks) + 1, opp))
+                        tasks.append(task)
+                        ready.put_nowait(task)
+
+                        if max_opportunities and len(tasks) >= max_opportunities:
+                            break
+                except Exception as e:
+                    logger.error(f"❌ Opportunity stream failed: {e}")
+                finally:
+                    if hasattr(stream, "aclose"):
+                        await stream.aclose()
+                    ready.put_nowait(None)
+
+            async def _flush_if_idle(idle: bool):
+                if idle and writer.pending and (
+                    writer.first_write_at is None
+                    or writer.pending_age >= STORAGE_FLUSH_INTERVAL
+                ):
+                    await asyncio.to_thread(writer.flush)
+
+            scheduler = asyncio.create_task(_schedule())
+
+            try:
+                while True:
+                    await _flush_if_idle(ready.empty())
+                    task = await ready.get()
+                    if task is None:
+                        break
+
+                    await _flush_if_idle(not task.done())
+
+                    opp = await task
+                    doc_id = await self.store_in_chromadb(opp, writer)
+                    processed.append(opp)
+                    digest = digests.pop(id(opp))
+
+                    # Only real LLM analyses count as processed; fallbacks retry next run
+                    if doc_id and opp.analysis and opp.analysis.analysis_model != FALLBACK_MODEL:
+                        pending_marks[doc_id] = (str(opp.metadata.source_url), digest)
+            finally:
+                scheduler.cancel()
+                for task in tasks:
+                    task.cancel()
+                await asyncio.gather(scheduler, return_exceptions=True)
+                await asyncio.to_thread(writer.close)
+
+        count = len(processed)
+        elapsed = time.perf_counter() - start_time
+        logger.info(
+            f"\n⚡ Processed {count} opportunities in {elapsed:.1f}s "
+            f"({count / elapsed if elapsed else 0:.2f} items/sec, concurrency={concurrency})"
+        )
+        seen_stats = self.seen_index.stats()
+        if seen_stats['skipped']:
+            logger.info(
+                f"   ⏭️  Skipped {seen_stats['skipped']} unchanged opportunities "
+                f"(seen-URL index: {seen_stats['known']} known)"
+            )
+        if writer.first_write_at is not None:
+            logger.info(f"   Time to first stored opportunity: {writer.first_write_at - started_at:.1f}s")
+        logger.info(
+            f"   Stored {writer.written} in {writer.batches} batches "
+            f"({writer.write_seconds:.2f}s writing, {writer.failed} failed)"
+        )
+
+        embed_stats = self.embedder.stats()
+        if embed_stats['documents']:
+            logger.info(
+                f"   Embedded {embed_stats['documents']} documents locally "
+                f"({embed_stats['docs_per_sec']:.1f} docs/sec)"
+            )
+
+        return processed
+
     async def run_full_pipeline(
         self,
         analyze_with_llm: bool = True,
-        max_opportunities: Optional[int] = None
+        max_opportunities: Optional[int] = None,
+        analysis_concurrency: int = DEFAULT_ANALYSIS_CONCURRENCY,
+        storage_batch_size: int = DEFAULT_BATCH_SIZE
     ):
         """
         Run complete pipeline: Scrape -> Analyze -> Store
@@ -368,30 +677,27 @@ Respond ONLY with valid JSON."""
         Args:
             analyze_with_llm: Whether to analyze with local LLM
             max_opportunities: Max opportunities to process (None = all)
+            analysis_concurrency: Max in-flight LLM requests
+            storage_batch_size: Documents per ChromaDB write
         """
         logger.info("\n" + "=" * 80)
         logger.info("🚀 FULL PIPELINE EXECUTION")
         logger.info("=" * 80)
 
-        # Step 1: Scrape
-        opportunities = await self.scrape_all_sources()
-
-        if max_opportunities:
-            opportunities = opportunities[:max_opportunities]
-
-        # Step 2: Analyze and Store
-        logger.info(f"\n🤖 Analyzing and storing {len(opportunities)} opportunities...")
-
-        for i, opp in enumerate(opportunities, 1):
-            logger.info(f"\n[{i}/{len(opportunities)}] Processing: {opp.metadata.title[:60]}...")
-
-            # Analyze
-            if analyze_with_llm:
-                analysis = await self.analyze_opportunity(opp)
-                opp.analysis = analysis
-
-            # Store
-            await self.store_in_chromadb(opp)
+        self.analysis_cache.reset_stats()
+        self.seen_index.reset_stats()
+        started_at = time.perf_counter()
+
+        # Steps 1 & 2: Scrape -> Analyze -> Store, streamed so analysis and
+        # storage start on the first scraped opportunity
+        await self.analyze_and_store(
+            self.stream_all_sources(),
+            analyze_with_llm=analyze_with_llm,
+            concurrency=analysis_concurrency,
+            storage_batch_size=storage_batch_size,
+            max_opportunities=max_opportunities,
+            started_at=started_at
+        )
 
         # Step 3: Demo query
         logger.info("\n" + "=" * 80)
@@ -409,15 +715,36 @@ Respond ONLY with valid JSON."""
         logger.info(f"\n💡 Database location: {self.chroma_path}")
         logger.info(f"   Total opportunities: {self.collection.count()}")
 
+        cache_stats = self.analysis_cache.stats()
+        logger.info(
+            f"   LLM cache: {cache_stats['hits']} hits, {cache_stats['misses']} misses "
+            f"({cache_stats['hit_rate']:.0%} hit rate)"
+        )
+
 
 async def main():
     """Run the modern pipeline"""
-    pipeline = ModernOpportunityPipeline()
+    import argparse
+
+    parser = argparse.ArgumentParser(description='Modern Opportunity Research Pipeline')
+    parser.add_argument('--reprocess-older-than', type=float, default=None, metavar='DAYS',
+                        help='Re-analyze already-processed URLs last analyzed more than DAYS ago '
+                             '(default: only new or changed URLs; 0 = everything)')
+    args = parser.parse_args()
+
+    pipeline = ModernOpportunityPipeline(
+        embedder=DocumentEmbedder(
+            batch_size=64,  # Documents per forward pass
+            num_threads=None  # torch CPU threads, None = all cores
+        ),
+        seen_index=SeenIndex(reprocess_older_than_days=args.reprocess_older_than)
+    )
 
     # Run full pipeline
     await pipeline.run_full_pipeline(
         analyze_with_llm=True,  # Set to False to skip LLM analysis
-        max_opportunities=10  # Limit for testing, set to None for all
+        max_opportunities=10,  # Limit for testing, set to None for all
+        analysis_concurrency=DEFAULT_ANALYSIS_CONCURRENCY  # Match llama.cpp slot count
     )
 
 
@@ -41,12 +41,33 @@ Usage
     parse_investment_range("free to $100")       # (0.0, 100.0)
     parse_investment_range("minimal investment") # (0.0, None)
     parse_investment_range(None)                 # (None, None)
+
+    # Whole columns at once: float64 arrays, NaN where a bound is unknown
+    lo, hi = parse_investment_ranges(["$500-1000", "under $200", None])
+    # lo = [500., nan, nan]   hi = [1000., 200., nan]
+
+Memoization
+-----------
+LLM output repeats the same few hundred strings ("$500-1000", "Minimal")
+across thousands of stored opportunities, so parses are memoized in a
+bounded LRU cache keyed on the stripped string (_CACHE_SIZE entries).
+parse_investment_ranges() additionally parses each distinct value in a
+batch only once.
+
+    python parse_investment.py            # run the test cases
+    python parse_investment.py --bench    # throughput on a 100k-string corpus
 """
 
 from __future__ import annotations
 
 import re
-from typing import Optional
+from functools import lru_cache
+from typing import Iterable, Optional
+
+import numpy as np
+
+# Distinct strings kept in the parse cache
+_CACHE_SIZE = 65_536
 
 
 # ---------------------------------------------------------------------------
@@ -211,6 +232,47 @@ def parse_investment_range(raw) -> tuple[Optional[float], Optional[float]]:
     if not text:
         return (None, None)
 
+    return _parse_text(text)
+
+
+def parse_investment_ranges(values: Iterable) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Parse a whole column of investment strings at once.
+
+    Each distinct value is parsed once (and through the same LRU cache as
+    parse_investment_range), then broadcast back to every row.
+
+    Parameters
+    ----------
+    values:
+        Iterable of anything parse_investment_range() accepts.
+
+    Returns
+    -------
+    (min_usd, max_usd) float64 arrays of len(values); NaN where
+    parse_investment_range() would return None.
+    """
+    distinct: dict = {}
+    rows = []
+    for raw in values:
+        # Numbers are keyed by value and type so 1 and "1" stay distinct
+        key = (type(raw), raw) if isinstance(raw, (int, float)) or raw is None else str(raw).strip()
+        index = distinct.get(key)
+        if index is None:
+            index = distinct[key] = len(distinct)
+        rows.append(index)
+
+    bounds = np.array(
+        [parse_investment_range(key[1] if isinstance(key, tuple) else key) for key in distinct],
+        dtype=float,
+    ).reshape(-1, 2)  # None becomes NaN
+    codes = np.array(rows, dtype=np.intp)
+    return bounds[codes, 0], bounds[codes, 1]
+
+
+@lru_cache(maxsize=_CACHE_SIZE)
+def _parse_text(text: str) -> tuple[Optional[float], Optional[float]]:
+    """parse_investment_range() for a stripped, non-empty string (memoized)."""
     # --- Hard no-information patterns -----------------------------------
     if _NONE_RE.match(text):
         return (None, None)
@@ -273,6 +335,149 @@ def parse_investment_range(raw) -> tuple[Optional[float], Optional[float]]:
     return (lo, lo)
 
 
+# ---------------------------------------------------------------------------
+# Revenue and time-to-revenue
+# ---------------------------------------------------------------------------
+
+# Multiplier from a revenue period to a monthly amount
+_MONTHLY_FACTORS = {"day": 365 / 12, "week": 52 / 12, "month": 1.0, "year": 1 / 12}
+
+_REVENUE_PERIOD_RE = re.compile(
+    r"(?P<year>\b(?:yr|year|years|annual(?:ly)?|arr|p\.?a)\b|/\s*y\b)"
+    r"|(?P<week>\b(?:week|weekly|wk)\b)"
+    r"|(?P<day>\b(?:day|daily)\b)",
+    re.I,
+)
+
+# First duration in a string; the lower bound of "2-4 weeks" / "1 to 3 months"
+_DURATION_RE = re.compile(
+    r"(?P<n>\d+(?:\.\d+)?)\s*(?:(?:[-\u2013\u2014]+|to)\s*\d+(?:\.\d+)?\s*)?"
+    r"(?P<unit>day|week|wk|month|mo|quarter|year|yr)s?\b",
+    re.I,
+)
+_MONTHS_PER_UNIT = {
+    "day": 12 / 365, "week": 12 / 52, "wk": 12 / 52, "month": 1.0, "mo": 1.0,
+    "quarter": 3.0, "year": 12.0, "yr": 12.0,
+}
+
+
+def parse_monthly_revenue(raw, period: Optional[str] = None) -> Optional[float]:
+    """
+    Parse a revenue claim ("$3,000/month", "$50k ARR", "$1k-2k per week")
+    into US dollars per month.
+
+    A range counts as its midpoint. The period comes from the text, or from
+    `period` ("month", "year", "week", "day") for numeric input; anything
+    else is taken to be monthly, which is how the scrapers label claims.
+    Returns None when there is no amount.
+    """
+    if isinstance(raw, (int, float)):
+        return float(raw) * _MONTHLY_FACTORS.get(str(period).lower(), 1.0)
+    if raw is None:
+        return None
+
+    text = str(raw).strip()
+    if not text or not any(char.isdigit() for char in text):
+        return None
+    return _parse_monthly_revenue_text(text)
+
+
+@lru_cache(maxsize=_CACHE_SIZE)
+def _parse_monthly_revenue_text(text: str) -> Optional[float]:
+    lo, hi = parse_investment_range(text)
+    if lo is None and hi is None:
+        return None
+    amount = hi if lo is None else lo if hi is None else (lo + hi) / 2
+
+    m = _REVENUE_PERIOD_RE.search(text)
+    period = m.lastgroup if m else "month"
+    return round(amount * _MONTHLY_FACTORS[period], 2)
+
+
+def parse_time_to_revenue_months(raw) -> Optional[float]:
+    """
+    Parse an LLM time estimate ("2-4 weeks", "1-2 months", "1 year") into
+    months until first revenue: the lower bound of a range, weeks and days
+    converted. Numbers are taken as months. Returns None when no duration
+    is given ("ongoing", "Unknown").
+    """
+    if isinstance(raw, (int, float)):
+        return float(raw)
+    if raw is None:
+        return None
+
+    text = str(raw).strip()
+    if not text:
+        return None
+    return _parse_months_text(text)
+
+
+@lru_cache(maxsize=_CACHE_SIZE)
+def _parse_months_text(text: str) -> Optional[float]:
+    m = _DURATION_RE.search(text)
+    if not m:
+        return None
+    return round(float(m.group("n")) * _MONTHS_PER_UNIT[m.group("unit").lower()], 2)
+
+
+# ---------------------------------------------------------------------------
+# Numeric metadata fields
+# ---------------------------------------------------------------------------
+# Persisted next to the raw strings when an opportunity is written, so
+# readers compare numbers (and ChromaDB `where` filters work) instead of
+# parsing strings at query time. Unknown values are left out, since ChromaDB
+# metadata cannot hold None.
+
+INVESTMENT_MIN_FIELD = "investment_min_usd"
+INVESTMENT_MAX_FIELD = "investment_max_usd"
+REVENUE_MONTHLY_FIELD = "revenue_monthly_usd"
+TIME_TO_REVENUE_FIELD = "time_to_revenue_months"
+
+NUMERIC_FIELDS = (INVESTMENT_MIN_FIELD, INVESTMENT_MAX_FIELD, REVENUE_MONTHLY_FIELD, TIME_TO_REVENUE_FIELD)
+
+
+def numeric_metadata(
+    initial_investment=None,
+    time_to_market=None,
+    revenue_claim=None,
+    revenue_amount: Optional[float] = None,
+    revenue_period: Optional[str] = None,
+) -> dict:
+    """
+    Numeric metadata fields for one opportunity.
+
+    Parameters
+    ----------
+    initial_investment, time_to_market:
+        The LLM analysis strings.
+    revenue_claim:
+        The scraped claim; ignored when the scraper already parsed
+        revenue_amount (with its revenue_period).
+
+    Returns
+    -------
+    Dict with the NUMERIC_FIELDS that could be determined.
+
+    Examples
+    --------
+    >>> numeric_metadata("$500-1000", "2-4 weeks", "$3,000/month")
+    {'investment_min_usd': 500.0, 'investment_max_usd': 1000.0, 'revenue_monthly_usd': 3000.0, 'time_to_revenue_months': 0.46}
+    """
+    lo, hi = parse_investment_range(initial_investment)
+    if revenue_amount is not None:
+        revenue = parse_monthly_revenue(revenue_amount, revenue_period)
+    else:
+        revenue = parse_monthly_revenue(revenue_claim)
+
+    fields = {
+        INVESTMENT_MIN_FIELD: lo,
+        INVESTMENT_MAX_FIELD: hi,
+        REVENUE_MONTHLY_FIELD: revenue,
+        TIME_TO_REVENUE_FIELD: parse_time_to_revenue_months(time_to_market),
+    }
+    return {field: value for field, value in fields.items() if value is not None}
+
+
 # ---------------------------------------------------------------------------
 # Self-contained unit tests
 # ---------------------------------------------------------------------------
@@ -352,11 +557,29 @@ def _run_tests() -> bool:
         ("$500-$200",          (200.0, 500.0),          "reversed range - normalised"),
     ]
 
+    # (function, input, expected, description)
+    field_cases = [
+        (parse_monthly_revenue, "$3,000/month",      3000.0,   "monthly claim"),
+        (parse_monthly_revenue, "$5k MRR",           5000.0,   "k suffix, MRR"),
+        (parse_monthly_revenue, "$60,000 ARR",       5000.0,   "annual claim -> monthly"),
+        (parse_monthly_revenue, "$1k-$2k per month", 1500.0,   "range -> midpoint"),
+        (parse_monthly_revenue, "$100/week",         433.33,   "weekly claim -> monthly"),
+        (parse_monthly_revenue, "Not specified",     None,     "no amount"),
+        (parse_monthly_revenue, "Revenue mentioned (not specified)", None, "no amount, revenue wording"),
+        (parse_time_to_revenue_months, "2-4 weeks",  0.46,     "weeks, lower bound"),
+        (parse_time_to_revenue_months, "1-2 months", 1.0,      "months range, lower bound"),
+        (parse_time_to_revenue_months, "3 months",   3.0,      "single month value"),
+        (parse_time_to_revenue_months, "1 year",     12.0,     "year"),
+        (parse_time_to_revenue_months, "Unknown",    None,     "no duration"),
+    ]
+
     passed = 0
     failed = 0
 
-    for raw, expected, description in cases:
-        result = parse_investment_range(raw)
+    cases = [(parse_investment_range, *case) for case in cases] + field_cases
+
+    for parse, raw, expected, description in cases:
+        result = parse(raw)
         ok = (result == expected)
         status = "PASS" if ok else "FAIL"
         if not ok:
@@ -378,7 +601,58 @@ def _run_tests() -> bool:
     return failed == 0
 
 
+# ---------------------------------------------------------------------------
+# Micro-benchmark
+# ---------------------------------------------------------------------------
+
+def _bench(size: int = 100_000, distinct: int = 500) -> None:
+    """Parse a corpus of `size` strings drawn from `distinct` LLM-style values."""
+    import random
+    import time
+
+    rng = random.Random(42)
+    templates = [
+        "${a}-{b}", "${a} - ${b}", "${a} to ${b}", "${k}k-${k2}k", "under ${a}",
+        "up to ${a}", "at least ${a}", "approximately ${a}", "~${a}", "${a}",
+        "${a},000", "free to ${a}", "Minimal", "Low cost", "Unknown", "N/A",
+        "${a} (domain + hosting)", "Around ${a} for tools and ads",
+    ]
+    values = []
+    for _ in range(distinct):
+        a = rng.choice([0, 50, 100, 200, 250, 500, 750, 1000, 1500, 2000, 5000])
+        values.append(rng.choice(templates).format(
+            a=a, b=a * rng.choice([2, 3, 5]), k=rng.randint(1, 9), k2=rng.randint(10, 50)))
+    corpus = [rng.choice(values) for _ in range(size)]
+
+    def _timed(label, fn):
+        start = time.perf_counter()
+        fn()
+        elapsed = time.perf_counter() - start
+        print(f"  {label:<34} {elapsed * 1000:8.1f} ms  {size / elapsed:12,.0f} strings/s")
+
+    print(f"Corpus: {size:,} strings, {len(set(corpus))} distinct")
+    _timed("uncached parse (per string)", lambda: [_parse_text.__wrapped__(v.strip()) for v in corpus])
+    _parse_text.cache_clear()
+    _timed("parse_investment_range (LRU)", lambda: [parse_investment_range(v) for v in corpus])
+    _parse_text.cache_clear()
+    _timed("parse_investment_ranges (batch)", lambda: parse_investment_ranges(corpus))
+    print(f"  cache: {_parse_text.cache_info()}")
+
+
 if __name__ == "__main__":
+    import argparse
     import sys
+
+    parser = argparse.ArgumentParser(description="Investment range parser tests and benchmark")
+    parser.add_argument("--bench", action="store_true",
+                        help="Run the micro-benchmark instead of the test cases")
+    parser.add_argument("--size", type=int, default=100_000,
+                        help="Benchmark corpus size (default: 100,000)")
+    args = parser.parse_args()
+
+    if args.bench:
+        _bench(args.size)
+        sys.exit(0)
+
     ok = _run_tests()
     sys.exit(0 if ok else 1)
@@ -46,12 +46,19 @@ class PersonalizedOpportunityBot:
         print(f"🔐 Loading credit profile for: {business_entity.upper()}")
         self.credit_profile = self._load_credit_profile(business_entity)
 
-        # Initialize personalization engine
-        self.engine = PersonalizationEngine(self.credit_profile, self.rag_db_path)
+        # Initialize personalization engine (match scores served from the
+        # per-profile score index in data/profile_scores.db)
+        self.engine = PersonalizationEngine(
+            self.credit_profile, self.rag_db_path, profile_key=business_entity.lower()
+        )
 
         # Display profile
         self._display_profile()
 
+    def close(self):
+        """Release the engine's database handle"""
+        self.engine.close()
+
     def _load_credit_profile(self, business_entity: str) -> CreditProfile:
         """Load credit profile for specified business entity"""
 
@@ -145,6 +152,33 @@ class PersonalizedOpportunityBot:
         print("   • Run get_portfolio_advice() for overall strategy")
         print("=" * 70)
 
+    def top_matches(self, n_results: int = 5):
+        """
+        Show the best matches for the credit profile across all stored opportunities
+
+        Args:
+            n_results: Number of results to return
+        """
+
+        print("\n🎯 Best matches for your credit profile (all opportunities)")
+        print()
+
+        recommendations = self.engine.get_top_matches(n_results)
+
+        if not recommendations:
+            print("❌ No stored opportunities match your credit profile.")
+            print("\n💡 Try running demo_opportunity_pipeline.py to populate database")
+            return
+
+        print("=" * 70)
+        print(f"TOP MATCHES ({len(recommendations)} opportunities)")
+        print("=" * 70)
+
+        for i, rec in enumerate(recommendations, 1):
+            self._display_recommendation(i, rec)
+
+        print("\n" + "=" * 70)
+
     def _display_recommendation(self, rank: int, rec):
         """Display a single personalized recommendation"""
 
@@ -218,7 +252,12 @@ class PersonalizedOpportunityBot:
         print("\n" + "=" * 70)
 
     def compare_opportunities(self, queries: list):
-        """Compare opportunities across different categories"""
+        """
+        Compare opportunities across different categories
+
+        All categories are searched and scored in one batched pass (see
+        PersonalizationEngine.get_personalized_recommendations_many).
+        """
 
         print("\n" + "=" * 70)
         print("OPPORTUNITY COMPARISON")
@@ -226,9 +265,11 @@ class PersonalizedOpportunityBot:
 
         all_recommendations = []
 
+        recommendations_by_query = self.engine.get_personalized_recommendations_many(queries, 2)
+
         for query in queries:
             print(f"\n📋 Category: {query}")
-            recs = self.engine.get_personalized_recommendations(query, 2)
+            recs = recommendations_by_query[query]
             if recs:
                 all_recommendations.extend(recs)
                 print(f"   Found {len(recs)} matches")
@@ -237,6 +278,9 @@ class PersonalizedOpportunityBot:
             print("\n❌ No opportunities found")
             return
 
+        # An opportunity matching several categories is listed once
+        all_recommendations = list({id(rec): rec for rec in all_recommendations}.values())
+
         # Sort by match score
         all_recommendations.sort(key=lambda x: x.match_score.total_score, reverse=True)
 
@@ -261,6 +305,7 @@ class PersonalizedOpportunityBot:
         print("=" * 70)
         print("\nCommands:")
         print("  search <query>     - Search for opportunities")
+        print("  top                - Best matches across all opportunities")
         print("  advice             - Get portfolio strategy advice")
         print("  compare            - Compare opportunity categories")
         print("  profile            - Show credit profile")
@@ -281,6 +326,9 @@ class PersonalizedOpportunityBot:
                 elif command == 'profile':
                     self._display_profile()
 
+                elif command == 'top':
+                    self.top_matches()
+
                 elif command == 'compare':
                     categories = [
                         "AI automation opportunities",
@@ -294,7 +342,7 @@ class PersonalizedOpportunityBot:
                     self.search_opportunities(query)
 
                 else:
-                    print("❌ Unknown command. Type 'search <query>', 'advice', 'compare', 'profile', or 'quit'")
+                    print("❌ Unknown command. Type 'search <query>', 'top', 'advice', 'compare', 'profile', or 'quit'")
 
             except KeyboardInterrupt:
                 print("\n\n👋 Goodbye!")
@@ -324,16 +372,19 @@ def main():
     # Initialize bot
     bot = PersonalizedOpportunityBot(entity)
 
-    # Get portfolio advice
-    bot.get_portfolio_advice()
+    try:
+        # Get portfolio advice
+        bot.get_portfolio_advice()
 
-    # Check if query provided
-    if len(sys.argv) > 2:
-        query = " ".join(sys.argv[2:])
-        bot.search_opportunities(query)
-    else:
-        # Interactive mode
-        bot.interactive_mode()
+        # Check if query provided
+        if len(sys.argv) > 2:
+            query = " ".join(sys.argv[2:])
+            bot.search_opportunities(query)
+        else:
+            # Interactive mode
+            bot.interactive_mode()
+    finally:
+        bot.close()
 
 
 if __name__ == "__main__":
@@ -11,7 +11,7 @@ import requests
 import chromadb
 from datetime import datetime
 from pathlib import Path
-from typing import List, Dict
+from typing import List, Dict, Optional
 
 # Add scrapers to path
 sys.path.insert(0, str(Path(__file__).parent))
@@ -23,6 +23,13 @@ try:
     from scrapers.producthunt_scraper import ProductHuntScraper
     from scrapers.hackernews_scraper import HackerNewsScraper
     from config_chromadb import get_chroma_client, get_chroma_settings
+    from analysis_cache import AnalysisCache, analysis_fingerprint, analysis_key, content_hash
+    from seen_index import SeenIndex
+    from trend_aggregates import TrendAggregates
+    from credit_integration.score_index import ProfileScoreIndex
+    from chroma_writer import BufferedChromaWriter, DEFAULT_BATCH_SIZE, opportunity_doc_id
+    from parse_investment import numeric_metadata
+    from embeddings import DocumentEmbedder, DEFAULT_EMBED_BATCH_SIZE
 except ImportError as e:
     print(f"❌ Import error: {e}")
     print("   Make sure scrapers/ directory exists with all modules")
@@ -33,21 +40,53 @@ WORKSPACE = Path(__file__).parent.absolute()  # opportunity-research-bot directo
 LLAMA_SERVER = "http://localhost:8080"
 RAG_BUSINESS_DB = WORKSPACE / "data" / "chroma_db"  # Kept for backward compatibility
 
+# Bump when the analysis prompt changes so cached analyses are invalidated.
+# The template id keeps this pipeline's analyses apart from the other
+# pipelines' in the shared cache (different prompt and result schema).
+ANALYSIS_TEMPLATE = "production"
+ANALYSIS_PROMPT_VERSION = 1
+LLM_MODEL = "qwen-2.5-7b"
+FALLBACK_MODEL = "heuristic-fallback"
+
+# Fields store_in_business_rag reads from an analysis
+ANALYSIS_FIELDS = (
+    "automation_score", "technical_difficulty", "time_to_market", "initial_investment",
+    "scalability", "legitimacy_score", "key_insights", "automation_opportunities",
+    "risks", "recommended_action",
+)
+
 
 class ProductionOpportunityPipeline:
-    def __init__(self, use_demo_mode: bool = False):
+    def __init__(self, use_demo_mode: bool = False, batch_size: int = DEFAULT_BATCH_SIZE,
+                 embed_batch_size: int = DEFAULT_EMBED_BATCH_SIZE, embed_threads: int = None,
+                 reprocess_older_than_days: float = None):
         """
         Initialize pipeline
 
         Args:
             use_demo_mode: If True, uses demo data instead of real scraping
+            batch_size: Documents per ChromaDB write
+            embed_batch_size: Documents per embedding forward pass
+            embed_threads: CPU threads for embedding (None = all cores)
+            reprocess_older_than_days: Re-analyze already-processed URLs last
+                analyzed longer ago than this (None = only new or changed URLs)
         """
         self.use_demo_mode = use_demo_mode
+        self.batch_size = batch_size
         self.opportunities = []
+        self.analysis_cache = AnalysisCache()
+        self.embedder = DocumentEmbedder(batch_size=embed_batch_size, num_threads=embed_threads)
+        self.seen_index = SeenIndex(reprocess_older_than_days=reprocess_older_than_days)
+        self._pending_marks = {}  # doc ID -> (analysis key, content hash), marked once written
+        self.trend_aggregates = TrendAggregates()
+        self.score_index = ProfileScoreIndex()
+        self.collection = None
+        self.writer = None
         self.stats = {
             'scraped': 0,
             'analyzed': 0,
             'stored': 0,
+            'skipped': 0,
             'failed': 0
         }
 
@@ -121,10 +160,42 @@ class ProductionOpportunityPipeline:
             }
         ]
 
-    def analyze_with_qwen(self, opportunity: Dict) -> Dict:
-        """Step 2: Analyze opportunity with local Qwen LLM"""
+    @staticmethod
+    def _revenue_claim(opportunity: Dict) -> str:
+        """Revenue claim of an opportunity; Ask HN ideas carry it as revenue_potential"""
+        return opportunity.get('revenue_claim', opportunity.get('revenue_potential', 'Not specified'))
+
+    def _fingerprint(self, opportunity: Dict) -> str:
+        """LLM cache fingerprint of an opportunity's analysis inputs"""
+        return analysis_fingerprint(
+            opportunity['title'],
+            opportunity['description'],
+            self._revenue_claim(opportunity),
+            opportunity['tech_stack'],
+            template=ANALYSIS_TEMPLATE,
+            prompt_version=ANALYSIS_PROMPT_VERSION,
+            model=LLM_MODEL
+        )
+
+    def analyze_with_qwen(self, opportunity: Dict, cached: Optional[Dict] = None) -> Dict:
+        """
+        Step 2: Analyze opportunity with local Qwen LLM
+
+        Args:
+            opportunity: Scraped opportunity
+            cached: Its cached analysis, if the batched cache pre-check found one
+        """
         print(f"\n🤖 Analyzing: {opportunity['title'][:60]}...")
 
+        if cached is not None:
+            missing = [field for field in ANALYSIS_FIELDS if field not in cached]
+            if not missing:
+                print(f"   💾 Cache hit | Automation: {cached.get('automation_score', 'N/A')}/100")
+                return cached
+            print(f"   ⚠️  Ignoring incomplete cache entry (missing {', '.join(missing)})")
+
+        fingerprint = self._fingerprint(opportunity)
+
         prompt = f"""You are an expert business analyst specializing in AI automation opportunities.
 
 Analyze this business opportunity and provide structured scores:
@@ -132,7 +203,7 @@ Analyze this business opportunity and provide structured scores:
 OPPORTUNITY:
 Title: {opportunity['title']}
 Description: {opportunity['description']}
-Revenue Claim: {opportunity['revenue_claim']}
+Revenue Claim: {self._revenue_claim(opportunity)}
 Tech Stack: {opportunity['tech_stack']}
 Source: {opportunity['source']}
 
@@ -182,6 +253,11 @@ Respond ONLY with valid JSON."""
                       f"Priority: {analysis.get('recommended_action', 'N/A')}")
 
                 self.stats['analyzed'] += 1
+                self.analysis_cache.put(
+                    analysis_key(opportunity['url'], opportunity['source'], opportunity['title']),
+                    fingerprint,
+                    analysis
+                )
                 return analysis
 
             else:
@@ -195,8 +271,9 @@ Respond ONLY with valid JSON."""
             return self._fallback_analysis()
 
     def _fallback_analysis(self) -> Dict:
-        """Fallback when Qwen is unavailable"""
+        """Fallback when Qwen is unavailable, tagged so it is never marked as seen"""
         return {
+            "analysis_model": FALLBACK_MODEL,
             "automation_score": 75,
             "technical_difficulty": 3,
             "time_to_market": "3-6 weeks",
@@ -209,20 +286,25 @@ Respond ONLY with valid JSON."""
             "recommended_action": "medium"
         }
 
-    def store_in_business_rag(self, opportunity: Dict, analysis: Dict):
-        """Step 3: Store in business RAG"""
+    def _open_business_rag(self):
+        """Connect to the business RAG collection once per run"""
+        # Use Xeon Gold ChromaDB (with automatic fallback to local)
+        client = get_chroma_client()
+
         try:
-            # Use Xeon Gold ChromaDB (with automatic fallback to local)
-            client = get_chroma_client()
-
-            try:
-                collection = client.get_collection("business_opportunities")
-            except:
-                collection = client.create_collection(
-                    name="business_opportunities",
-                    metadata={"description": "Production business opportunities with AI analysis"}
-                )
+            return client.get_collection("business_opportunities")
+        except:
+            return client.create_collection(
+                name="business_opportunities",
+                metadata={"description": "Production business opportunities with AI analysis"}
+            )
 
+    def store_in_business_rag(self, opportunity: Dict, analysis: Dict) -> str:
+        """Step 3: Buffer for the business RAG (written in batches by self.writer)
+
+        Returns the document ID, or None if the document could not be built.
+        """
+        try:
             # Build document
             document = f"""
 # {opportunity['title']}
@@ -231,7 +313,7 @@ Respond ONLY with valid JSON."""
 {opportunity['description']}
 
 ## Metrics
-- Revenue Claim: {opportunity['revenue_claim']}
+- Revenue Claim: {self._revenue_claim(opportunity)}
 - Time to Market: {analysis['time_to_market']}
 - Initial Investment: {analysis['initial_investment']}
 - Automation Score: {analysis['automation_score']}/100
@@ -259,29 +341,44 @@ Respond ONLY with valid JSON."""
 - Discovered: {datetime.now().isoformat()}
 """
 
-            doc_id = f"opp_{datetime.now().timestamp()}_{hash(opportunity['url']) % 10000}"
+            # Stable per URL (per idea for Ask HN threads), so reruns update in place
+            doc_id = opportunity_doc_id(opportunity['url'], opportunity['source'], opportunity['title'])
 
-            collection.add(
-                ids=[doc_id],
-                documents=[document],
-                metadatas=[{
+            self.writer.add(
+                doc_id,
+                document,
+                {
                     "title": opportunity['title'],
                     "source": opportunity['source'],
                     "url": opportunity['url'],
-                    "revenue_claim": opportunity['revenue_claim'],
+                    "revenue_claim": self._revenue_claim(opportunity),
                     "automation_score": analysis['automation_score'],
                     "legitimacy_score": analysis['legitimacy_score'],
                     "recommended_action": analysis['recommended_action'],
-                    "created_at": datetime.now().isoformat()
-                }]
+                    "created_at": datetime.now().isoformat(),
+                    # Numeric investment/revenue/time fields, parsed once here
+                    **numeric_metadata(
+                        analysis.get('initial_investment'),
+                        analysis.get('time_to_market'),
+                        self._revenue_claim(opportunity),
+                    ),
+                }
             )
 
-            self.stats['stored'] += 1
-            print(f"   💾 Stored in RAG (Total: {collection.count()} opportunities)")
+            print(f"   💾 Queued for RAG")
+            return doc_id
 
         except Exception as e:
             print(f"   ❌ Storage failed: {e}")
             self.stats['failed'] += 1
+            return None
+
+    def _on_flush(self, ids: List[str], metadatas: List[Dict]):
+        """Writer callback: record stored URLs in the seen-URL index, trend aggregates and profile scores"""
+        entries = [self._pending_marks.pop(doc_id) for doc_id in ids if doc_id in self._pending_marks]
+        self.seen_index.mark_many(entries, self.collection)
+        self.trend_aggregates.record(ids, metadatas, self.collection)
+        self.score_index.record(ids, metadatas, self.collection)
 
     def run_full_pipeline(self):
         """Execute complete production pipeline"""
@@ -290,6 +387,9 @@ Respond ONLY with valid JSON."""
         print("=" * 70)
         print(f"Started: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
 
+        self.analysis_cache.reset_stats()
+        self.seen_index.reset_stats()
+
         # Step 1: Scrape
         opportunities = self.scrape_opportunities()
 
@@ -302,10 +402,61 @@ Respond ONLY with valid JSON."""
         print("🤖 STEP 2 & 3: ANALYZING WITH QWEN & STORING IN RAG")
         print("=" * 70)
 
-        for i, opp in enumerate(opportunities, 1):
-            print(f"\n[{i}/{len(opportunities)}]", end=" ")
-            analysis = self.analyze_with_qwen(opp)
-            self.store_in_business_rag(opp, analysis)
+        try:
+            self.collection = self._open_business_rag()
+        except Exception as e:
+            print(f"\n❌ Could not open business RAG: {e}")
+            return
+
+        # Already analyzed and stored with identical content: skip the LLM
+        digests = [
+            content_hash(
+                opp.get('title'),
+                opp.get('description'),
+                self._revenue_claim(opp),
+                opp.get('tech_stack')
+            )
+            for opp in opportunities
+        ]
+        # Per-idea keys: the ideas of one Ask HN thread share a URL
+        keys = [
+            analysis_key(opp['url'], opp.get('source', ''), opp.get('title', ''))
+            for opp in opportunities
+        ]
+        unchanged = [
+            self.seen_index.is_fresh(key, digest, self.collection)
+            for key, digest in zip(keys, digests)
+        ]
+
+        # Cached analyses for everything else, in one LLM cache round trip per
+        # chunk, keyed per idea so each is checked against its own fingerprint
+        cached_analyses = self.analysis_cache.get_many({
+            key: self._fingerprint(opp)
+            for opp, key, skip in zip(opportunities, keys, unchanged)
+            if not skip
+        })
+
+        # One client/collection for the whole run; the final partial batch is
+        # flushed when the block exits, even if a step raises
+        with BufferedChromaWriter(self.collection, batch_size=self.batch_size,
+                                  embedder=self.embedder, on_flush=self._on_flush) as self.writer:
+            for i, (opp, key, digest, skip) in enumerate(zip(opportunities, keys, digests, unchanged), 1):
+                print(f"\n[{i}/{len(opportunities)}]", end=" ")
+
+                if skip:
+                    print(f"⏭️  Unchanged, skipping: {opp['title'][:60]}")
+                    self.stats['skipped'] += 1
+                    continue
+
+                analysis = self.analyze_with_qwen(opp, cached_analyses.get(key))
+                doc_id = self.store_in_business_rag(opp, analysis)
+
+                # Fallback analyses are retried next run
+                if doc_id and analysis.get('analysis_model') != FALLBACK_MODEL:
+                    self._pending_marks[doc_id] = (key, digest)
+
+        self.stats['stored'] = self.writer.written
+        self.stats['failed'] += self.writer.failed
 
         # Summary
         print("\n" + "=" * 70)
@@ -315,7 +466,17 @@ Respond ONLY with valid JSON."""
         print(f"   • Scraped: {self.stats['scraped']}")
         print(f"   • Analyzed: {self.stats['analyzed']}")
         print(f"   • Stored: {self.stats['stored']}")
+        print(f"   • Skipped (unchanged): {self.stats['skipped']}")
         print(f"   • Failed: {self.stats['failed']}")
+        print(f"   • RAG writes: {self.writer.batches} batches in {self.writer.write_seconds:.2f}s "
+              f"(Total: {self.collection.count()} opportunities)")
+        embed_stats = self.embedder.stats()
+        if embed_stats['documents']:
+            print(f"   • Embeddings: {embed_stats['documents']} documents "
+                  f"({embed_stats['docs_per_sec']:.1f} docs/sec)")
+        cache_stats = self.analysis_cache.stats()
+        print(f"   • LLM cache: {cache_stats['hits']} hits / {cache_stats['misses']} misses "
+              f"({cache_stats['hit_rate']:.0%} hit rate)")
         print(f"\nCompleted: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
         print(f"Database: {RAG_BUSINESS_DB}")
         print("=" * 70)
@@ -326,7 +487,22 @@ if __name__ == "__main__":
 
     parser = argparse.ArgumentParser(description='Production Opportunity Research Pipeline')
     parser.add_argument('--demo', action='store_true', help='Use demo mode (no API keys required)')
+    parser.add_argument('--batch-size', type=int, default=DEFAULT_BATCH_SIZE,
+                        help=f'Documents per ChromaDB write (default: {DEFAULT_BATCH_SIZE})')
+    parser.add_argument('--embed-batch-size', type=int, default=DEFAULT_EMBED_BATCH_SIZE,
+                        help=f'Documents per embedding forward pass (default: {DEFAULT_EMBED_BATCH_SIZE})')
+    parser.add_argument('--embed-threads', type=int, default=None,
+                        help='CPU threads for embedding (default: all cores)')
+    parser.add_argument('--reprocess-older-than', type=float, default=None, metavar='DAYS',
+                        help='Re-analyze already-processed URLs last analyzed more than DAYS ago '
+                             '(default: only new or changed URLs; 0 = everything)')
     args = parser.parse_args()
 
-    pipeline = ProductionOpportunityPipeline(use_demo_mode=args.demo)
+    pipeline = ProductionOpportunityPipeline(
+        use_demo_mode=args.demo,
+        batch_size=args.batch_size,
+        embed_batch_size=args.embed_batch_size,
+        embed_threads=args.embed_threads,
+        reprocess_older_than_days=args.reprocess_older_than
+    )
     pipeline.run_full_pipeline()
@@ -34,7 +34,10 @@ def main():
     bot = PersonalizedOpportunityBot(entity)
 
     # Search
-    bot.search_opportunities(query, n_results=5)
+    try:
+        bot.search_opportunities(query, n_results=5)
+    finally:
+        bot.close()
 
 
 if __name__ == "__main__":
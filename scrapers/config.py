@@ -58,10 +58,26 @@ INDIEHACKERS_URLS = [
     "https://www.indiehackers.com/interviews",
 ]
 
-# Rate limiting (requests per minute)
-RATE_LIMIT_REDDIT = 30
-RATE_LIMIT_WEB = 10
+# Rate limiting (requests per minute), enforced per host by scrapers/rate_limit.py
+RATE_LIMIT_REDDIT = 30  # Public reddit.com pages
+RATE_LIMIT_REDDIT_OAUTH = 60  # Authenticated API budget (PRAW and the async client)
+RATE_LIMIT_WEB = 10  # Any other site, per host (Product Hunt's old 6s spacing)
+RATE_LIMIT_INDIEHACKERS = 30  # The 2s spacing the Indie Hackers scrapers used to sleep
 RATE_LIMIT_GOOGLE = 100  # Custom Search API limit
+RATE_LIMIT_GOOGLE_SCRAPE = 6  # google.com result pages (fallback scraping, blocks easily)
+RATE_LIMIT_HN = 300  # Firebase/Algolia item fetches (shared across concurrent requests)
+WEB_BURST = 1
+
+# Domain suffix -> (requests per minute, burst); a host uses its longest match
+HOST_RATE_LIMITS = {
+    "reddit.com": (RATE_LIMIT_REDDIT, 1),
+    "oauth.reddit.com": (RATE_LIMIT_REDDIT_OAUTH, 8),
+    "googleapis.com": (RATE_LIMIT_GOOGLE, 5),
+    "google.com": (RATE_LIMIT_GOOGLE_SCRAPE, 1),
+    "hacker-news.firebaseio.com": (RATE_LIMIT_HN, 10),
+    "hn.algolia.com": (RATE_LIMIT_HN, 10),
+    "indiehackers.com": (RATE_LIMIT_INDIEHACKERS, 1),
+}
 
 # Output settings
 MAX_OPPORTUNITIES_PER_SOURCE = 50
@@ -3,7 +3,8 @@
 Base Crawl4AI scraper with modern features
 - JavaScript rendering
 - Smart anti-bot handling
-- Concurrent crawling
+- Concurrent crawling over one pooled browser, paced per host by the shared
+  rate limiters (scrapers/rate_limit.py)
 - Retry logic with exponential backoff
 """
 
@@ -18,16 +19,142 @@ from datetime import datetime
 from urllib.parse import urlparse
 
 from models import CrawlResult, ScraperConfig
+from scrapers.extraction import CRAWL_REVENUE, CRAWL_TECH_STACK
+from scrapers.rate_limit import limiter_for
 
 logger = logging.getLogger(__name__)
 
 
+def build_browser_config(BrowserConfig: Any, config: ScraperConfig) -> Any:
+    """Browser settings shared by every crawler launched for a scraper config"""
+    return BrowserConfig(
+        headless=config.headless,
+        user_agent=config.user_agent,
+        viewport_width=1920,
+        viewport_height=1080,
+        extra_args=[
+            "--disable-gpu",
+            "--disable-dev-shm-usage",
+            "--no-sandbox",
+            "--disable-blink-features=AutomationControlled"
+        ]
+    )
+
+
+class CrawlerPool:
+    """
+    One long-lived headless browser shared by any number of scrapers
+
+    The browser is launched lazily on the first crawl and kept open until
+    close(), so Chromium startup is paid once per run instead of once per URL.
+    At most `max_pages` pages are open at a time.
+
+    Usage:
+        async with CrawlerPool(config) as pool:
+            indie = IndieHackersScraperModern(config, crawler_pool=pool)
+            google = GoogleDorkingScraperModern(config, crawler_pool=pool)
+            ...
+    """
+
+    def __init__(self, config: Optional[ScraperConfig] = None, max_pages: Optional[int] = None):
+        """
+        Args:
+            config: Scraper config (browser settings, default page limit)
+            max_pages: Concurrent pages (default: config.max_concurrent)
+        """
+        self.config = config or ScraperConfig()
+        self.max_pages = max_pages or self.config.max_concurrent
+
+        self._semaphore = asyncio.Semaphore(self.max_pages)
+        self._start_lock = asyncio.Lock()
+        self._crawler = None
+
+        # Run statistics
+        self.launches = 0
+        self.pages_crawled = 0
+
+    async def _get_crawler(self) -> Any:
+        """Start the browser on first use"""
+        if self._crawler is not None:
+            return self._crawler
+
+        async with self._start_lock:
+            if self._crawler is None:
+                from crawl4ai import AsyncWebCrawler, BrowserConfig
+
+                start_time = time.time()
+                crawler = AsyncWebCrawler(config=build_browser_config(BrowserConfig, self.config))
+                await crawler.start()
+
+                self._crawler = crawler
+                self.launches += 1
+                logger.info(
+                    f"🚀 Browser started in {time.time() - start_time:.1f}s "
+                    f"(max_pages={self.max_pages})"
+                )
+
+        return self._crawler
+
+    async def arun(self, url: str, config: Any) -> Any:
+        """Crawl one URL on the shared browser, waiting for the host's rate limit and a free page slot"""
+        limiter = limiter_for(url)
+        await limiter.acquire()  # Before taking a page, so waiting crawls don't hold one
+
+        async with self._semaphore:
+            crawler = await self._get_crawler()
+            result = await crawler.arun(url=url, config=config)
+            self.pages_crawled += 1
+
+        status = getattr(result, 'status_code', None)
+        if status:
+            limiter.feedback(status, getattr(result, 'response_headers', None))
+        return result
+
+    @property
+    def started(self) -> bool:
+        return self._crawler is not None
+
+    async def close(self):
+        """Shut the browser down (safe to call more than once)"""
+        async with self._start_lock:
+            if self._crawler is None:
+                return
+
+            crawler, self._crawler = self._crawler, None
+            try:
+                await crawler.close()
+            except Exception as e:
+                logger.warning(f"⚠️  Error closing browser: {e}")
+
+            logger.info(f"🛑 Browser closed after {self.pages_crawled} pages")
+
+    async def __aenter__(self) -> "CrawlerPool":
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.close()
+
+
 class Crawl4AIBase:
     """Base class for Crawl4AI-powered scrapers"""
 
-    def __init__(self, config: Optional[ScraperConfig] = None):
-        """Initialize Crawl4AI scraper"""
+    def __init__(
+        self,
+        config: Optional[ScraperConfig] = None,
+        crawler_pool: Optional[CrawlerPool] = None
+    ):
+        """
+        Initialize Crawl4AI scraper
+
+        Args:
+            config: Scraper configuration
+            crawler_pool: Browser pool shared with other scrapers in the run.
+                Without one, the scraper starts its own pool on first crawl
+                and shuts it down in close().
+        """
         self.config = config or ScraperConfig()
+        self._crawler_pool = crawler_pool
+        self._owns_pool = crawler_pool is None
         self._crawl4ai_available = False
         self._init_crawl4ai()
 
@@ -48,23 +175,30 @@ class Crawl4AIBase:
             logger.warning("Install with: pip install 'crawl4ai[all]'")
             self._crawl4ai_available = False
 
+    @property
+    def crawler_pool(self) -> CrawlerPool:
+        """Browser pool used for every crawl (created lazily if not shared)"""
+        if self._crawler_pool is None:
+            self._crawler_pool = CrawlerPool(self.config)
+        return self._crawler_pool
+
+    async def close(self):
+        """Shut down the browser if this scraper owns it"""
+        if self._owns_pool and self._crawler_pool is not None:
+            await self._crawler_pool.close()
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.close()
+
     def _get_browser_config(self) -> Any:
         """Get browser configuration"""
         if not self._crawl4ai_available:
             raise RuntimeError("Crawl4AI is not available")
 
-        return self.BrowserConfig(
-            headless=self.config.headless,
-            user_agent=self.config.user_agent,
-            viewport_width=1920,
-            viewport_height=1080,
-            extra_args=[
-                "--disable-gpu",
-                "--disable-dev-shm-usage",
-                "--no-sandbox",
-                "--disable-blink-features=AutomationControlled"
-            ]
-        )
+        return build_browser_config(self.BrowserConfig, self.config)
 
     def _get_crawler_config(self, session_id: Optional[str] = None) -> Any:
         """Get crawler run configuration"""
@@ -91,7 +225,7 @@ class Crawl4AIBase:
         extract_metadata: bool = True
     ) -> CrawlResult:
         """
-        Crawl a single URL with Crawl4AI
+        Crawl a single URL with Crawl4AI on the pooled browser
 
         Args:
             url: URL to crawl
@@ -111,49 +245,47 @@ class Crawl4AIBase:
         start_time = time.time()
 
         try:
-            browser_config = self._get_browser_config()
             crawler_config = self._get_crawler_config()
 
-            async with self.AsyncWebCrawler(config=browser_config) as crawler:
-                logger.info(f"🌐 Crawling: {url}")
+            logger.info(f"🌐 Crawling: {url}")
 
-                result = await crawler.arun(url=url, config=crawler_config)
+            result = await self.crawler_pool.arun(url, crawler_config)
 
-                if not result.success:
-                    raise Exception(result.error_message or "Crawl failed")
+            if not result.success:
+                raise Exception(result.error_message or "Crawl failed")
 
-                # Get markdown content
-                markdown = result.markdown_v2.raw_markdown if hasattr(result, 'markdown_v2') else result.markdown
+            # Get markdown content
+            markdown = result.markdown_v2.raw_markdown if hasattr(result, 'markdown_v2') else result.markdown
 
-                # Extract title
-                title = result.metadata.get('title', '') if hasattr(result, 'metadata') else ''
+            # Extract title
+            title = result.metadata.get('title', '') if hasattr(result, 'metadata') else ''
 
-                # Extract links if requested
-                links = []
-                if extract_links and hasattr(result, 'links'):
-                    links = [link.get('href', '') for link in result.links if link.get('href')]
+            # Extract links if requested
+            links = []
+            if extract_links and hasattr(result, 'links'):
+                links = [link.get('href', '') for link in result.links if link.get('href')]
 
-                # Extract images
-                images = []
-                if hasattr(result, 'media') and result.media:
-                    images = [img.get('src', '') for img in result.media.get('images', [])]
+            # Extract images
+            images = []
+            if hasattr(result, 'media') and result.media:
+                images = [img.get('src', '') for img in result.media.get('images', [])]
 
-                crawl_time_ms = int((time.time() - start_time) * 1000)
+            crawl_time_ms = int((time.time() - start_time) * 1000)
 
-                logger.info(f"✅ Crawled successfully: {url} ({crawl_time_ms}ms)")
+            logger.info(f"✅ Crawled successfully: {url} ({crawl_time_ms}ms)")
 
-                return CrawlResult(
-                    url=url,
-                    success=True,
-                    title=title,
-                    markdown=markdown,
-                    html=result.html if hasattr(result, 'html') else None,
-                    status_code=getattr(result, 'status_code', 200),
-                    links=links,
-                    images=images,
-                    crawl_time_ms=crawl_time_ms,
-                    timestamp=datetime.now()
-                )
+            return CrawlResult(
+                url=url,
+                success=True,
+                title=title,
+                markdown=markdown,
+                html=result.html if hasattr(result, 'html') else None,
+                status_code=getattr(result, 'status_code', 200),
+                links=links,
+                images=images,
+                crawl_time_ms=crawl_time_ms,
+                timestamp=datetime.now()
+            )
 
         except Exception as e:
             crawl_time_ms = int((time.time() - start_time) * 1000)
@@ -173,14 +305,17 @@ class Crawl4AIBase:
         extract_links: bool = True
     ) -> List[CrawlResult]:
         """
-        Crawl multiple URLs concurrently using Crawl4AI's efficient multi-URL crawling
+        Crawl multiple URLs concurrently on the pooled browser
+
+        Concurrency is bounded by the pool's page limit, which is shared with
+        any other scraper using the same pool.
 
         Args:
             urls: List of URLs to crawl
             extract_links: Whether to extract links
 
         Returns:
-            List of CrawlResults
+            List of CrawlResults, in input order
         """
         if not self._crawl4ai_available:
             return [
@@ -192,87 +327,21 @@ class Crawl4AIBase:
                 for url in urls
             ]
 
-        logger.info(f"🚀 Starting batch crawl of {len(urls)} URLs (max_concurrent={self.config.max_concurrent})")
-
-        try:
-            browser_config = self._get_browser_config()
-            crawler_config = self._get_crawler_config()
-
-            async with self.AsyncWebCrawler(config=browser_config) as crawler:
-                # Use Crawl4AI's native multi-URL crawling
-                start_time = time.time()
-                crawl_results = await crawler.acrawl_many(
-                    urls=urls,
-                    config=crawler_config,
-                    max_concurrent=self.config.max_concurrent
-                )
+        logger.info(f"🚀 Starting batch crawl of {len(urls)} URLs (max_pages={self.crawler_pool.max_pages})")
 
-                total_time = time.time() - start_time
-
-                # Process results
-                results = []
-                for i, (url, result) in enumerate(zip(urls, crawl_results), 1):
-                    try:
-                        if result.success:
-                            # Get markdown content
-                            markdown = result.markdown_v2.raw_markdown if hasattr(result, 'markdown_v2') else result.markdown
-
-                            # Extract title
-                            title = result.metadata.get('title', '') if hasattr(result, 'metadata') else ''
-
-                            # Extract links
-                            links = []
-                            if extract_links and hasattr(result, 'links'):
-                                links = [link.get('href', '') for link in result.links if link.get('href')]
-
-                            logger.info(f"[{i}/{len(urls)}] ✅ {url}")
-
-                            results.append(CrawlResult(
-                                url=url,
-                                success=True,
-                                title=title,
-                                markdown=markdown,
-                                html=result.html if hasattr(result, 'html') else None,
-                                status_code=getattr(result, 'status_code', 200),
-                                links=links,
-                                timestamp=datetime.now()
-                            ))
-                        else:
-                            logger.error(f"[{i}/{len(urls)}] ❌ {url}: {result.error_message}")
-                            results.append(CrawlResult(
-                                url=url,
-                                success=False,
-                                error=result.error_message,
-                                timestamp=datetime.now()
-                            ))
-                    except Exception as e:
-                        logger.error(f"[{i}/{len(urls)}] ❌ Error processing {url}: {e}")
-                        results.append(CrawlResult(
-                            url=url,
-                            success=False,
-                            error=str(e),
-                            timestamp=datetime.now()
-                        ))
-
-                successful = len([r for r in results if r.success])
-                logger.info(
-                    f"✅ Batch crawl complete: {successful}/{len(urls)} successful in {total_time:.2f}s "
-                    f"({len(urls)/total_time:.2f} URLs/sec)"
-                )
+        start_time = time.time()
+        results = await asyncio.gather(
+            *(self.crawl_url(url, extract_links=extract_links) for url in urls)
+        )
+        total_time = time.time() - start_time
 
-                return results
+        successful = len([r for r in results if r.success])
+        logger.info(
+            f"✅ Batch crawl complete: {successful}/{len(urls)} successful in {total_time:.2f}s "
+            f"({len(urls)/total_time if total_time else 0:.2f} URLs/sec)"
+        )
 
-        except Exception as e:
-            logger.error(f"❌ Batch crawl failed: {e}")
-            return [
-                CrawlResult(
-                    url=url,
-                    success=False,
-                    error=f"Batch crawl error: {str(e)}",
-                    timestamp=datetime.now()
-                )
-                for url in urls
-            ]
+        return list(results)
 
     def extract_revenue(self, text: str) -> Optional[tuple]:
         """
@@ -281,54 +350,20 @@ class Crawl4AIBase:
         Returns:
             Tuple of (revenue_claim, revenue_amount, revenue_period) or None
         """
-        # Patterns for revenue mentions
-        patterns = [
-            (r'\$\s*(\d+[,\d]*)\s*/?(?:per\s+)?(mo|month|mrr|monthly)', 'month'),
-            (r'\$\s*(\d+[,\d]*)\s*/?k\s*/?(?:per\s+)?(mo|month|mrr|monthly)', 'month', 1000),
-            (r'(\d+[,\d]*)\s*\$\s*/?(?:per\s+)?(mo|month|mrr|monthly)', 'month'),
-            (r'revenue.*?\$\s*(\d+[,\d]*)', 'unknown'),
-            (r'making.*?\$\s*(\d+[,\d]*)', 'unknown'),
-            (r'earning.*?\$\s*(\d+[,\d]*)', 'unknown'),
-            (r'(\d+[,\d]*)\s*\$\s*/?(?:per\s+)?(yr|year|arr|annual)', 'year'),
-            (r'\$\s*(\d+[,\d]*)\s*/?(?:per\s+)?(yr|year|arr|annual)', 'year'),
-        ]
-
-        for pattern_info in patterns:
-            pattern = pattern_info[0]
-            period = pattern_info[1]
-            multiplier = pattern_info[2] if len(pattern_info) > 2 else 1
-
-            match = re.search(pattern, text, re.IGNORECASE)
-            if match:
-                amount_str = match.group(1).replace(',', '')
-                try:
-                    amount = float(amount_str) * multiplier
-                    revenue_claim = f"${amount:,.0f}/{period}" if period != 'unknown' else f"${amount:,.0f}"
-                    return (revenue_claim, amount, period)
-                except ValueError:
-                    continue
+        mention = CRAWL_REVENUE.extract(text)
+        return mention.as_tuple() if mention else None
 
-        return None
+    def extract_revenue_many(self, texts: List[str]) -> List[Optional[tuple]]:
+        """extract_revenue() for a batch of texts (e.g. batch_crawl markdown)"""
+        return [mention.as_tuple() if mention else None for mention in CRAWL_REVENUE.extract_many(texts)]
 
     def extract_tech_stack(self, text: str) -> List[str]:
         """Extract technology mentions from text"""
-        tech_keywords = {
-            'Python', 'JavaScript', 'TypeScript', 'React', 'Next.js', 'Node.js',
-            'FastAPI', 'Django', 'Flask', 'Vue', 'Svelte', 'Tailwind',
-            'PostgreSQL', 'MongoDB', 'Redis', 'Stripe', 'GPT-4', 'OpenAI',
-            'Claude', 'AWS', 'Vercel', 'Supabase', 'Firebase', 'Docker',
-            'Kubernetes', 'GraphQL', 'REST', 'API', 'Llama', 'Anthropic',
-            'LangChain', 'Pinecone', 'Weaviate', 'ChromaDB', 'Hugging Face'
-        }
-
-        found_tech = []
-        text_upper = text.upper()
-
-        for tech in tech_keywords:
-            if tech.upper() in text_upper:
-                found_tech.append(tech)
+        return CRAWL_TECH_STACK.find(text)
 
-        return found_tech
+    def extract_tech_stack_many(self, texts: List[str]) -> List[List[str]]:
+        """extract_tech_stack() for a batch of texts (e.g. batch_crawl markdown)"""
+        return CRAWL_TECH_STACK.find_many(texts)
 
     def extract_time_to_build(self, text: str) -> Optional[str]:
         """Extract time-to-build mentions from text"""
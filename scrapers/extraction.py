@@ -0,0 +1,259 @@
+#!/usr/bin/env python3
+"""
+Revenue and tech-stack extraction shared by every scraper.
+
+Design decisions:
+- Patterns are compiled once, at import, instead of per call. Extractors are
+  module-level objects; scrapers keep their extract_revenue/extract_tech_stack
+  methods as thin wrappers that format the result the way they always have.
+- Revenue patterns are tried in priority order and the first one that yields
+  an amount wins (a "$X/mo" mention beats a loose "revenue ... $X"). Every
+  pattern needs a "$", so texts without one return None without running any.
+- Each legacy scraper keeps the pattern table it always had (Product Hunt
+  accepts "$X revenue", Hacker News also "$X ARR"), so precompiling changes
+  no extracted claim; test_modern_setup.test_revenue_extraction checks this
+  against the original per-call regexes on a sample corpus.
+- Tech keywords are matched on word boundaries, so "Go" no longer matches
+  "Google" and "REST" no longer matches "interest". Keywords that are plain
+  English words in lowercase ("Go", "REST", "Make") must appear in their
+  canonical casing. Results are in order of first appearance, which makes
+  "first 5 technologies" deterministic.
+- Each text is lowercased once. Every keyword is then located with a C
+  substring scan (str.find), and only candidate hits are confirmed against
+  the keyword's precompiled pattern and boundaries. CPython's re has no
+  multi-literal (Aho-Corasick) search, so a single combined alternation
+  checks branches at every character. It only won on texts under ~1 KB (by
+  microseconds) and was 1.3-1.5x slower on crawled pages, the hot path.
+- extract_many()/find_many() take a batch of texts (e.g. the markdown bodies
+  returned by Crawl4AIBase.batch_crawl) in one call.
+
+Usage:
+    from scrapers.extraction import CRAWL_REVENUE, CRAWL_TECH_STACK
+
+    mention = CRAWL_REVENUE.extract("Now at $5k/mo MRR")
+    mention.claim, mention.amount, mention.period   # ("$5,000/month", 5000.0, "month")
+
+    CRAWL_TECH_STACK.find("Built with Next.js, Supabase and Stripe")
+    # ["Next.js", "Supabase", "Stripe"]
+
+    CRAWL_TECH_STACK.find_many([page.markdown for page in pages])
+"""
+
+import re
+from dataclasses import dataclass
+from typing import Iterable, List, Optional, Sequence, Tuple
+
+# Keywords that are ordinary English words when lowercased ("go", "rest");
+# they only match in their canonical casing
+EXACT_CASE_KEYWORDS = frozenset({'Go', 'REST', 'Make', 'Notion'})
+
+
+
+# ---------------------------------------------------------------------------
+# Revenue
+# ---------------------------------------------------------------------------
+
+@dataclass(frozen=True)
+class RevenueMention:
+    """One revenue claim found in a text"""
+    amount: float  # in dollars, multipliers ("5k") applied
+    period: str    # "month", "year" or "unknown"
+    raw: str       # the number as written, e.g. "1,200"
+
+    @property
+    def claim(self) -> str:
+        """Display form, e.g. "$1,200/month" (no period when unknown)"""
+        if self.period == "unknown":
+            return f"${self.amount:,.0f}"
+        return f"${self.amount:,.0f}/{self.period}"
+
+    def as_tuple(self) -> Tuple[str, float, str]:
+        """(revenue_claim, revenue_amount, revenue_period), as Crawl4AIBase returns it"""
+        return (self.claim, self.amount, self.period)
+
+
+class RevenueExtractor:
+    """Ordered, precompiled revenue patterns"""
+
+    def __init__(self, patterns: Sequence[Tuple], min_amount: float = 0):
+        """
+        Args:
+            patterns: (regex, period) or (regex, period, multiplier) tuples in
+                priority order; group 1 of each regex is the amount
+            min_amount: Ignore matches below this amount (after multipliers)
+        """
+        self.min_amount = min_amount
+        self._patterns = [
+            (re.compile(pattern_info[0], re.IGNORECASE), pattern_info[1],
+             pattern_info[2] if len(pattern_info) > 2 else 1)
+            for pattern_info in patterns
+        ]
+        self._needs_dollar = all(r"\$" in pattern_info[0] for pattern_info in patterns)
+
+    def extract(self, text: str) -> Optional[RevenueMention]:
+        """First revenue claim in text by pattern priority, or None"""
+        if not text or (self._needs_dollar and "$" not in text):
+            return None
+
+        for pattern, period, multiplier in self._patterns:
+            match = pattern.search(text)
+            if not match:
+                continue
+
+            raw = match.group(1)
+            try:
+                amount = float(raw.replace(",", "")) * multiplier
+            except ValueError:
+                continue
+            if amount < self.min_amount:
+                continue
+
+            return RevenueMention(amount=amount, period=period, raw=raw)
+
+        return None
+
+    def extract_many(self, texts: Iterable[str]) -> List[Optional[RevenueMention]]:
+        """extract() for a batch of texts"""
+        return [self.extract(text) for text in texts]
+
+
+# Crawled pages and the modern scrapers: period-aware, "5k" understood
+REVENUE_PATTERNS = (
+    (r'\$\s*(\d+[,\d]*)\s*/?(?:per\s+)?(mo|month|mrr|monthly)', 'month'),
+    (r'\$\s*(\d+[,\d]*)\s*/?k\s*/?(?:per\s+)?(mo|month|mrr|monthly)', 'month', 1000),
+    (r'(\d+[,\d]*)\s*\$\s*/?(?:per\s+)?(mo|month|mrr|monthly)', 'month'),
+    (r'revenue.*?\$\s*(\d+[,\d]*)', 'unknown'),
+    (r'making.*?\$\s*(\d+[,\d]*)', 'unknown'),
+    (r'earning.*?\$\s*(\d+[,\d]*)', 'unknown'),
+    (r'(\d+[,\d]*)\s*\$\s*/?(?:per\s+)?(yr|year|arr|annual)', 'year'),
+    (r'\$\s*(\d+[,\d]*)\s*/?(?:per\s+)?(yr|year|arr|annual)', 'year'),
+)
+
+# Legacy scrapers, which report every claim as "$X/month", one table per source
+REDDIT_REVENUE_PATTERNS = (
+    (r'\$\s*(\d+[,\d]*)\s*/?(?:mo|month|mrr)', 'month'),
+    (r'(\d+[,\d]*)\s*\$\s*/?(?:mo|month|mrr)', 'month'),
+    (r'revenue.*?\$\s*(\d+[,\d]*)', 'month'),
+    (r'making.*?\$\s*(\d+[,\d]*)', 'month'),
+    (r'earning.*?\$\s*(\d+[,\d]*)', 'month'),
+)
+
+PRODUCTHUNT_REVENUE_PATTERNS = (
+    (r'\$\s*(\d+[,\d]*)\s*/?(?:mo|month|mrr|revenue)', 'month'),
+    (r'(\d+[,\d]*)\s*\$\s*/?(?:mo|month|mrr)', 'month'),
+    (r'making.*?\$\s*(\d+[,\d]*)', 'month'),
+    (r'earning.*?\$\s*(\d+[,\d]*)', 'month'),
+)
+
+HACKERNEWS_REVENUE_PATTERNS = (
+    (r'\$\s*(\d+[,\d]*)\s*/?(?:mo|month|mrr|arr|revenue)', 'month'),
+    (r'(\d+[,\d]*)\s*\$\s*/?(?:mo|month|mrr)', 'month'),
+    (r'making.*?\$\s*(\d+[,\d]*)', 'month'),
+    (r'earning.*?\$\s*(\d+[,\d]*)', 'month'),
+    (r'revenue.*?\$\s*(\d+[,\d]*)', 'month'),
+)
+
+INDIEHACKERS_REVENUE_PATTERNS = (
+    (r'\$\s*([\d,]+)\s*/?(?:mo|month|mrr)', 'month'),
+    (r'([\d,]+)\s*\$\s*/?(?:mo|month|mrr)', 'month'),
+)
+
+GOOGLE_REVENUE_PATTERNS = (
+    (r'\$\s*([\d,]+)\s*/?(?:mo|month|mrr|per month)', 'month'),
+    (r'([\d,]+)\s*\$\s*/?(?:mo|month|mrr)', 'month'),
+    (r'revenue.*?\$\s*([\d,]+)', 'month'),
+)
+
+
+# ---------------------------------------------------------------------------
+# Tech stack
+# ---------------------------------------------------------------------------
+
+class TechStackMatcher:
+    """Word-bounded technology keyword matcher"""
+
+    def __init__(self, keywords: Iterable[str], exact_case: Iterable[str] = EXACT_CASE_KEYWORDS):
+        """
+        Args:
+            keywords: Canonical technology names, e.g. "Next.js", "Hugging Face"
+            exact_case: Keywords that only match in their canonical casing
+        """
+        self.keywords = tuple(dict.fromkeys(keywords))
+        self.exact_case = frozenset(exact_case) & set(self.keywords)
+
+        # (keyword, first word to scan for, pattern confirming the full keyword)
+        self._scans = [
+            (keyword, keyword.lower().split()[0], re.compile(_keyword_regex(keyword) + r"(?!\w)"))
+            for keyword in self.keywords
+        ]
+
+    def find(self, text: str, limit: Optional[int] = None) -> List[str]:
+        """
+        Technologies mentioned in text, in order of first appearance
+
+        Args:
+            text: Text to scan
+            limit: Return at most this many (the first mentioned)
+        """
+        if not text:
+            return []
+
+        lowered = text.lower()
+        if len(lowered) != len(text):
+            # Non-ASCII case mapping changed the length; lowercase ASCII only
+            # so offsets line up with the original text
+            lowered = text.translate(_ASCII_LOWER)
+
+        first_seen = []
+        for keyword, head, confirm in self._scans:
+            position = lowered.find(head)
+            while position != -1:
+                if (
+                    (position == 0 or not _is_word_char(lowered[position - 1]))
+                    and confirm.match(lowered, position)
+                    and self._case_ok(keyword, text, position)
+                ):
+                    first_seen.append((position, keyword))
+                    break
+                position = lowered.find(head, position + 1)
+
+        first_seen.sort()
+        found = [keyword for _, keyword in first_seen]
+        return found if limit is None else found[:limit]
+
+    def find_many(self, texts: Iterable[str], limit: Optional[int] = None) -> List[List[str]]:
+        """find() for a batch of texts"""
+        return [self.find(text, limit) for text in texts]
+
+    def _case_ok(self, keyword: str, text: str, position: int) -> bool:
+        return keyword not in self.exact_case or text.startswith(keyword, position)
+
+
+def _keyword_regex(keyword: str) -> str:
+    """Lowercase regex for keyword; spaces match any run of whitespace"""
+    return re.escape(keyword.lower()).replace(r"\ ", r"\s+")
+
+
+def _is_word_char(char: str) -> bool:
+    return char.isalnum() or char == "_"
+
+
+_ASCII_LOWER = str.maketrans("ABCDEFGHIJKLMNOPQRSTUVWXYZ", "abcdefghijklmnopqrstuvwxyz")
+
+
+# Technologies recognised in every source
+TECH_KEYWORDS = (
+    'Python', 'JavaScript', 'TypeScript', 'React', 'Next.js', 'Node.js',
+    'FastAPI', 'Django', 'Flask', 'Vue', 'Svelte', 'Tailwind',
+    'PostgreSQL', 'MongoDB', 'Redis', 'Stripe', 'GPT-4', 'OpenAI',
+    'Claude', 'AWS', 'Vercel', 'Supabase', 'Firebase', 'Docker',
+)
+
+# Crawled pages and the modern scrapers: adds infrastructure and AI tooling
+CRAWL_TECH_KEYWORDS = TECH_KEYWORDS + (
+    'Kubernetes', 'GraphQL', 'REST', 'API', 'Llama', 'Anthropic',
+    'LangChain', 'Pinecone', 'Weaviate', 'ChromaDB', 'Hugging Face',
+)
+
+CRAWL_REVENUE = RevenueExtractor(REVENUE_PATTERNS)
+CRAWL_TECH_STACK = TechStackMatcher(CRAWL_TECH_KEYWORDS)
@@ -5,16 +5,18 @@ Uses Google Custom Search API
 """
 
 import re
-import time
 import requests
 from typing import List, Dict
 from datetime import datetime
 from scrapers.config import (
     GOOGLE_API_KEY,
     GOOGLE_CSE_ID,
-    GOOGLE_DORK_QUERIES,
-    RATE_LIMIT_GOOGLE
+    GOOGLE_DORK_QUERIES
 )
+from scrapers.extraction import GOOGLE_REVENUE_PATTERNS, RevenueExtractor
+from scrapers.rate_limit import get_sync
+
+_REVENUE = RevenueExtractor(GOOGLE_REVENUE_PATTERNS)
 
 
 class GoogleDorkingScraper:
@@ -37,18 +39,8 @@ class GoogleDorkingScraper:
 
     def extract_revenue(self, text: str) -> str:
         """Extract revenue mentions from text"""
-        patterns = [
-            r'\$\s*([\d,]+)\s*/?(?:mo|month|mrr|per month)',
-            r'([\d,]+)\s*\$\s*/?(?:mo|month|mrr)',
-            r'revenue.*?\$\s*([\d,]+)',
-        ]
-
-        for pattern in patterns:
-            match = re.search(pattern, text, re.IGNORECASE)
-            if match:
-                return f"${match.group(1)}/month"
-
-        return "Not specified"
+        mention = _REVENUE.extract(text)
+        return f"${mention.raw}/month" if mention else "Not specified"
 
     def search_with_api(self, query: str, num_results: int = 10) -> List[Dict]:
         """Search using Google Custom Search API"""
@@ -62,7 +54,7 @@ class GoogleDorkingScraper:
                 'num': min(num_results, 10)  # API limit per request
             }
 
-            response = requests.get(self.base_url, params=params, timeout=30)
+            response = get_sync(self.base_url, params=params, timeout=30)
 
             if response.status_code == 200:
                 data = response.json()
@@ -84,8 +76,8 @@ class GoogleDorkingScraper:
                     results.append(result)
 
             elif response.status_code == 429:
-                print(f"    ⚠️  Rate limit exceeded, waiting...")
-                time.sleep(60)
+                # The googleapis.com limiter pauses for Retry-After and slows down
+                print(f"    ⚠️  Rate limit exceeded, backing off")
             else:
                 print(f"    ❌ API error: {response.status_code}")
 
@@ -106,7 +98,8 @@ class GoogleDorkingScraper:
             }
 
             search_url = f"https://www.google.com/search?q={requests.utils.quote(query)}"
-            response = requests.get(search_url, headers=headers, timeout=30)
+            # google.com is limited to RATE_LIMIT_GOOGLE_SCRAPE to avoid blocks
+            response = get_sync(search_url, headers=headers, timeout=30)
 
             # Very basic parsing (Google changes HTML frequently)
             # This is intentionally limited - prefer using the API
@@ -138,8 +131,6 @@ class GoogleDorkingScraper:
                 except:
                     continue
 
-            time.sleep(10)  # Longer delay to avoid blocks
-
         except Exception as e:
             print(f"    ❌ Scraping error: {e}")
 
@@ -163,8 +154,6 @@ class GoogleDorkingScraper:
             all_opportunities.extend(results)
             print(f"    ✅ Found {len(results)} results")
 
-            time.sleep(2)  # Rate limiting
-
         # Remove duplicates
         seen_urls = set()
         unique_opportunities = []
@@ -7,7 +7,7 @@ Uses Google Custom Search API + Crawl4AI for content extraction
 import asyncio
 import requests
 from datetime import datetime
-from typing import List, Optional
+from typing import AsyncIterator, List, Optional
 
 from models import (
     Opportunity,
@@ -15,7 +15,8 @@ from models import (
     OpportunitySource,
     ScraperConfig
 )
-from scrapers.crawl4ai_base import Crawl4AIBase
+from scrapers.crawl4ai_base import Crawl4AIBase, CrawlerPool
+from scrapers.rate_limit import limiter_for
 from scrapers.config import (
     GOOGLE_API_KEY,
     GOOGLE_CSE_ID,
@@ -31,9 +32,13 @@ logger = logging.getLogger(__name__)
 class GoogleDorkingScraperModern(Crawl4AIBase):
     """Modern Google dorking scraper with API and Crawl4AI"""
 
-    def __init__(self, config: Optional[ScraperConfig] = None):
-        """Initialize Google dorking scraper"""
-        super().__init__(config)
+    def __init__(
+        self,
+        config: Optional[ScraperConfig] = None,
+        crawler_pool: Optional[CrawlerPool] = None
+    ):
+        """Initialize Google dorking scraper (optionally on a browser pool shared across scrapers)"""
+        super().__init__(config, crawler_pool)
 
         self.api_key = GOOGLE_API_KEY
         self.cse_id = GOOGLE_CSE_ID
@@ -75,7 +80,11 @@ class GoogleDorkingScraperModern(Crawl4AIBase):
 
             logger.info(f"  🔎 Searching: {query[:60]}...")
 
-            response = requests.get(self.base_url, params=params, timeout=30)
+            # Off the event loop so other streaming sources keep going
+            limiter = limiter_for(self.base_url)
+            await limiter.acquire()
+            response = await asyncio.to_thread(requests.get, self.base_url, params=params, timeout=30)
+            limiter.feedback(response.status_code, response.headers)
 
             if response.status_code == 200:
                 data = response.json()
@@ -144,8 +153,8 @@ class GoogleDorkingScraperModern(Crawl4AIBase):
                 logger.info(f"  ✅ Found {len(opportunities)} results")
 
             elif response.status_code == 429:
-                logger.warning("  ⚠️  Rate limit exceeded, waiting...")
-                await asyncio.sleep(60)
+                # The limiter pauses for Retry-After and slows down
+                logger.warning("  ⚠️  Rate limit exceeded, backing off")
             else:
                 logger.error(f"  ❌ API error: {response.status_code}")
 
@@ -188,22 +197,27 @@ class GoogleDorkingScraperModern(Crawl4AIBase):
         urls = [str(opp.metadata.source_url) for opp in to_enrich]
         crawl_results = await self.batch_crawl(urls)
 
+        # Extract tech stack and revenue from every crawled page in one batch
+        markdowns = [result.markdown if result.success and result.markdown else "" for result in crawl_results]
+        tech_per_page = self.extract_tech_stack_many(markdowns)
+        revenue_per_page = self.extract_revenue_many(markdowns)
+
         # Enrich with crawled content
-        for opp, result in zip(to_enrich, crawl_results):
+        for opp, result, additional_tech, revenue_info in zip(
+            to_enrich, crawl_results, tech_per_page, revenue_per_page
+        ):
             if result.success and result.markdown:
                 # Update description with more complete content
                 if len(result.markdown) > len(opp.metadata.description):
                     opp.metadata.description = result.markdown[:2000]
 
-                # Extract additional tech stack
-                additional_tech = self.extract_tech_stack(result.markdown)
+                # Add additional tech stack
                 for tech in additional_tech:
                     if tech not in opp.metadata.tech_stack:
                         opp.metadata.tech_stack.append(tech)
 
-                # Try to extract revenue if not found
+                # Use the page's revenue if none was found
                 if not opp.metadata.revenue_claim:
-                    revenue_info = self.extract_revenue(result.markdown)
                     if revenue_info:
                         revenue_claim, revenue_amount, revenue_period = revenue_info
                         opp.metadata.revenue_claim = revenue_claim
@@ -238,8 +252,6 @@ class GoogleDorkingScraperModern(Crawl4AIBase):
             results = await self.search_with_api(query, num_results=10)
             all_opportunities.extend(results)
 
-            await asyncio.sleep(1)  # Rate limiting
-
             if len(all_opportunities) >= MAX_OPPORTUNITIES_PER_SOURCE:
                 logger.info(f"📊 Reached limit of {MAX_OPPORTUNITIES_PER_SOURCE} opportunities")
                 break
@@ -263,6 +275,44 @@ class GoogleDorkingScraperModern(Crawl4AIBase):
 
         return unique_opportunities
 
+    async def stream_all(self, enrich_content: bool = False) -> AsyncIterator[Opportunity]:
+        """
+        Stream unique opportunities query by query
+
+        Args:
+            enrich_content: Whether to enrich each query's results with full page content
+
+        Yields:
+            Validated Opportunities as each dork query returns
+        """
+        logger.info("\n🔍 GOOGLE DORKING STREAMING (Modern with API + Crawl4AI)")
+
+        if not self.use_api:
+            logger.error("❌ Google Custom Search API not configured, skipping")
+            return
+
+        seen_urls = set()
+
+        for query in GOOGLE_DORK_QUERIES:
+            results = await self.search_with_api(query, num_results=10)
+
+            new_results = []
+            for opp in results:
+                url = str(opp.metadata.source_url)
+                if url not in seen_urls and len(seen_urls) < MAX_OPPORTUNITIES_PER_SOURCE:
+                    seen_urls.add(url)
+                    new_results.append(opp)
+
+            if enrich_content and new_results:
+                new_results = await self.enrich_with_content(new_results, max_concurrent=5)
+
+            for opp in new_results:
+                yield opp
+
+            if len(seen_urls) >= MAX_OPPORTUNITIES_PER_SOURCE:
+                logger.info(f"📊 Reached limit of {MAX_OPPORTUNITIES_PER_SOURCE} opportunities")
+                break
+
 
 async def main():
     """Test the modern Google dorking scraper"""
@@ -271,8 +321,8 @@ async def main():
         format='%(asctime)s - %(levelname)s - %(message)s'
     )
 
-    scraper = GoogleDorkingScraperModern()
-    opportunities = await scraper.scrape_all(enrich_content=True)
+    async with GoogleDorkingScraperModern() as scraper:
+        opportunities = await scraper.scrape_all(enrich_content=True)
 
     # Print samples
     print("\n" + "=" * 70)
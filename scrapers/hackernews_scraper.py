@@ -2,38 +2,112 @@
 """
 Hacker News scraper for automation opportunities
 Scrapes "Show HN", "Ask HN", and posts mentioning revenue/automation
+
+Async-native: one keep-alive aiohttp session per run, story and comment items
+fetched concurrently under the shared per-host rate limits, comment trees walked
+breadth-first within a depth/count budget, Algolia queries run in parallel.
+The synchronous scrape_* methods wrap the async ones and return the same dicts.
 """
 
+import asyncio
+import logging
 import re
-import time
-import requests
+from collections import deque
 from datetime import datetime
-from typing import List, Dict
+from typing import AsyncIterator, Dict, List, Optional
+
+import aiohttp
+
 from scrapers.config import (
-    RATE_LIMIT_WEB,
     MAX_OPPORTUNITIES_PER_SOURCE,
     MIN_REVENUE_MENTION
 )
+from scrapers.extraction import HACKERNEWS_REVENUE_PATTERNS, TECH_KEYWORDS, RevenueExtractor, TechStackMatcher
+from scrapers.rate_limit import limiter_for
+
+logger = logging.getLogger(__name__)
+
+# Max HN requests in flight at once
+HN_CONCURRENCY = 10
+
+# Comment tree walk per story (breadth-first: top-level comments, then
+# replies). Comments are fetched COMMENT_BATCH at a time, as many as the old
+# sequential read took, and the walk stops once COMMENT_TEXT_LIMIT characters
+# of text are collected, so a thread usually costs 5-10 requests
+COMMENT_MAX_DEPTH = 2
+COMMENT_MAX_ITEMS = 20
+COMMENT_BATCH = 5
+COMMENT_TEXT_LIMIT = 1000
+
+_REVENUE = RevenueExtractor(HACKERNEWS_REVENUE_PATTERNS, min_amount=MIN_REVENUE_MENTION)
+_TECH_STACK = TechStackMatcher(TECH_KEYWORDS + ('Go', 'Rust', 'Ruby', 'Rails', 'Kubernetes'))
+
+# Ask HN answers like "I built X and make $Y"
+_OPPORTUNITY_PATTERNS = [
+    re.compile(r"(?:I|We)\s+(?:built|made|created|launched)\s+([^.!?]{10,100})", re.IGNORECASE),
+    re.compile(r"(?:my|our)\s+(?:side project|saas|tool|app)\s+([^.!?]{10,100})", re.IGNORECASE),
+]
 
 
 class HackerNewsScraper:
-    def __init__(self):
-        """Initialize Hacker News scraper using Algolia Search API"""
+    def __init__(self, concurrency: int = HN_CONCURRENCY):
+        """
+        Initialize Hacker News scraper using the Firebase and Algolia Search APIs
+
+        Requests are paced per host by scrapers/rate_limit.py (RATE_LIMIT_HN
+        for both APIs, see HOST_RATE_LIMITS).
+
+        Args:
+            concurrency: Max HN requests in flight at once
+        """
         self.api_base = "https://hacker-news.firebaseio.com/v0"
         self.algolia_api = "https://hn.algolia.com/api/v1"
         self.opportunities = []
-
-    def get_story(self, story_id: int) -> Dict:
-        """Fetch a story by ID"""
+        self.concurrency = concurrency
+
+    def _session(self) -> aiohttp.ClientSession:
+        """One keep-alive session for a whole scrape"""
+        return aiohttp.ClientSession(
+            connector=aiohttp.TCPConnector(limit=self.concurrency),
+            timeout=aiohttp.ClientTimeout(total=10)
+        )
+
+    async def _get_json(self, session: aiohttp.ClientSession, url: str, params: Optional[Dict] = None):
+        """GET a JSON document under the host's rate limit; None on any failure"""
+        limiter = limiter_for(url)
+        await limiter.acquire()
         try:
-            response = requests.get(f"{self.api_base}/item/{story_id}.json", timeout=10)
-            if response.status_code == 200:
-                return response.json()
+            async with session.get(url, params=params) as response:
+                limiter.feedback(response.status, response.headers)
+                if response.status == 200:
+                    return await response.json()
+                logger.debug(f"HN request {url} returned HTTP {response.status}")
         except Exception as e:
-            pass
+            logger.warning(f"⚠️  HN request {url} failed: {e}")
         return None
 
-    def search_algolia(self, query: str, tags: str = None) -> List[Dict]:
+    async def aget_story(self, session: aiohttp.ClientSession, story_id: int) -> Dict:
+        """Fetch a story (or comment) by ID"""
+        return await self._get_json(session, f"{self.api_base}/item/{story_id}.json")
+
+    async def aget_stories(self, session: aiohttp.ClientSession, story_ids: List[int]) -> List[Dict]:
+        """Fetch several items concurrently, in input order (None for failures)"""
+        return await asyncio.gather(*(self.aget_story(session, story_id) for story_id in story_ids))
+
+    def get_story(self, story_id: int) -> Dict:
+        """Fetch a story by ID"""
+        return asyncio.run(self._with_session(self.aget_story, story_id))
+
+    async def _with_session(self, method, *args, **kwargs):
+        async with self._session() as session:
+            return await method(session, *args, **kwargs)
+
+    async def asearch_algolia(
+        self,
+        session: aiohttp.ClientSession,
+        query: str,
+        tags: str = None
+    ) -> List[Dict]:
         """Search HN using Algolia API"""
         opportunities = []
 
@@ -44,29 +118,29 @@ class HackerNewsScraper:
                 'hitsPerPage': 30
             }
 
-            response = requests.get(f"{self.algolia_api}/search", params=params, timeout=10)
-            if response.status_code != 200:
+            data = await self._get_json(session, f"{self.algolia_api}/search", params=params)
+            if data is None:
                 return []
 
-            data = response.json()
             hits = data.get('hits', [])
 
             print(f"    Found {len(hits)} results for '{query}'")
 
             for hit in hits:
                 title = hit.get('title', '')
-                url = hit.get('url', f"https://news.ycombinator.com/item?id={hit.get('objectID')}")
-                story_text = hit.get('story_text', '')
+                url = hit.get('url') or f"https://news.ycombinator.com/item?id={hit.get('objectID')}"
+                story_text = hit.get('story_text') or ''
 
                 # Create opportunity
                 full_text = f"{title} {story_text}"
+                revenue = self.extract_revenue(full_text)
                 opportunity = {
                     'title': title,
                     'description': story_text[:500] if story_text else title,
                     'url': url,
                     'source': 'Hacker News',
-                    'revenue_claim': self.extract_revenue(full_text),
-                    'revenue_potential': self.extract_revenue(full_text),
+                    'revenue_claim': revenue,
+                    'revenue_potential': revenue,
                     'tech_stack': self.extract_tech_stack(full_text),
                     'scraped_date': datetime.now().isoformat(),
                     'tags': ['hacker-news', 'algolia-search']
@@ -82,182 +156,161 @@ class HackerNewsScraper:
 
         return opportunities
 
-    def scrape_show_hn(self, limit: int = 100) -> List[Dict]:
-        """Scrape 'Show HN' posts using Algolia search"""
-        opportunities = []
+    def search_algolia(self, query: str, tags: str = None) -> List[Dict]:
+        """Search HN using Algolia API"""
+        return asyncio.run(self._with_session(self.asearch_algolia, query, tags))
+
+    async def ascrape_show_hn(self, session: aiohttp.ClientSession, limit: int = 100) -> List[Dict]:
+        """Scrape 'Show HN' posts, running all Algolia queries in parallel"""
+        # Search for Show HN posts with automation/revenue keywords
+        search_queries = [
+            ('Show HN automation', 'show_hn'),
+            ('Show HN side project revenue', 'show_hn'),
+            ('Show HN saas', 'show_hn'),
+            ('Show HN passive income', 'show_hn'),
+            ('Show HN built', 'show_hn'),
+        ]
 
         try:
-            # Search for Show HN posts with automation/revenue keywords
-            search_queries = [
-                ('Show HN automation', 'show_hn'),
-                ('Show HN side project revenue', 'show_hn'),
-                ('Show HN saas', 'show_hn'),
-                ('Show HN passive income', 'show_hn'),
-                ('Show HN built', 'show_hn'),
-            ]
-
-            for query, tags in search_queries:
-                results = self.search_algolia(query, tags)
-                opportunities.extend(results)
-
-                if len(opportunities) >= limit:
-                    break
-
-                time.sleep(1)
+            results = await asyncio.gather(
+                *(self.asearch_algolia(session, query, tags) for query, tags in search_queries)
+            )
+        except Exception as e:
+            print(f"    ⚠️  Error scraping Show HN: {e}")
+            return []
 
-            # Remove duplicates by URL
-            seen_urls = set()
-            unique_opps = []
+        # Remove duplicates by URL (first query wins)
+        seen_urls = set()
+        unique_opps = []
+        for opportunities in results:
             for opp in opportunities:
                 if opp['url'] not in seen_urls:
                     seen_urls.add(opp['url'])
                     unique_opps.append(opp)
 
-            return unique_opps[:limit]
-
-            for idx, story_id in enumerate(story_ids):
-                try:
-                    story = self.get_story(story_id)
-                    if not story:
-                        continue
-
-                    title = story.get('title', '')
-                    url = story.get('url', f"https://news.ycombinator.com/item?id={story_id}")
-                    text = story.get('text', '')
-
-                    # Filter for relevant posts
-                    is_show_hn = title.lower().startswith('show hn')
-                    is_launch = any(kw in title.lower() for kw in ['launch', 'built', 'made', 'created'])
-
-                    combined_text = f"{title} {text}"
-
-                    # Check for automation/revenue keywords
-                    automation_keywords = ['automat', 'passive', 'saas', 'ai tool', 'side project', 'revenue', 'mrr']
-                    is_relevant = any(kw in combined_text.lower() for kw in automation_keywords)
-
-                    if (is_show_hn or is_launch) and is_relevant:
-                        # Fetch comments to get more details
-                        comments_text = self.fetch_comments(story.get('kids', [])[:10])
-
-                        full_text = f"{title} {text} {comments_text}"
-
-                        opportunity = {
-                            'title': title.replace('Show HN: ', '').replace('Launch HN: ', ''),
-                            'description': text[:500] if text else title,
-                            'url': url,
-                            'source': 'Hacker News',
-                            'revenue_potential': self.extract_revenue(full_text),
-                            'tech_stack': self.extract_tech_stack(full_text),
-                            'scraped_date': datetime.now().isoformat(),
-                            'tags': ['hacker-news', 'show-hn' if is_show_hn else 'launch']
-                        }
-
-                        opportunities.append(opportunity)
-                        print(f"      ✓ Found: {opportunity['title'][:50]}...")
+        return unique_opps[:limit]
 
-                        if len(opportunities) >= MAX_OPPORTUNITIES_PER_SOURCE:
-                            return opportunities
-
-                    # Rate limiting
-                    if idx % 10 == 0:
-                        time.sleep(1)
-
-                except Exception as e:
+    def scrape_show_hn(self, limit: int = 100) -> List[Dict]:
+        """Scrape 'Show HN' posts using Algolia search"""
+        return asyncio.run(self._with_session(self.ascrape_show_hn, limit))
+
+    async def afetch_comments(
+        self,
+        session: aiohttp.ClientSession,
+        comment_ids: List[int],
+        max_depth: int = COMMENT_MAX_DEPTH,
+        max_comments: int = COMMENT_MAX_ITEMS
+    ) -> str:
+        """
+        Fetch comment text breadth-first for additional context
+
+        Comments are fetched COMMENT_BATCH at a time, concurrently within a
+        batch. The walk stops once COMMENT_TEXT_LIMIT characters are
+        collected, or at max_depth levels or max_comments comments.
+        """
+        texts = []
+        collected = 0
+        fetched = 0
+        queue = deque((comment_id, 1) for comment_id in comment_ids)
+
+        while queue and fetched < max_comments and collected < COMMENT_TEXT_LIMIT:
+            batch = [queue.popleft() for _ in range(min(COMMENT_BATCH, len(queue), max_comments - fetched))]
+            comments = await self.aget_stories(session, [comment_id for comment_id, _ in batch])
+            fetched += len(batch)
+
+            for (_, depth), comment in zip(batch, comments):
+                if not comment:
                     continue
+                if 'text' in comment:
+                    texts.append(comment['text'])
+                    collected += len(comment['text']) + 1
+                if depth < max_depth:
+                    queue.extend((kid, depth + 1) for kid in comment.get('kids', []))
 
-        except Exception as e:
-            print(f"    ⚠️  Error scraping Show HN: {e}")
-
-        return opportunities
+        return (" " + " ".join(texts) if texts else "")[:COMMENT_TEXT_LIMIT]  # Limit total comment text
 
     def fetch_comments(self, comment_ids: List[int]) -> str:
         """Fetch comment text for additional context"""
-        comments_text = ""
-
-        for comment_id in comment_ids[:5]:  # Limit to first 5 comments
-            try:
-                comment = self.get_story(comment_id)
-                if comment and 'text' in comment:
-                    comments_text += " " + comment['text']
-            except Exception:
-                continue
+        return asyncio.run(self._with_session(self.afetch_comments, comment_ids))
 
-        return comments_text[:1000]  # Limit total comment text
-
-    def scrape_ask_hn(self, limit: int = 50) -> List[Dict]:
-        """Scrape 'Ask HN' posts about making money/side projects"""
-        opportunities = []
+    async def aiter_ask_hn(self, session: aiohttp.ClientSession, limit: int = 50) -> AsyncIterator[Dict]:
+        """Yield 'Ask HN' opportunities, fetching stories and their comments concurrently"""
+        found = 0
 
         try:
             # Get Ask HN stories
-            response = requests.get(f"{self.api_base}/askstories.json", timeout=10)
-            if response.status_code != 200:
+            story_ids = await self._get_json(session, f"{self.api_base}/askstories.json")
+            if story_ids is None:
                 print("    ⚠️  Failed to fetch Ask HN stories")
-                return []
+                return
 
-            story_ids = response.json()[:limit]
+            story_ids = story_ids[:limit]
             print(f"    Checking {len(story_ids)} Ask HN stories...")
 
-            for story_id in story_ids:
-                try:
-                    story = self.get_story(story_id)
-                    if not story:
-                        continue
+            stories = await self.aget_stories(session, story_ids)
 
-                    title = story.get('title', '')
-                    text = story.get('text', '')
-
-                    # Filter for revenue/side project discussions
-                    money_keywords = ['make money', 'side project', 'revenue', 'mrr', 'passive income', 'automation', 'profitable']
-                    is_relevant = any(kw in title.lower() for kw in money_keywords)
-
-                    if is_relevant:
-                        # Fetch top comments for opportunities
-                        comments_text = self.fetch_comments(story.get('kids', [])[:20])
+            # Filter for revenue/side project discussions
+            money_keywords = ['make money', 'side project', 'revenue', 'mrr', 'passive income', 'automation', 'profitable']
+            relevant = [
+                (story_id, story) for story_id, story in zip(story_ids, stories)
+                if story and any(kw in story.get('title', '').lower() for kw in money_keywords)
+            ]
 
-                        # Extract opportunities from comments
-                        comment_opportunities = self.extract_opportunities_from_text(
-                            f"{title} {text} {comments_text}",
-                            f"https://news.ycombinator.com/item?id={story_id}"
-                        )
+            # Fetch top comments for every relevant thread at once, yield in story order
+            comment_tasks = [
+                asyncio.create_task(self.afetch_comments(session, story.get('kids', [])[:20]))
+                for _, story in relevant
+            ]
 
-                        opportunities.extend(comment_opportunities)
+            try:
+                for (story_id, story), comment_task in zip(relevant, comment_tasks):
+                    comments_text = await comment_task
 
-                        if len(opportunities) >= MAX_OPPORTUNITIES_PER_SOURCE:
-                            return opportunities
+                    # Extract opportunities from comments
+                    comment_opportunities = self.extract_opportunities_from_text(
+                        f"{story.get('title', '')} {story.get('text', '')} {comments_text}",
+                        f"https://news.ycombinator.com/item?id={story_id}"
+                    )
 
-                    time.sleep(1)
+                    for opp in comment_opportunities:
+                        found += 1
+                        yield opp
 
-                except Exception as e:
-                    continue
+                    if found >= MAX_OPPORTUNITIES_PER_SOURCE:
+                        return
+            finally:
+                for comment_task in comment_tasks:
+                    comment_task.cancel()
 
         except Exception as e:
             print(f"    ⚠️  Error scraping Ask HN: {e}")
 
-        return opportunities
+    async def ascrape_ask_hn(self, session: aiohttp.ClientSession, limit: int = 50) -> List[Dict]:
+        """Scrape 'Ask HN' posts about making money/side projects"""
+        return [opp async for opp in self.aiter_ask_hn(session, limit)]
+
+    def scrape_ask_hn(self, limit: int = 50) -> List[Dict]:
+        """Scrape 'Ask HN' posts about making money/side projects"""
+        return asyncio.run(self._with_session(self.ascrape_ask_hn, limit))
 
     def extract_opportunities_from_text(self, text: str, source_url: str) -> List[Dict]:
         """Extract opportunity mentions from text"""
         opportunities = []
+        revenue = None  # same for every idea in the thread; extracted on first use
 
-        # Look for patterns like "I built X and make $Y"
-        patterns = [
-            r"(?:I|We)\s+(?:built|made|created|launched)\s+([^.!?]{10,100})",
-            r"(?:my|our)\s+(?:side project|saas|tool|app)\s+([^.!?]{10,100})",
-        ]
-
-        for pattern in patterns:
-            matches = re.finditer(pattern, text, re.IGNORECASE)
-            for match in matches:
+        for pattern in _OPPORTUNITY_PATTERNS:
+            for match in pattern.finditer(text):
                 description = match.group(1).strip()
 
                 if len(description) > 20:  # Meaningful description
+                    if revenue is None:
+                        revenue = self.extract_revenue(text)
                     opportunity = {
                         'title': description[:100],
                         'description': description[:500],
                         'url': source_url,
                         'source': 'Hacker News (Ask HN)',
-                        'revenue_potential': self.extract_revenue(text),
+                        'revenue_potential': revenue,
                         'tech_stack': self.extract_tech_stack(description),
                         'scraped_date': datetime.now().isoformat(),
                         'tags': ['hacker-news', 'ask-hn']
@@ -268,67 +321,52 @@ class HackerNewsScraper:
 
     def extract_revenue(self, text: str) -> str:
         """Extract revenue mentions from text"""
-        patterns = [
-            r'\$\s*(\d+[,\d]*)\s*/?(?:mo|month|mrr|arr|revenue)',
-            r'(\d+[,\d]*)\s*\$\s*/?(?:mo|month|mrr)',
-            r'making.*?\$\s*(\d+[,\d]*)',
-            r'earning.*?\$\s*(\d+[,\d]*)',
-            r'revenue.*?\$\s*(\d+[,\d]*)',
-        ]
-
-        for pattern in patterns:
-            match = re.search(pattern, text, re.IGNORECASE)
-            if match:
-                amount = match.group(1).replace(',', '')
-                try:
-                    if int(amount) >= MIN_REVENUE_MENTION:
-                        return f"${amount}/month"
-                except ValueError:
-                    continue
-
-        return "Not specified"
+        mention = _REVENUE.extract(text)
+        return f"${mention.raw.replace(',', '')}/month" if mention else "Not specified"
 
     def extract_tech_stack(self, text: str) -> str:
         """Extract technology mentions"""
-        tech_keywords = {
-            'Python', 'JavaScript', 'TypeScript', 'React', 'Next.js', 'Node.js',
-            'Go', 'Rust', 'Ruby', 'Rails', 'Django', 'Flask', 'Vue', 'Svelte',
-            'PostgreSQL', 'MongoDB', 'Redis', 'Stripe', 'GPT-4', 'OpenAI',
-            'Claude', 'AWS', 'Vercel', 'Supabase', 'Firebase', 'Docker',
-            'Kubernetes', 'Tailwind', 'FastAPI'
-        }
+        found_tech = _TECH_STACK.find(text, limit=5)
+        return ', '.join(found_tech) if found_tech else "Not specified"
 
-        found_tech = []
-        text_upper = text.upper()
+    async def stream_all(self) -> AsyncIterator[Dict]:
+        """Yield opportunities from Show HN, then Ask HN, as they are found"""
+        print("\n🧡 HACKER NEWS SCRAPING:")
+        print("=" * 60)
 
-        for tech in tech_keywords:
-            if tech.upper() in text_upper:
-                found_tech.append(tech)
+        total = 0
 
-        return ', '.join(found_tech[:5]) if found_tech else "Not specified"
+        async with self._session() as session:
+            # Scrape Show HN
+            print("  📡 Scraping Show HN posts...")
+            show_hn_opps = await self.ascrape_show_hn(session, limit=100)
+            print(f"    ✅ Found {len(show_hn_opps)} Show HN opportunities")
 
-    def scrape_all(self) -> List[Dict]:
-        """Main scraping method"""
-        print("\n🧡 HACKER NEWS SCRAPING:")
-        print("=" * 60)
+            for opp in show_hn_opps[:MAX_OPPORTUNITIES_PER_SOURCE]:
+                total += 1
+                yield opp
 
-        all_opportunities = []
+            # Scrape Ask HN
+            if total < MAX_OPPORTUNITIES_PER_SOURCE:
+                print("  📡 Scraping Ask HN posts...")
+                ask_hn_count = 0
+                async for opp in self.aiter_ask_hn(session, limit=50):
+                    ask_hn_count += 1
+                    total += 1
+                    yield opp
+                    if total >= MAX_OPPORTUNITIES_PER_SOURCE:
+                        break
+                print(f"    ✅ Found {ask_hn_count} Ask HN opportunities")
 
-        # Scrape Show HN
-        print("  📡 Scraping Show HN posts...")
-        show_hn_opps = self.scrape_show_hn(limit=100)
-        all_opportunities.extend(show_hn_opps)
-        print(f"    ✅ Found {len(show_hn_opps)} Show HN opportunities")
+        print(f"\n✅ Total Hacker News opportunities: {total}")
 
-        # Scrape Ask HN
-        if len(all_opportunities) < MAX_OPPORTUNITIES_PER_SOURCE:
-            print("  📡 Scraping Ask HN posts...")
-            ask_hn_opps = self.scrape_ask_hn(limit=50)
-            all_opportunities.extend(ask_hn_opps)
-            print(f"    ✅ Found {len(ask_hn_opps)} Ask HN opportunities")
+    async def ascrape_all(self) -> List[Dict]:
+        """Main scraping method (async)"""
+        return [opp async for opp in self.stream_all()]
 
-        print(f"\n✅ Total Hacker News opportunities: {len(all_opportunities)}")
-        return all_opportunities[:MAX_OPPORTUNITIES_PER_SOURCE]
+    def scrape_all(self) -> List[Dict]:
+        """Main scraping method"""
+        return asyncio.run(self.ascrape_all())
 
 
 if __name__ == "__main__":
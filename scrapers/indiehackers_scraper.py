@@ -4,16 +4,18 @@ Indie Hackers scraper for verified business opportunities
 """
 
 import re
-import time
 import requests
 from bs4 import BeautifulSoup
 from datetime import datetime
 from typing import List, Dict
 from scrapers.config import (
     INDIEHACKERS_URLS,
-    MAX_OPPORTUNITIES_PER_SOURCE,
-    RATE_LIMIT_WEB
+    MAX_OPPORTUNITIES_PER_SOURCE
 )
+from scrapers.extraction import INDIEHACKERS_REVENUE_PATTERNS, RevenueExtractor
+from scrapers.rate_limit import get_sync
+
+_REVENUE = RevenueExtractor(INDIEHACKERS_REVENUE_PATTERNS)
 
 
 class IndieHackersScraper:
@@ -27,17 +29,8 @@ class IndieHackersScraper:
 
     def extract_revenue(self, text: str) -> str:
         """Extract revenue from text"""
-        patterns = [
-            r'\$\s*([\d,]+)\s*/?(?:mo|month|mrr)',
-            r'([\d,]+)\s*\$\s*/?(?:mo|month|mrr)',
-        ]
-
-        for pattern in patterns:
-            match = re.search(pattern, text, re.IGNORECASE)
-            if match:
-                return f"${match.group(1)}/month"
-
-        return "Not specified"
+        mention = _REVENUE.extract(text)
+        return f"${mention.raw}/month" if mention else "Not specified"
 
     def scrape_products_page(self) -> List[Dict]:
         """Scrape Indie Hackers products page"""
@@ -46,7 +39,7 @@ class IndieHackersScraper:
 
         try:
             url = "https://www.indiehackers.com/products?revenueVerification=stripe"
-            response = self.session.get(url, timeout=30)
+            response = get_sync(url, session=self.session, timeout=30)
 
             if response.status_code != 200:
                 print(f"    ❌ HTTP {response.status_code}")
@@ -106,7 +99,7 @@ class IndieHackersScraper:
 
         try:
             url = "https://www.indiehackers.com/interviews"
-            response = self.session.get(url, timeout=30)
+            response = get_sync(url, session=self.session, timeout=30)
 
             if response.status_code != 200:
                 print(f"    ❌ HTTP {response.status_code}")
@@ -164,7 +157,6 @@ class IndieHackersScraper:
         # Scrape products
         products = self.scrape_products_page()
         all_opportunities.extend(products)
-        time.sleep(2)
 
         # Scrape interviews
         interviews = self.scrape_interviews()
@@ -7,7 +7,7 @@ Handles JavaScript-heavy pages with proper rendering
 import asyncio
 import re
 from datetime import datetime
-from typing import List, Optional
+from typing import AsyncIterator, List, Optional
 from bs4 import BeautifulSoup
 
 from models import (
@@ -16,7 +16,7 @@ from models import (
     OpportunitySource,
     ScraperConfig
 )
-from scrapers.crawl4ai_base import Crawl4AIBase
+from scrapers.crawl4ai_base import Crawl4AIBase, CrawlerPool
 from scrapers.config import MAX_OPPORTUNITIES_PER_SOURCE
 
 import logging
@@ -27,9 +27,13 @@ logger = logging.getLogger(__name__)
 class IndieHackersScraperModern(Crawl4AIBase):
     """Modern Indie Hackers scraper using Crawl4AI for JavaScript rendering"""
 
-    def __init__(self, config: Optional[ScraperConfig] = None):
-        """Initialize Indie Hackers scraper"""
-        super().__init__(config)
+    def __init__(
+        self,
+        config: Optional[ScraperConfig] = None,
+        crawler_pool: Optional[CrawlerPool] = None
+    ):
+        """Initialize Indie Hackers scraper (optionally on a browser pool shared across scrapers)"""
+        super().__init__(config, crawler_pool)
         logger.info("✅ Indie Hackers scraper initialized")
 
     def parse_product_card(self, card_html: str, source_url: str) -> Optional[Opportunity]:
@@ -313,7 +317,6 @@ class IndieHackersScraperModern(Crawl4AIBase):
 
         # Scrape products
         products = await self.scrape_products_page(max_products=30)
-        await asyncio.sleep(2)  # Rate limiting
 
         # Scrape interviews
         interviews = await self.scrape_interviews(max_interviews=20)
@@ -337,6 +340,28 @@ class IndieHackersScraperModern(Crawl4AIBase):
 
         return unique_opportunities
 
+    async def stream_all(self) -> AsyncIterator[Opportunity]:
+        """
+        Stream unique opportunities page by page
+
+        Products are yielded as soon as their page is parsed, before the
+        interviews page is crawled.
+        """
+        logger.info("\n💡 INDIE HACKERS STREAMING (Modern with Crawl4AI)")
+
+        seen_urls = set()
+
+        # Crawls are paced per host by CrawlerPool's shared rate limiters
+        for scrape_page in [
+            lambda: self.scrape_products_page(max_products=30),
+            lambda: self.scrape_interviews(max_interviews=20),
+        ]:
+            for opp in await scrape_page():
+                url = str(opp.metadata.source_url)
+                if url not in seen_urls:
+                    seen_urls.add(url)
+                    yield opp
+
 
 async def main():
     """Test the modern Indie Hackers scraper"""
@@ -345,8 +370,8 @@ async def main():
         format='%(asctime)s - %(levelname)s - %(message)s'
     )
 
-    scraper = IndieHackersScraperModern()
-    opportunities = await scraper.scrape_all()
+    async with IndieHackersScraperModern() as scraper:
+        opportunities = await scraper.scrape_all()
 
     # Print samples
     print("\n" + "=" * 70)
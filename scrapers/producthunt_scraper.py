@@ -5,16 +5,18 @@ Scrapes products tagged with automation, productivity, AI tools, etc.
 """
 
 import re
-import time
-import requests
 from bs4 import BeautifulSoup
 from datetime import datetime
 from typing import List, Dict
 from scrapers.config import (
-    RATE_LIMIT_WEB,
     MAX_OPPORTUNITIES_PER_SOURCE,
     MIN_REVENUE_MENTION
 )
+from scrapers.extraction import PRODUCTHUNT_REVENUE_PATTERNS, TECH_KEYWORDS, RevenueExtractor, TechStackMatcher
+from scrapers.rate_limit import get_sync
+
+_REVENUE = RevenueExtractor(PRODUCTHUNT_REVENUE_PATTERNS, min_amount=MIN_REVENUE_MENTION)
+_TECH_STACK = TechStackMatcher(TECH_KEYWORDS + ('No-code', 'Zapier', 'Make', 'Airtable', 'Notion'))
 
 
 class ProductHuntScraper:
@@ -35,7 +37,7 @@ class ProductHuntScraper:
                 url = f"{self.base_url}/topics/{topic}"
                 print(f"    Scraping {topic} (page {page})...")
 
-                response = requests.get(url, headers=self.headers, timeout=10)
+                response = get_sync(url, headers=self.headers, timeout=10)
                 if response.status_code != 200:
                     print(f"    ⚠️  Failed to fetch {topic}: {response.status_code}")
                     continue
@@ -59,8 +61,6 @@ class ProductHuntScraper:
                     except Exception as e:
                         continue
 
-                time.sleep(60 / RATE_LIMIT_WEB)
-
             except Exception as e:
                 print(f"    ⚠️  Error scraping {topic}: {e}")
                 continue
@@ -70,7 +70,7 @@ class ProductHuntScraper:
     def scrape_product_page(self, url: str) -> Dict:
         """Scrape individual product page"""
         try:
-            response = requests.get(url, headers=self.headers, timeout=10)
+            response = get_sync(url, headers=self.headers, timeout=10)
             if response.status_code != 200:
                 return None
 
@@ -120,43 +120,13 @@ class ProductHuntScraper:
 
     def extract_revenue(self, text: str) -> str:
         """Extract revenue mentions from text"""
-        patterns = [
-            r'\$\s*(\d+[,\d]*)\s*/?(?:mo|month|mrr|revenue)',
-            r'(\d+[,\d]*)\s*\$\s*/?(?:mo|month|mrr)',
-            r'making.*?\$\s*(\d+[,\d]*)',
-            r'earning.*?\$\s*(\d+[,\d]*)',
-        ]
-
-        for pattern in patterns:
-            match = re.search(pattern, text, re.IGNORECASE)
-            if match:
-                amount = match.group(1).replace(',', '')
-                try:
-                    if int(amount) >= MIN_REVENUE_MENTION:
-                        return f"${amount}/month"
-                except ValueError:
-                    continue
-
-        return "Not specified"
+        mention = _REVENUE.extract(text)
+        return f"${mention.raw.replace(',', '')}/month" if mention else "Not specified"
 
     def extract_tech_stack(self, text: str) -> str:
         """Extract technology mentions"""
-        tech_keywords = {
-            'Python', 'JavaScript', 'TypeScript', 'React', 'Next.js', 'Node.js',
-            'FastAPI', 'Django', 'Flask', 'Vue', 'Svelte', 'Tailwind',
-            'PostgreSQL', 'MongoDB', 'Redis', 'Stripe', 'GPT-4', 'OpenAI',
-            'Claude', 'AWS', 'Vercel', 'Supabase', 'Firebase', 'No-code',
-            'Zapier', 'Make', 'Airtable', 'Notion'
-        }
-
-        found_tech = []
-        text_upper = text.upper()
-
-        for tech in tech_keywords:
-            if tech.upper() in text_upper:
-                found_tech.append(tech)
-
-        return ', '.join(found_tech[:5]) if found_tech else "Not specified"
+        found_tech = _TECH_STACK.find(text, limit=5)
+        return ', '.join(found_tech) if found_tech else "Not specified"
 
     def scrape_all(self) -> List[Dict]:
         """Main scraping method"""
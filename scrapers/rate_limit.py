@@ -0,0 +1,258 @@
+#!/usr/bin/env python3
+"""
+Token-bucket rate limiting for scrapers
+- Reservation based: each caller books the next free slot, then sleeps until it
+  (no polling, fair ordering under concurrency)
+- Usable from asyncio (await acquire()) and from threads (acquire_sync())
+- Rates are configured per minute, matching scrapers/config.py
+- One bucket per host, shared process-wide (RATE_LIMITERS / limiter_for), so
+  every scraper hitting a host draws from the same budget. Limits come from
+  HOST_RATE_LIMITS (matched on the host's longest configured domain suffix);
+  other hosts get RATE_LIMIT_WEB
+- Adaptive: a 429/503 halves the bucket's rate (down to a tenth of the
+  configured rate) and pauses it for Retry-After; each successful response
+  wins back a tenth of the configured rate
+- Metrics per bucket: requests, seconds spent waiting, throttled responses,
+  current rate
+"""
+
+import asyncio
+import email.utils
+import threading
+import time
+from typing import Dict, Mapping, Optional, Tuple
+from urllib.parse import urlsplit
+
+import requests
+
+from scrapers.config import HOST_RATE_LIMITS, RATE_LIMIT_WEB, WEB_BURST
+
+# Responses that mean "slow down"
+THROTTLE_STATUSES = frozenset({429, 503})
+
+# Adaptive rate: multiplied on a throttle, floor as a fraction of the
+# configured rate, and the fraction of it recovered per successful response
+BACKOFF_FACTOR = 0.5
+MIN_RATE_FRACTION = 0.1
+RECOVERY_STEP = 0.1
+
+
+class TokenBucket:
+    """Token bucket allowing `burst` requests at once, refilled at `rate` per second"""
+
+    def __init__(self, rate: float, burst: int = 1):
+        """
+        Args:
+            rate: Tokens added per second
+            burst: Bucket capacity (requests allowed back-to-back)
+        """
+        if rate <= 0:
+            raise ValueError(f"rate must be > 0, got {rate}")
+        if burst < 1:
+            raise ValueError(f"burst must be >= 1, got {burst}")
+
+        self.max_rate = rate
+        self.rate = rate
+        self.burst = burst
+
+        self._lock = threading.Lock()
+        self._tokens = float(burst)
+        self._updated_at = time.monotonic()  # in the future while paused
+
+        # Metrics
+        self.requests = 0
+        self.waited_seconds = 0.0
+        self.throttled = 0
+
+    @classmethod
+    def per_minute(cls, requests_per_minute: float, burst: int = 1) -> "TokenBucket":
+        """Build a bucket from a requests-per-minute limit (see scrapers/config.py)"""
+        return cls(requests_per_minute / 60.0, burst)
+
+    def _refill(self, now: float):
+        if now > self._updated_at:
+            self._tokens = min(self.burst, self._tokens + (now - self._updated_at) * self.rate)
+            self._updated_at = now
+
+    def _reserve(self) -> float:
+        """Take one token (possibly going into debt) and return the seconds to wait"""
+        with self._lock:
+            now = time.monotonic()
+            self._refill(now)
+
+            self._tokens -= 1
+            delay = max(0.0, self._updated_at - now)  # Remaining pause, if any
+            if self._tokens < 0:
+                delay += -self._tokens / self.rate
+
+            self.requests += 1
+            self.waited_seconds += delay
+            return delay
+
+    def _paused_for(self) -> float:
+        """Seconds left of a pause that started after a slot was booked"""
+        return self._updated_at - time.monotonic()
+
+    async def acquire(self):
+        """Wait (without blocking the event loop) until a request may be made"""
+        delay = self._reserve()
+        while delay > 0:
+            await asyncio.sleep(delay)
+            delay = self._paused_for()
+
+    def acquire_sync(self):
+        """Blocking variant of acquire() for threaded / synchronous scrapers"""
+        delay = self._reserve()
+        while delay > 0:
+            time.sleep(delay)
+            delay = self._paused_for()
+
+    # -- Adaptive rate -------------------------------------------------------
+
+    def slow_down(self, pause: Optional[float] = None):
+        """Halve the rate after a throttled response; pause all requests for `pause` seconds"""
+        with self._lock:
+            now = time.monotonic()
+            self._refill(now)
+
+            self.rate = max(self.max_rate * MIN_RATE_FRACTION, self.rate * BACKOFF_FACTOR)
+            self.throttled += 1
+
+            if pause and now + pause > self._updated_at:
+                # No refill until the pause is over
+                self._tokens = min(self._tokens, 0.0)
+                self._updated_at = now + pause
+
+    def speed_up(self):
+        """Win back part of the configured rate after a successful response"""
+        with self._lock:
+            self.rate = min(self.max_rate, self.rate + self.max_rate * RECOVERY_STEP)
+
+    def feedback(self, status: int, headers: Optional[Mapping] = None):
+        """Adapt to a response: slow down on 429/503, recover on success"""
+        if status in THROTTLE_STATUSES:
+            self.slow_down(retry_after_seconds(headers))
+        elif status < 400:
+            self.speed_up()
+
+    def metrics(self) -> Dict[str, float]:
+        """Request count, total wait, throttled responses and current/configured rates (per minute)"""
+        with self._lock:
+            return {
+                "requests": self.requests,
+                "waited_seconds": round(self.waited_seconds, 3),
+                "throttled": self.throttled,
+                "rate_per_minute": round(self.rate * 60, 2),
+                "max_rate_per_minute": round(self.max_rate * 60, 2),
+            }
+
+
+def retry_after_seconds(headers: Optional[Mapping]) -> Optional[float]:
+    """
+    Back-off requested by a response: Retry-After (seconds or HTTP date),
+    else X-Ratelimit-Reset (seconds, Reddit). None if neither is usable.
+    """
+    if not headers:
+        return None
+
+    for header in ("Retry-After", "X-Ratelimit-Reset"):
+        value = headers.get(header)
+        if value is None:
+            continue
+        try:
+            return max(0.0, float(value))
+        except (TypeError, ValueError):
+            pass
+        try:
+            return max(0.0, email.utils.parsedate_to_datetime(value).timestamp() - time.time())
+        except (TypeError, ValueError):
+            continue
+
+    return None
+
+
+# ---------------------------------------------------------------------------
+# Per-host registry
+# ---------------------------------------------------------------------------
+
+def _normalize_host(host: str) -> str:
+    host = host.strip().lower().split(":")[0]
+    return host[4:] if host.startswith("www.") else host
+
+
+class RateLimiterRegistry:
+    """One TokenBucket per host, created on first use"""
+
+    def __init__(
+        self,
+        limits: Optional[Mapping[str, Tuple[float, int]]] = None,
+        default: Tuple[float, int] = (RATE_LIMIT_WEB, WEB_BURST)
+    ):
+        """
+        Args:
+            limits: Domain suffix -> (requests per minute, burst); a host uses
+                its longest matching suffix, which is also its bucket key
+            default: (requests per minute, burst) for every other host
+        """
+        limits = HOST_RATE_LIMITS if limits is None else limits
+        self.limits = {_normalize_host(host): limit for host, limit in limits.items()}
+        self.default = default
+
+        self._lock = threading.Lock()
+        self._buckets: Dict[str, TokenBucket] = {}
+
+    def _resolve(self, host: str) -> Tuple[str, Tuple[float, int]]:
+        """Bucket key and (requests per minute, burst) for a host"""
+        host = _normalize_host(host)
+        labels = host.split(".")
+        for i in range(len(labels)):
+            suffix = ".".join(labels[i:])
+            if suffix in self.limits:
+                return suffix, self.limits[suffix]
+        return host, self.default
+
+    def for_host(self, host: str) -> TokenBucket:
+        """The shared bucket for a host"""
+        key, (requests_per_minute, burst) = self._resolve(host)
+        with self._lock:
+            bucket = self._buckets.get(key)
+            if bucket is None:
+                bucket = self._buckets[key] = TokenBucket.per_minute(requests_per_minute, burst)
+            return bucket
+
+    def for_url(self, url: str) -> TokenBucket:
+        """The shared bucket for a URL's host"""
+        return self.for_host(urlsplit(url).hostname or url)
+
+    def configure(self, host: str, requests_per_minute: float, burst: int = 1):
+        """Set a host's limit (replaces its bucket and metrics)"""
+        host = _normalize_host(host)
+        with self._lock:
+            self.limits[host] = (requests_per_minute, burst)
+            self._buckets[host] = TokenBucket.per_minute(requests_per_minute, burst)
+
+    def metrics(self) -> Dict[str, Dict[str, float]]:
+        """Bucket key -> TokenBucket.metrics(), for every host used so far"""
+        with self._lock:
+            buckets = dict(self._buckets)
+        return {key: bucket.metrics() for key, bucket in sorted(buckets.items())}
+
+
+# Process-wide registry shared by every scraper
+RATE_LIMITERS = RateLimiterRegistry()
+
+
+def limiter_for(url_or_host: str) -> TokenBucket:
+    """Shared bucket for a URL or bare host name"""
+    if "://" in url_or_host:
+        return RATE_LIMITERS.for_url(url_or_host)
+    return RATE_LIMITERS.for_host(url_or_host)
+
+
+def get_sync(url: str, session: Optional[requests.Session] = None, **kwargs) -> requests.Response:
+    """requests GET under the host's rate limit, feeding the response status back to it"""
+    limiter = limiter_for(url)
+    limiter.acquire_sync()
+    response = (session or requests).get(url, **kwargs)
+    limiter.feedback(response.status_code, response.headers)
+    return response
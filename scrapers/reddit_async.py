@@ -0,0 +1,246 @@
+#!/usr/bin/env python3
+"""
+Async Reddit API client (application-only OAuth, JSON endpoints)
+- One keep-alive aiohttp session and one bearer token per run; the token is
+  refreshed shortly before it expires, or after a 401
+- Every request takes a slot from the host's shared token bucket
+  (scrapers/rate_limit.py; oauth.reddit.com is sized to the authenticated
+  budget, RATE_LIMIT_REDDIT_OAUTH per minute), so any number of concurrent
+  searches, and PRAW in the same process, stay inside it
+- A 429 slows the bucket down and pauses it for Retry-After seconds (falling
+  back to X-Ratelimit-Reset), then the request is retried; every waiting
+  request honours the same pause instead of hitting the limit again
+- Posts come back as RedditPost, which has the Submission attributes the
+  scrapers read, so parsing code works on PRAW and JSON posts alike
+"""
+
+import asyncio
+import logging
+import time
+from dataclasses import dataclass
+from typing import Dict, List, Optional
+
+import aiohttp
+
+from scrapers.config import (
+    REDDIT_CLIENT_ID,
+    REDDIT_CLIENT_SECRET,
+    REDDIT_USER_AGENT
+)
+from scrapers.rate_limit import limiter_for
+
+logger = logging.getLogger(__name__)
+
+TOKEN_URL = "https://www.reddit.com/api/v1/access_token"
+API_BASE = "https://oauth.reddit.com"
+
+# Max Reddit requests in flight at once
+REDDIT_CONCURRENCY = 8
+
+# Attempts per request when rate limited (429) or the token expired (401)
+MAX_ATTEMPTS = 3
+
+# Refresh the bearer token this long before Reddit says it expires
+TOKEN_REFRESH_MARGIN = 60.0
+
+
+@dataclass
+class RedditPost:
+    """A search result, with the Submission attributes the scrapers use"""
+    id: str
+    title: str
+    selftext: str
+    score: int
+    num_comments: int
+    permalink: str
+    created_utc: float
+    author: Optional[str] = None  # Username; None for deleted accounts
+
+    @classmethod
+    def from_json(cls, data: Dict) -> "RedditPost":
+        """Build from the "data" object of a listing child (kind t3)"""
+        author = data.get("author")
+        return cls(
+            id=data["id"],
+            title=data.get("title") or "",
+            selftext=data.get("selftext") or "",
+            score=int(data.get("score") or 0),
+            num_comments=int(data.get("num_comments") or 0),
+            permalink=data.get("permalink") or f"/comments/{data['id']}",
+            created_utc=float(data.get("created_utc") or 0),
+            author=None if author in (None, "[deleted]") else author,
+        )
+
+
+class RedditAPIError(Exception):
+    """A Reddit request failed after MAX_ATTEMPTS"""
+
+
+class AsyncRedditClient:
+    """Rate-limited Reddit OAuth client. Use as an async context manager."""
+
+    def __init__(
+        self,
+        client_id: str = REDDIT_CLIENT_ID,
+        client_secret: str = REDDIT_CLIENT_SECRET,
+        user_agent: str = REDDIT_USER_AGENT,
+        concurrency: int = REDDIT_CONCURRENCY
+    ):
+        """
+        Args:
+            client_id, client_secret: Reddit app credentials
+            user_agent: Sent with every request (Reddit requires a descriptive one)
+            concurrency: Max requests in flight at once
+        """
+        if not client_id or not client_secret:
+            raise ValueError("Reddit API credentials missing (REDDIT_CLIENT_ID / REDDIT_CLIENT_SECRET)")
+
+        self.client_id = client_id
+        self.client_secret = client_secret
+        self.user_agent = user_agent
+        self.concurrency = concurrency
+
+        self._session: Optional[aiohttp.ClientSession] = None
+        self._token: Optional[str] = None
+        self._token_expires_at = 0.0
+        self._token_lock = asyncio.Lock()
+
+        # Run statistics
+        self.requests = 0
+        self.rate_limited = 0
+
+    async def __aenter__(self) -> "AsyncRedditClient":
+        self._session = aiohttp.ClientSession(
+            connector=aiohttp.TCPConnector(limit=self.concurrency),
+            timeout=aiohttp.ClientTimeout(total=30),
+            headers={"User-Agent": self.user_agent}
+        )
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.close()
+
+    async def close(self):
+        """Close the HTTP session"""
+        session, self._session = self._session, None
+        if session is not None:
+            await session.close()
+
+    # -- Requests ------------------------------------------------------------
+
+    async def _send(self, method: str, url: str, **kwargs):
+        """
+        One request under the host's rate limit
+
+        Returns:
+            (status, JSON body or None); a 429 is reported to the limiter,
+            which slows down and pauses for Retry-After
+        """
+        limiter = limiter_for(url)
+        await limiter.acquire()
+        self.requests += 1
+
+        async with self._session.request(method, url, **kwargs) as response:
+            limiter.feedback(response.status, response.headers)
+            if response.status == 429:
+                self.rate_limited += 1
+                logger.warning(f"⏳ Reddit rate limit hit ({url.split('?')[0]}), backing off")
+                return response.status, None
+            if response.status != 200:
+                return response.status, None
+            return response.status, await response.json()
+
+    async def _access_token(self, refresh: bool = False) -> str:
+        """Current bearer token (application-only OAuth), fetched when missing or expiring"""
+        async with self._token_lock:
+            if not refresh and self._token and time.monotonic() < self._token_expires_at:
+                return self._token
+
+            for _ in range(MAX_ATTEMPTS):
+                status, data = await self._send(
+                    "POST",
+                    TOKEN_URL,
+                    data={"grant_type": "client_credentials"},
+                    auth=aiohttp.BasicAuth(self.client_id, self.client_secret)
+                )
+                if status == 429:
+                    continue
+                if status != 200:
+                    raise RedditAPIError(f"Token request failed: HTTP {status}")
+                break
+            else:
+                raise RedditAPIError("Token request rate limited")
+
+            if "access_token" not in data:
+                raise RedditAPIError(f"Token request failed: {data.get('error', data)}")
+
+            self._token = data["access_token"]
+            self._token_expires_at = (
+                time.monotonic() + float(data.get("expires_in", 3600)) - TOKEN_REFRESH_MARGIN
+            )
+            return self._token
+
+    async def get_json(self, path: str, params: Optional[Dict] = None) -> Dict:
+        """
+        GET an oauth.reddit.com endpoint
+
+        Raises:
+            RedditAPIError: On a non-200 response, or when still rate limited
+                (or unauthorized) after MAX_ATTEMPTS
+        """
+        if self._session is None:
+            raise RuntimeError("AsyncRedditClient must be used as an async context manager")
+
+        refresh = False
+        for _ in range(MAX_ATTEMPTS):
+            token = await self._access_token(refresh)
+
+            status, data = await self._send(
+                "GET",
+                f"{API_BASE}{path}",
+                params={**(params or {}), "raw_json": 1},
+                headers={"Authorization": f"bearer {token}"}
+            )
+            if status == 429:
+                continue
+            if status == 401:
+                refresh = True  # Token expired or revoked
+                continue
+            if status != 200:
+                raise RedditAPIError(f"GET {path} failed: HTTP {status}")
+            return data
+
+        raise RedditAPIError(f"GET {path} failed after {MAX_ATTEMPTS} attempts")
+
+    async def search(
+        self,
+        subreddit: str,
+        query: str,
+        time_filter: str = 'month',
+        limit: int = 50
+    ) -> List[RedditPost]:
+        """
+        Search one subreddit (relevance order, like PRAW's subreddit.search)
+
+        Args:
+            subreddit: Name of subreddit (without r/)
+            query: Search query
+            time_filter: Time filter (hour, day, week, month, year, all)
+            limit: Maximum posts to return (Reddit caps a page at 100)
+        """
+        data = await self.get_json(
+            f"/r/{subreddit}/search",
+            params={
+                "q": query,
+                "restrict_sr": 1,
+                "sort": "relevance",
+                "t": time_filter,
+                "limit": min(limit, 100),
+                "type": "link",
+            }
+        )
+        return [
+            RedditPost.from_json(child["data"])
+            for child in data.get("data", {}).get("children", [])
+            if child.get("kind") == "t3"
+        ]
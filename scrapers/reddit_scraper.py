@@ -3,8 +3,6 @@
 Reddit scraper for business opportunities using PRAW (Python Reddit API Wrapper)
 """
 
-import re
-import time
 import praw
 from datetime import datetime, timedelta
 from typing import List, Dict
@@ -17,6 +15,11 @@ from scrapers.config import (
     MAX_OPPORTUNITIES_PER_SOURCE,
     MIN_REVENUE_MENTION
 )
+from scrapers.extraction import REDDIT_REVENUE_PATTERNS, TECH_KEYWORDS, RevenueExtractor, TechStackMatcher
+from scrapers.rate_limit import limiter_for
+
+_REVENUE = RevenueExtractor(REDDIT_REVENUE_PATTERNS, min_amount=MIN_REVENUE_MENTION)
+_TECH_STACK = TechStackMatcher(TECH_KEYWORDS)
 
 
 class RedditScraper:
@@ -39,44 +42,13 @@ class RedditScraper:
 
     def extract_revenue(self, text: str) -> str:
         """Extract revenue claims from text"""
-        # Patterns for revenue mentions
-        patterns = [
-            r'\$\s*(\d+[,\d]*)\s*/?(?:mo|month|mrr)',
-            r'(\d+[,\d]*)\s*\$\s*/?(?:mo|month|mrr)',
-            r'revenue.*?\$\s*(\d+[,\d]*)',
-            r'making.*?\$\s*(\d+[,\d]*)',
-            r'earning.*?\$\s*(\d+[,\d]*)',
-        ]
-
-        for pattern in patterns:
-            match = re.search(pattern, text, re.IGNORECASE)
-            if match:
-                amount = match.group(1).replace(',', '')
-                try:
-                    if int(amount) >= MIN_REVENUE_MENTION:
-                        return f"${amount}/month"
-                except ValueError:
-                    continue
-
-        return "Not specified"
+        mention = _REVENUE.extract(text)
+        return f"${mention.raw.replace(',', '')}/month" if mention else "Not specified"
 
     def extract_tech_stack(self, text: str) -> str:
         """Extract technology mentions from text"""
-        tech_keywords = {
-            'Python', 'JavaScript', 'TypeScript', 'React', 'Next.js', 'Node.js',
-            'FastAPI', 'Django', 'Flask', 'Vue', 'Svelte', 'Tailwind',
-            'PostgreSQL', 'MongoDB', 'Redis', 'Stripe', 'GPT-4', 'OpenAI',
-            'Claude', 'AWS', 'Vercel', 'Supabase', 'Firebase', 'Docker'
-        }
-
-        found_tech = []
-        text_upper = text.upper()
-
-        for tech in tech_keywords:
-            if tech.upper() in text_upper:
-                found_tech.append(tech)
-
-        return ', '.join(found_tech[:5]) if found_tech else "Not specified"
+        found_tech = _TECH_STACK.find(text, limit=5)
+        return ', '.join(found_tech) if found_tech else "Not specified"
 
     def is_relevant_post(self, post) -> bool:
         """Check if post is relevant (mentions revenue/automation)"""
@@ -103,6 +75,7 @@ class RedditScraper:
             # Search with keywords
             for query in REDDIT_SEARCH_QUERIES:
                 try:
+                    limiter_for("oauth.reddit.com").acquire_sync()  # PRAW talks to the OAuth API
                     for post in subreddit.search(query, time_filter=time_filter, limit=limit):
                         if self.is_relevant_post(post):
                             opportunity = {
@@ -122,8 +95,6 @@ class RedditScraper:
                             if len(found) >= MAX_OPPORTUNITIES_PER_SOURCE:
                                 break
 
-                    time.sleep(1)  # Rate limiting
-
                 except Exception as e:
                     print(f"    ⚠️  Search error for '{query}': {e}")
                     continue
@@ -145,7 +116,6 @@ class RedditScraper:
         for subreddit_name in REDDIT_SUBREDDITS:
             opportunities = self.scrape_subreddit(subreddit_name, time_filter='month', limit=50)
             all_opportunities.extend(opportunities)
-            time.sleep(2)  # Rate limiting between subreddits
 
         # Remove duplicates by URL
         seen_urls = set()
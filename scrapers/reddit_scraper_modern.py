@@ -2,13 +2,15 @@
 """
 Modern Reddit scraper with Pydantic validation
 Uses PRAW for API access + Crawl4AI for link content extraction
+stream_all() runs every subreddit/query search concurrently on the async OAuth
+client (scrapers/reddit_async.py) instead of PRAW's sleep-paced loop
 """
 
 import re
-import time
 import asyncio
+from collections import Counter
 from datetime import datetime
-from typing import List, Optional
+from typing import AsyncIterator, Iterator, List, Optional
 from praw import Reddit
 from praw.models import Submission
 
@@ -18,7 +20,9 @@ from models import (
     OpportunitySource,
     ScraperConfig
 )
-from scrapers.crawl4ai_base import Crawl4AIBase
+from scrapers.crawl4ai_base import Crawl4AIBase, CrawlerPool
+from scrapers.rate_limit import limiter_for
+from scrapers.reddit_async import API_BASE, AsyncRedditClient
 from scrapers.config import (
     REDDIT_CLIENT_ID,
     REDDIT_CLIENT_SECRET,
@@ -37,9 +41,13 @@ logger = logging.getLogger(__name__)
 class RedditScraperModern(Crawl4AIBase):
     """Modern Reddit scraper with Crawl4AI and Pydantic"""
 
-    def __init__(self, config: Optional[ScraperConfig] = None):
-        """Initialize Reddit scraper"""
-        super().__init__(config)
+    def __init__(
+        self,
+        config: Optional[ScraperConfig] = None,
+        crawler_pool: Optional[CrawlerPool] = None
+    ):
+        """Initialize Reddit scraper (optionally on a browser pool shared across scrapers)"""
+        super().__init__(config, crawler_pool)
 
         if not REDDIT_CLIENT_ID or not REDDIT_CLIENT_SECRET:
             raise ValueError(
@@ -82,7 +90,7 @@ class RedditScraperModern(Crawl4AIBase):
         Parse Reddit post into Opportunity with Pydantic validation
 
         Args:
-            post: PRAW Submission object
+            post: PRAW Submission or RedditPost (async client)
 
         Returns:
             Validated Opportunity or None if parsing fails
@@ -141,7 +149,8 @@ class RedditScraperModern(Crawl4AIBase):
                 created_at=datetime.fromtimestamp(post.created_utc),
                 discovered_at=datetime.now(),
                 tags=tags,
-                author=post.author.name if post.author else None
+                # PRAW gives a Redditor, the async client a plain username
+                author=getattr(post.author, 'name', post.author) if post.author else None
             )
 
             # Create Opportunity
@@ -173,6 +182,25 @@ class RedditScraperModern(Crawl4AIBase):
         Returns:
             List of validated Opportunities
         """
+        return list(self.iter_subreddit(subreddit_name, time_filter=time_filter, limit=limit))
+
+    def iter_subreddit(
+        self,
+        subreddit_name: str,
+        time_filter: str = 'month',
+        limit: int = 100
+    ) -> Iterator[Opportunity]:
+        """
+        Yield opportunities from a subreddit as each post is parsed
+
+        Args:
+            subreddit_name: Name of subreddit (without r/)
+            time_filter: Time filter (hour, day, week, month, year, all)
+            limit: Maximum posts to check per query
+
+        Yields:
+            Validated Opportunities
+        """
         logger.info(f"📡 Scraping r/{subreddit_name}...")
         opportunities = []
 
@@ -184,6 +212,8 @@ class RedditScraperModern(Crawl4AIBase):
                 try:
                     logger.debug(f"  Searching: '{query}'")
 
+                    # One API request per search page (PRAW fetches up to 100 posts per request)
+                    limiter_for(API_BASE).acquire_sync()
                     for post in subreddit.search(query, time_filter=time_filter, limit=limit):
                         if self.is_relevant_post(post):
                             opportunity = self.parse_reddit_post(post)
@@ -196,12 +226,12 @@ class RedditScraperModern(Crawl4AIBase):
                                     f"(score: {opportunity.metadata.score})"
                                 )
 
+                                yield opportunity
+
                             if len(opportunities) >= MAX_OPPORTUNITIES_PER_SOURCE:
                                 logger.info(f"  📊 Reached limit of {MAX_OPPORTUNITIES_PER_SOURCE} opportunities")
                                 break
 
-                    time.sleep(1)  # Rate limiting
-
                     if len(opportunities) >= MAX_OPPORTUNITIES_PER_SOURCE:
                         break
 
@@ -214,8 +244,6 @@ class RedditScraperModern(Crawl4AIBase):
         except Exception as e:
             logger.error(f"❌ Error accessing r/{subreddit_name}: {e}")
 
-        return opportunities
-
     def scrape_all_subreddits(self) -> List[Opportunity]:
         """
         Scrape all configured subreddits
@@ -232,7 +260,6 @@ class RedditScraperModern(Crawl4AIBase):
         for subreddit_name in REDDIT_SUBREDDITS:
             opportunities = self.scrape_subreddit(subreddit_name, time_filter='month', limit=50)
             all_opportunities.extend(opportunities)
-            time.sleep(2)  # Rate limiting between subreddits
 
         # Remove duplicates by URL
         seen_urls = set()
@@ -253,6 +280,88 @@ class RedditScraperModern(Crawl4AIBase):
 
         return unique_opportunities
 
+    def iter_all_subreddits(self) -> Iterator[Opportunity]:
+        """Yield unique opportunities from all configured subreddits as they are found"""
+        seen_urls = set()
+
+        for subreddit_name in REDDIT_SUBREDDITS:
+            for opp in self.iter_subreddit(subreddit_name, time_filter='month', limit=50):
+                url = str(opp.metadata.source_url)
+                if url not in seen_urls:
+                    seen_urls.add(url)
+                    yield opp
+
+    async def stream_all(
+        self,
+        time_filter: str = 'month',
+        limit: int = 50
+    ) -> AsyncIterator[Opportunity]:
+        """
+        Stream unique opportunities from all configured subreddits
+
+        Every (subreddit, query) search is started at once on the async OAuth
+        client, whose shared rate limiter paces them to the API budget (no
+        fixed sleeps). Posts are parsed and yielded as each search returns.
+
+        Args:
+            time_filter: Time filter (hour, day, week, month, year, all)
+            limit: Maximum posts to check per query
+        """
+        logger.info("\n🔴 REDDIT STREAMING (async OAuth, concurrent searches)")
+
+        seen_urls = set()
+        per_subreddit = Counter()
+
+        async with AsyncRedditClient() as client:
+            async def _search(subreddit_name: str, query: str):
+                try:
+                    return subreddit_name, await client.search(subreddit_name, query, time_filter, limit)
+                except Exception as e:
+                    logger.error(f"  ⚠️  Search error for '{query}' in r/{subreddit_name}: {e}")
+                    return subreddit_name, []
+
+            tasks = [
+                asyncio.create_task(_search(subreddit_name, query))
+                for subreddit_name in REDDIT_SUBREDDITS
+                for query in REDDIT_SEARCH_QUERIES
+            ]
+
+            try:
+                for next_done in asyncio.as_completed(tasks):
+                    subreddit_name, posts = await next_done
+
+                    for post in posts:
+                        if per_subreddit[subreddit_name] >= MAX_OPPORTUNITIES_PER_SOURCE:
+                            break
+                        if not self.is_relevant_post(post):
+                            continue
+
+                        opportunity = self.parse_reddit_post(post)
+                        if opportunity is None:
+                            continue
+
+                        url = str(opportunity.metadata.source_url)
+                        if url in seen_urls:
+                            continue
+                        seen_urls.add(url)
+                        per_subreddit[subreddit_name] += 1
+
+                        logger.info(
+                            f"  ✅ Found: {opportunity.metadata.title[:60]}... "
+                            f"(r/{subreddit_name}, score: {opportunity.metadata.score})"
+                        )
+                        yield opportunity
+            finally:
+                # Consumer stopped early (or failed): drop the remaining searches
+                for task in tasks:
+                    task.cancel()
+                await asyncio.gather(*tasks, return_exceptions=True)
+
+        logger.info(
+            f"✅ Total Reddit opportunities: {len(seen_urls)} "
+            f"({client.requests} API requests, {client.rate_limited} rate limited)"
+        )
+
     async def enrich_with_crawl4ai(
         self,
         opportunities: List[Opportunity],
@@ -297,11 +406,15 @@ class RedditScraperModern(Crawl4AIBase):
         urls_to_crawl = [url for _, url in to_crawl]
         crawl_results = await self.batch_crawl(urls_to_crawl[:max_concurrent])
 
+        # Extract tech stack from every crawled page in one batch
+        tech_per_page = self.extract_tech_stack_many(
+            [result.markdown if result.success and result.markdown else "" for result in crawl_results]
+        )
+
         # Enrich opportunities with crawled content
-        for (opp, url), result in zip(to_crawl, crawl_results):
+        for (opp, url), result, additional_tech in zip(to_crawl, crawl_results, tech_per_page):
             if result.success and result.markdown:
-                # Extract additional tech stack from crawled content
-                additional_tech = self.extract_tech_stack(result.markdown)
+                # Add additional tech stack from crawled content
                 for tech in additional_tech:
                     if tech not in opp.metadata.tech_stack:
                         opp.metadata.tech_stack.append(tech)
@@ -319,7 +432,7 @@ async def main():
     )
 
     scraper = RedditScraperModern()
-    opportunities = scraper.scrape_all_subreddits()
+    opportunities = [opp async for opp in scraper.stream_all()]
 
     # Optionally enrich with Crawl4AI
     # opportunities = await scraper.enrich_with_crawl4ai(opportunities, max_concurrent=3)
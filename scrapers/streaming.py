@@ -0,0 +1,64 @@
+#!/usr/bin/env python3
+"""
+Streaming helpers for scrapers
+- merge_streams: interleave several async streams, yielding items as they arrive
+"""
+
+import asyncio
+import logging
+from typing import AsyncIterator, Dict, TypeVar
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+_DONE = object()
+
+
+async def merge_streams(streams: Dict[str, AsyncIterator[T]]) -> AsyncIterator[T]:
+    """
+    Merge named async streams into one, yielding each item as soon as it is ready
+
+    A stream that raises is logged and dropped; the others keep going (the
+    streaming equivalent of gather(..., return_exceptions=True)).
+
+    Args:
+        streams: Source name -> async iterator
+
+    Yields:
+        Items from all streams, in arrival order
+    """
+    queue: asyncio.Queue = asyncio.Queue()
+
+    async def _pump(name: str, stream: AsyncIterator[T]):
+        count = 0
+        try:
+            async for item in stream:
+                count += 1
+                await queue.put((name, item))
+            logger.info(f"  ✅ {name}: {count} opportunities")
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            logger.error(f"❌ Scraper {name} failed after {count} opportunities: {e}")
+        finally:
+            # Close the source (e.g. release its browser) even when cancelled
+            aclose = getattr(stream, "aclose", None)
+            if aclose is not None:
+                await aclose()
+            await queue.put((name, _DONE))
+
+    tasks = [asyncio.create_task(_pump(name, stream)) for name, stream in streams.items()]
+    remaining = len(tasks)
+
+    try:
+        while remaining:
+            name, item = await queue.get()
+            if item is _DONE:
+                remaining -= 1
+                continue
+            yield item
+    finally:
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
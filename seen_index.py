@@ -0,0 +1,233 @@
+#!/usr/bin/env python3
+"""
+Persistent index of already-processed opportunity URLs, shared by every pipeline.
+
+Design decisions:
+- Storage is SQLite (WAL), one row per opportunity: url_key (uuid5 of its key,
+  the same key llm_cache uses), the content hash the stored analysis was
+  computed from, and when it was last analysed. The key is the URL, or
+  analysis_cache.analysis_key(url, source, title), which adds the title for
+  sources that yield several opportunities per URL (Ask HN threads), so
+  sibling ideas do not overwrite each other's entry. Connections come from
+  llm_cache's helpers.
+- Entries are per collection (chroma_writer.collection_identity). The modern
+  pipeline stores into the local ChromaDB and the production pipeline into the
+  Xeon server, and both scrape Reddit: a post stored in one store must not be
+  skipped as "unchanged" for the other. Pipelines pass the collection they
+  write to; the row key then covers it (url_key = uuid5 of "identity#key").
+- The whole index is loaded into a dict once per run. Membership checks are
+  then an exact in-memory hash lookup — no Bloom filter needed at this size —
+  and writes go through to SQLite.
+- An opportunity is skipped only if its URL was processed before, its content
+  hash is unchanged, and (with reprocess_older_than_days) the last analysis is
+  recent enough. Edited posts are reprocessed automatically.
+- Pipelines mark URLs only after the ChromaDB write succeeded and only for real
+  LLM (or cached) analyses, so failures and fallbacks are retried next run.
+- Index errors are logged and treated as "not seen". The index must never fail
+  a pipeline run.
+
+Usage:
+    from seen_index import SeenIndex
+    from analysis_cache import analysis_key, content_hash
+
+    seen = SeenIndex(reprocess_older_than_days=30)
+    key = analysis_key(url, source, title)
+    digest = content_hash(title, description, revenue_claim, tech_stack)
+
+    if not seen.is_fresh(key, digest, collection):
+        analyse_and_store(...)
+        seen.mark(key, digest, collection)
+
+    seen.stats()   # {"known": 812, "checked": 60, "skipped": 55}
+"""
+
+import calendar
+import logging
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, Iterable, Optional, Tuple
+
+import llm_cache
+from chroma_writer import collection_identity
+
+logger = logging.getLogger(__name__)
+
+_DEFAULT_DB_PATH = Path(__file__).parent / "data" / "seen_index.db"
+
+_TIMESTAMP_FORMAT = "%Y-%m-%dT%H:%M:%SZ"
+
+
+# ---------------------------------------------------------------------------
+# Schema
+# ---------------------------------------------------------------------------
+
+def init_seen_index(db_path: Path = _DEFAULT_DB_PATH) -> None:
+    """Create the index database and schema if they do not exist (idempotent)."""
+    db_path.parent.mkdir(parents=True, exist_ok=True)
+
+    # journal_mode must be set outside a transaction (see llm_cache.init_cache_db)
+    conn = sqlite3.connect(str(db_path), timeout=llm_cache._CONNECT_TIMEOUT_SECONDS)
+    try:
+        conn.execute(f"PRAGMA busy_timeout = {llm_cache._BUSY_TIMEOUT_MS}")
+        conn.execute("PRAGMA journal_mode = WAL")
+        conn.executescript("""
+            CREATE TABLE IF NOT EXISTS seen_urls (
+                url_key          TEXT PRIMARY KEY,  -- uuid5(NAMESPACE_URL, [collection#]key)
+                url              TEXT NOT NULL,     -- the key: URL, or URL#title
+                content_hash     TEXT NOT NULL,     -- analysis_cache.content_hash()
+                last_analyzed_at TEXT NOT NULL,     -- ISO-8601 UTC
+                collection       TEXT               -- collection_identity(), NULL if unbound
+            );
+        """)
+
+        # Indexes created before entries were per collection: their rows are
+        # unbound, so pipelines passing a collection reprocess them once
+        columns = {row[1] for row in conn.execute("PRAGMA table_info(seen_urls)")}
+        if "collection" not in columns:
+            conn.execute("ALTER TABLE seen_urls ADD COLUMN collection TEXT")
+        conn.commit()
+    finally:
+        conn.close()
+
+
+def _entry_key(key: str, identity: Optional[str]) -> str:
+    """Row key of an opportunity key within a collection (None: unbound)"""
+    return llm_cache._make_cache_key(key if identity is None else f"{identity}#{key}")
+
+
+def _identity(collection: Any) -> Optional[str]:
+    return None if collection is None else collection_identity(collection)
+
+
+def _to_epoch(timestamp: str) -> float:
+    return float(calendar.timegm(time.strptime(timestamp, _TIMESTAMP_FORMAT)))
+
+
+# ---------------------------------------------------------------------------
+# Index
+# ---------------------------------------------------------------------------
+
+class SeenIndex:
+    """Exact, persistent membership index of processed URLs."""
+
+    def __init__(
+        self,
+        db_path: Path = _DEFAULT_DB_PATH,
+        reprocess_older_than_days: Optional[float] = None,
+        enabled: bool = True,
+    ):
+        """
+        Args:
+            db_path: Path to the index SQLite database
+            reprocess_older_than_days: Re-analyse URLs last analysed longer ago
+                than this (None = never expire; 0 = reprocess everything)
+            enabled: Set False to treat every URL as new
+        """
+        self.db_path = db_path
+        self.reprocess_older_than_days = reprocess_older_than_days
+        self.enabled = enabled
+
+        self._lock = threading.Lock()  # marks arrive from writer threads
+        self._entries: Dict[str, Tuple[str, float]] = {}
+        self.checked = 0
+        self.skipped = 0
+
+        if self.enabled:
+            try:
+                init_seen_index(self.db_path)
+                self._load()
+            except Exception as e:
+                logger.warning(f"⚠️  Seen-URL index unavailable, processing everything: {e}")
+                self.enabled = False
+
+    def _load(self) -> None:
+        def _select():
+            with llm_cache._sqlite_connection(self.db_path) as conn:
+                return conn.execute(
+                    "SELECT url_key, content_hash, last_analyzed_at FROM seen_urls"
+                ).fetchall()
+
+        rows = llm_cache._with_retry(_select)
+        self._entries = {
+            row["url_key"]: (row["content_hash"], _to_epoch(row["last_analyzed_at"]))
+            for row in rows
+        }
+        logger.info(f"📇 Seen-URL index: {len(self._entries)} processed URLs")
+
+    def is_fresh(self, key: str, content_hash: str, collection: Any = None) -> bool:
+        """
+        True if the opportunity (key: its URL, or analysis_key()) was processed
+        with this content hash, into this collection, recently enough to skip.
+        """
+        entry_key = _entry_key(key, _identity(collection))
+        with self._lock:
+            self.checked += 1
+
+            if not self.enabled:
+                return False
+
+            entry = self._entries.get(entry_key)
+            if entry is None or entry[0] != content_hash:
+                return False
+
+            if self.reprocess_older_than_days is not None:
+                max_age = self.reprocess_older_than_days * 86400
+                if time.time() - entry[1] >= max_age:
+                    return False
+
+            self.skipped += 1
+            return True
+
+    def mark(self, key: str, content_hash: str, collection: Any = None) -> None:
+        """Record that the opportunity was analysed and stored into collection with this content hash."""
+        self.mark_many([(key, content_hash)], collection)
+
+    def mark_many(self, entries: Iterable[Tuple[str, str]], collection: Any = None) -> None:
+        """Record several (key, content_hash) pairs stored into collection in one transaction."""
+        if not self.enabled:
+            return
+
+        now = time.time()
+        timestamp = time.strftime(_TIMESTAMP_FORMAT, time.gmtime(now))
+        identity = _identity(collection)
+        rows = [
+            (_entry_key(key, identity), key, digest, timestamp, identity)
+            for key, digest in entries
+        ]
+        if not rows:
+            return
+
+        def _upsert():
+            with llm_cache._sqlite_connection(self.db_path) as conn:
+                conn.executemany(
+                    "INSERT OR REPLACE INTO seen_urls "
+                    "(url_key, url, content_hash, last_analyzed_at, collection) VALUES (?, ?, ?, ?, ?)",
+                    rows,
+                )
+
+        try:
+            llm_cache._with_retry(_upsert)
+        except Exception as e:
+            logger.warning(f"⚠️  Seen-URL index write failed for {len(rows)} URLs: {e}")
+            return
+
+        with self._lock:
+            for url_key, _, digest, _, _ in rows:
+                self._entries[url_key] = (digest, now)
+
+    def reset_stats(self) -> None:
+        """Zero the per-run counters."""
+        with self._lock:
+            self.checked = 0
+            self.skipped = 0
+
+    def stats(self) -> Dict[str, int]:
+        """Index size and per-run check/skip counters."""
+        with self._lock:
+            return {
+                "known": len(self._entries),
+                "checked": self.checked,
+                "skipped": self.skipped,
+            }
@@ -265,6 +265,109 @@ def test_crawl4ai():
         return False
 
 
+def test_revenue_extraction():
+    """Test that the precompiled scraper patterns match the original per-call regexes"""
+    logger.info("\nTesting revenue extraction...")
+
+    import re
+
+    try:
+        from scrapers.config import MIN_REVENUE_MENTION
+        from scrapers.google_dorking import GoogleDorkingScraper
+        from scrapers.hackernews_scraper import HackerNewsScraper
+        from scrapers.indiehackers_scraper import IndieHackersScraper
+        from scrapers.producthunt_scraper import ProductHuntScraper
+        from scrapers.reddit_scraper import RedditScraper
+    except ImportError as e:
+        logger.error(f"  ❌ Scraper import failed: {e}")
+        return False
+
+    # The pattern lists each scraper compiled on every call before extraction.py
+    monthly = r'(?:mo|month|mrr)'
+    legacy = {
+        RedditScraper: ([
+            r'\$\s*(\d+[,\d]*)\s*/?' + monthly,
+            r'(\d+[,\d]*)\s*\$\s*/?' + monthly,
+            r'revenue.*?\$\s*(\d+[,\d]*)',
+            r'making.*?\$\s*(\d+[,\d]*)',
+            r'earning.*?\$\s*(\d+[,\d]*)',
+        ], True),
+        ProductHuntScraper: ([
+            r'\$\s*(\d+[,\d]*)\s*/?(?:mo|month|mrr|revenue)',
+            r'(\d+[,\d]*)\s*\$\s*/?' + monthly,
+            r'making.*?\$\s*(\d+[,\d]*)',
+            r'earning.*?\$\s*(\d+[,\d]*)',
+        ], True),
+        HackerNewsScraper: ([
+            r'\$\s*(\d+[,\d]*)\s*/?(?:mo|month|mrr|arr|revenue)',
+            r'(\d+[,\d]*)\s*\$\s*/?' + monthly,
+            r'making.*?\$\s*(\d+[,\d]*)',
+            r'earning.*?\$\s*(\d+[,\d]*)',
+            r'revenue.*?\$\s*(\d+[,\d]*)',
+        ], True),
+        IndieHackersScraper: ([
+            r'\$\s*([\d,]+)\s*/?' + monthly,
+            r'([\d,]+)\s*\$\s*/?' + monthly,
+        ], False),
+        GoogleDorkingScraper: ([
+            r'\$\s*([\d,]+)\s*/?(?:mo|month|mrr|per month)',
+            r'([\d,]+)\s*\$\s*/?' + monthly,
+            r'revenue.*?\$\s*([\d,]+)',
+        ], False),
+    }
+
+    def legacy_extract(patterns, checked, text):
+        for pattern in patterns:
+            match = re.search(pattern, text, re.IGNORECASE)
+            if not match:
+                continue
+            if not checked:
+                return f"${match.group(1)}/month"
+            amount = match.group(1).replace(',', '')
+            try:
+                if int(amount) >= MIN_REVENUE_MENTION:
+                    return f"${amount}/month"
+            except ValueError:
+                continue
+        return "Not specified"
+
+    corpus = [
+        "Now at $5,000/mo after two years",
+        "We hit $12,000 MRR last month",
+        "$2500 revenue in the first week",
+        "Crossed $120,000 ARR in March",
+        "It does 3000$/month on autopilot",
+        "Revenue is around $4,200 and growing",
+        "I'm making about $800 a month from ads",
+        "Earning $1,500 per month from templates",
+        "$50/mo is all it makes, making $60 total",
+        "Made $900 per month with a newsletter",
+        "Costs $20 to run, revenue $75",
+        "Show HN: a $99 one-off purchase, now $3k MRR",
+        "No numbers here, just an idea",
+        "Pricing is $9/month, revenue $10,000 monthly",
+        "",
+    ]
+
+    mismatches = []
+    for scraper_class, (patterns, checked) in legacy.items():
+        scraper = scraper_class.__new__(scraper_class)  # extract_revenue uses no state
+        for text in corpus:
+            expected = legacy_extract(patterns, checked, text)
+            actual = scraper.extract_revenue(text)
+            if actual != expected:
+                mismatches.append((scraper_class.__name__, text, expected, actual))
+
+    for name, text, expected, actual in mismatches:
+        logger.error(f"  ❌ {name}: {text!r} -> {actual!r}, expected {expected!r}")
+
+    if mismatches:
+        return False
+
+    logger.info(f"  ✅ {len(legacy)} scrapers agree on {len(corpus)} sample texts")
+    return True
+
+
 def run_all_tests():
     """Run all tests"""
     logger.info("=" * 70)
@@ -276,7 +379,8 @@ def run_all_tests():
         "Pydantic Models": test_pydantic_models(),
         "ChromaDB": test_chromadb(),
         "Configuration": test_config(),
-        "Crawl4AI": test_crawl4ai()
+        "Crawl4AI": test_crawl4ai(),
+        "Revenue Extraction": test_revenue_extraction()
     }
 
     logger.info("\n" + "=" * 70)
@@ -0,0 +1,435 @@
+#!/usr/bin/env python3
+"""
+Materialized trend aggregates for the opportunity RAG store.
+
+Design decisions:
+- Storage is SQLite (WAL) next to the LLM cache, with connections from
+  llm_cache's helpers. Two tables:
+    trend_counters     (dimension, key) -> count, sum of automation and
+                       legitimacy scores. Dimensions: total, source, day,
+                       automation_bucket / legitimacy_bucket (score
+                       histograms, 10-point buckets), initial_investment,
+                       time_to_market, revenue_claim, investment_bucket /
+                       time_bucket (from the numeric metadata fields, see
+                       parse_investment.numeric_metadata), category, flag
+                       (high_automation, high_legitimacy, high_both, complete).
+    opportunity_facts  doc_id -> the (dimension, key) pairs and scores that
+                       document contributed.
+    trend_meta         when the store was last rebuilt from ChromaDB, with
+                       which FACTS_VERSION, and from which collection
+                       (chroma_writer.collection_identity).
+- Counters are updated incrementally as documents are written, using the
+  BufferedChromaWriter on_flush hook. Because IDs are stable and writes are
+  upserts, re-recording a document first subtracts its previous contribution
+  (from opportunity_facts), so reruns never double count.
+- The store mirrors one collection. The pipelines write to different stores
+  (production: the Xeon server via get_chroma_client(); modern: the local
+  data/chroma_db), so record()/remove() take the collection that was written
+  to and skip it when the store was rebuilt from another one. rebuilt_at(),
+  given a collection, reports None for a store built from another, and
+  sync() also rebuilds when the document count no longer matches.
+- Reports read the counters in one small query instead of pulling every
+  document out of ChromaDB. Means come from the score sums. Exact medians and
+  stddevs are not materialised; the histograms approximate the distribution.
+- rebuild() recomputes everything from a collection's metadata in pages. Until
+  the store has been rebuilt once it only covers documents written since it
+  was created, so readers check rebuilt_at() and seed it first. Rebuild again
+  after writing to ChromaDB outside the pipelines. rebuilt_at() also reports
+  None when the store was built by an older FACTS_VERSION, so a change to
+  opportunity_facts() reseeds the store on the next report.
+- Aggregate errors are logged, never raised into a pipeline run. A stale
+  report can be fixed with a rebuild; a lost pipeline run cannot.
+
+Usage:
+    from trend_aggregates import TrendAggregates
+
+    aggregates = TrendAggregates()
+    aggregates.record(ids, metadatas, collection)   # e.g. from a writer's on_flush
+
+    aggregates.sync(collection)             # full recompute from ChromaDB if stale
+
+    counters = aggregates.counters()
+    counters["source"]["Reddit"]            # {"count": 41, "sum_automation": ..., ...}
+    aggregates.total()                      # 812
+"""
+
+import json
+import logging
+import sqlite3
+import time
+from collections import defaultdict
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+import llm_cache
+from chroma_writer import collection_identity
+from parse_investment import (
+    INVESTMENT_MAX_FIELD, INVESTMENT_MIN_FIELD, NUMERIC_FIELDS, TIME_TO_REVENUE_FIELD, numeric_metadata,
+)
+
+logger = logging.getLogger(__name__)
+
+_DEFAULT_DB_PATH = Path(__file__).parent / "data" / "trend_aggregates.db"
+
+# Thresholds shared with the reports
+HIGH_AUTOMATION = 80
+HIGH_LEGITIMACY = 85
+SCORE_BUCKET_WIDTH = 10
+LOW_INVESTMENT_USD = 1000
+HIGH_INVESTMENT_USD = 10000
+QUICK_WIN_MONTHS = 1
+LONG_TERM_MONTHS = 3
+
+# Bump when opportunity_facts() changes so stores built earlier are rebuilt
+FACTS_VERSION = 2
+
+_COMPLETE_FIELDS = ("title", "source", "automation_score", "legitimacy_score")
+_MISSING_VALUES = ("Unknown", "Not specified", "")
+
+_PAGE_SIZE = 1000
+
+
+# ---------------------------------------------------------------------------
+# Schema
+# ---------------------------------------------------------------------------
+
+def init_trend_aggregates(db_path: Path = _DEFAULT_DB_PATH) -> None:
+    """Create the aggregates database and schema if they do not exist (idempotent)."""
+    db_path.parent.mkdir(parents=True, exist_ok=True)
+
+    # journal_mode must be set outside a transaction (see llm_cache.init_cache_db)
+    conn = sqlite3.connect(str(db_path), timeout=llm_cache._CONNECT_TIMEOUT_SECONDS)
+    try:
+        conn.execute(f"PRAGMA busy_timeout = {llm_cache._BUSY_TIMEOUT_MS}")
+        conn.execute("PRAGMA journal_mode = WAL")
+        conn.executescript("""
+            CREATE TABLE IF NOT EXISTS trend_counters (
+                dimension      TEXT NOT NULL,
+                key            TEXT NOT NULL,
+                count          INTEGER NOT NULL DEFAULT 0,
+                sum_automation REAL NOT NULL DEFAULT 0,
+                sum_legitimacy REAL NOT NULL DEFAULT 0,
+                PRIMARY KEY (dimension, key)
+            );
+
+            CREATE TABLE IF NOT EXISTS opportunity_facts (
+                doc_id TEXT PRIMARY KEY,
+                facts  TEXT NOT NULL  -- JSON: {"keys": [[dimension, key], ...], "automation", "legitimacy"}
+            );
+
+            CREATE TABLE IF NOT EXISTS trend_meta (
+                key   TEXT PRIMARY KEY,
+                value TEXT NOT NULL
+            );
+        """)
+        conn.commit()
+    finally:
+        conn.close()
+
+
+# ---------------------------------------------------------------------------
+# Per-document facts
+# ---------------------------------------------------------------------------
+
+def _score(metadata: Dict[str, Any], field: str) -> float:
+    try:
+        return float(metadata.get(field, 0) or 0)
+    except (TypeError, ValueError):
+        return 0.0
+
+
+def _bucket(score: float) -> str:
+    """Histogram bucket label: 0, 10, ..., 90 (100 falls into 90)."""
+    return str(min(int(score) // SCORE_BUCKET_WIDTH * SCORE_BUCKET_WIDTH, 100 - SCORE_BUCKET_WIDTH))
+
+
+def _investment_bucket(numbers: Dict[str, float]) -> str:
+    """zero / low (<$1K) / mid ($1K-$10K) / high (>=$10K) by the range's lower bound."""
+    investment = numbers.get(INVESTMENT_MIN_FIELD, numbers.get(INVESTMENT_MAX_FIELD))
+    if investment is None:
+        return "unknown"
+    if investment == 0:
+        return "zero"
+    if investment < LOW_INVESTMENT_USD:
+        return "low"
+    if investment < HIGH_INVESTMENT_USD:
+        return "mid"
+    return "high"
+
+
+def _time_bucket(numbers: Dict[str, float]) -> str:
+    """quick (<1 month) / moderate (1-3 months) / long (>3 months)."""
+    months = numbers.get(TIME_TO_REVENUE_FIELD)
+    if months is None:
+        return "unknown"
+    if months < QUICK_WIN_MONTHS:
+        return "quick"
+    if months <= LONG_TERM_MONTHS:
+        return "moderate"
+    return "long"
+
+
+def opportunity_facts(metadata: Dict[str, Any]) -> Dict[str, Any]:
+    """The counters one stored opportunity contributes to."""
+    automation = _score(metadata, "automation_score")
+    legitimacy = _score(metadata, "legitimacy_score")
+
+    # Documents written before the numeric fields existed: parse the strings
+    numbers = metadata
+    if not any(field in metadata for field in NUMERIC_FIELDS):
+        numbers = numeric_metadata(metadata.get("initial_investment"), metadata.get("time_to_market"))
+
+    keys: List[Tuple[str, str]] = [
+        ("total", ""),
+        ("source", str(metadata.get("source", "unknown"))),
+        ("day", str(metadata.get("created_at", ""))[:10] or "unknown"),
+        ("automation_bucket", _bucket(automation)),
+        ("legitimacy_bucket", _bucket(legitimacy)),
+        ("initial_investment", str(metadata.get("initial_investment", "Unknown"))),
+        ("time_to_market", str(metadata.get("time_to_market", "Unknown"))),
+        ("revenue_claim", str(metadata.get("revenue_claim", "Unknown"))),
+        ("investment_bucket", _investment_bucket(numbers)),
+        ("time_bucket", _time_bucket(numbers)),
+    ]
+    if "category" in metadata:
+        keys.append(("category", str(metadata["category"])))
+
+    if automation > HIGH_AUTOMATION:
+        keys.append(("flag", "high_automation"))
+    if legitimacy > HIGH_LEGITIMACY:
+        keys.append(("flag", "high_legitimacy"))
+    if automation > HIGH_AUTOMATION and legitimacy > HIGH_LEGITIMACY:
+        keys.append(("flag", "high_both"))
+    if all(field in metadata and metadata[field] not in _MISSING_VALUES for field in _COMPLETE_FIELDS):
+        keys.append(("flag", "complete"))
+
+    return {"keys": keys, "automation": automation, "legitimacy": legitimacy}
+
+
+# ---------------------------------------------------------------------------
+# Store
+# ---------------------------------------------------------------------------
+
+class TrendAggregates:
+    """Incrementally maintained counters behind the trends report."""
+
+    def __init__(self, db_path: Path = _DEFAULT_DB_PATH, enabled: bool = True):
+        """
+        Args:
+            db_path: Path to the aggregates SQLite database
+            enabled: Set False to make record() a no-op
+        """
+        self.db_path = db_path
+        self.enabled = enabled
+
+        if self.enabled:
+            try:
+                init_trend_aggregates(self.db_path)
+            except Exception as e:
+                logger.warning(f"⚠️  Trend aggregates unavailable: {e}")
+                self.enabled = False
+
+    def record(
+        self,
+        ids: Iterable[str],
+        metadatas: Iterable[Dict[str, Any]],
+        collection: Any = None,
+    ) -> None:
+        """
+        Add (or replace) the contribution of stored documents in one transaction.
+
+        Args:
+            collection: The collection they were written to; skipped if the
+                store mirrors another one (None applies unconditionally)
+        """
+        if not self.enabled:
+            return
+
+        new_facts = {doc_id: opportunity_facts(metadata or {}) for doc_id, metadata in zip(ids, metadatas)}
+        if not new_facts:
+            return
+
+        source = None if collection is None else collection_identity(collection)
+        try:
+            llm_cache._with_retry(lambda: self._apply(new_facts, [], source))
+        except Exception as e:
+            logger.warning(f"⚠️  Trend aggregates update failed for {len(new_facts)} documents: {e}")
+
+    def remove(self, ids: Iterable[str], collection: Any = None) -> None:
+        """Subtract the contribution of deleted documents (collection as in record())."""
+        if not self.enabled:
+            return
+
+        ids = list(ids)
+        if not ids:
+            return
+
+        source = None if collection is None else collection_identity(collection)
+        try:
+            llm_cache._with_retry(lambda: self._apply({}, ids, source))
+        except Exception as e:
+            logger.warning(f"⚠️  Trend aggregates update failed for {len(ids)} deleted documents: {e}")
+
+    def _apply(
+        self,
+        new_facts: Dict[str, Dict[str, Any]],
+        removed_ids: List[str],
+        source: Optional[str] = None,
+    ) -> None:
+        deltas: Dict[Tuple[str, str], List[float]] = defaultdict(lambda: [0, 0.0, 0.0])
+
+        def _add(facts: Dict[str, Any], sign: int):
+            for dimension, key in facts["keys"]:
+                delta = deltas[(dimension, key)]
+                delta[0] += sign
+                delta[1] += sign * facts["automation"]
+                delta[2] += sign * facts["legitimacy"]
+
+        touched = list(new_facts) + removed_ids
+
+        with llm_cache._sqlite_connection(self.db_path) as conn:
+            if source is not None:
+                mirrored = conn.execute(
+                    "SELECT value FROM trend_meta WHERE key = 'collection'"
+                ).fetchone()
+                if mirrored is not None and mirrored["value"] != source:
+                    logger.debug(f"Trend aggregates mirror {mirrored['value']}, skipping writes to {source}")
+                    return
+
+            # Previous contributions of these documents, in chunks (SQLite variable limit)
+            for i in range(0, len(touched), 500):
+                chunk = touched[i:i + 500]
+                placeholders = ",".join("?" * len(chunk))
+                for row in conn.execute(
+                    f"SELECT facts FROM opportunity_facts WHERE doc_id IN ({placeholders})", chunk
+                ):
+                    _add(json.loads(row["facts"]), -1)
+
+            for facts in new_facts.values():
+                _add(facts, +1)
+
+            conn.executemany(
+                "INSERT INTO trend_counters (dimension, key, count, sum_automation, sum_legitimacy) "
+                "VALUES (?, ?, ?, ?, ?) "
+                "ON CONFLICT(dimension, key) DO UPDATE SET "
+                "count = count + excluded.count, "
+                "sum_automation = sum_automation + excluded.sum_automation, "
+                "sum_legitimacy = sum_legitimacy + excluded.sum_legitimacy",
+                [(dimension, key, *delta) for (dimension, key), delta in deltas.items() if any(delta)],
+            )
+            conn.execute("DELETE FROM trend_counters WHERE count <= 0")
+
+            conn.executemany(
+                "INSERT OR REPLACE INTO opportunity_facts (doc_id, facts) VALUES (?, ?)",
+                [(doc_id, json.dumps(facts)) for doc_id, facts in new_facts.items()],
+            )
+            conn.executemany(
+                "DELETE FROM opportunity_facts WHERE doc_id = ?",
+                [(doc_id,) for doc_id in removed_ids],
+            )
+
+    def rebuild(self, collection: Any) -> int:
+        """
+        Recompute all aggregates from a ChromaDB collection's metadata.
+
+        Returns:
+            Number of documents aggregated
+        """
+        def _clear():
+            with llm_cache._sqlite_connection(self.db_path) as conn:
+                conn.execute("DELETE FROM trend_counters")
+                conn.execute("DELETE FROM opportunity_facts")
+                conn.execute("DELETE FROM trend_meta WHERE key IN ('rebuilt_at', 'collection')")
+
+        init_trend_aggregates(self.db_path)
+        llm_cache._with_retry(_clear)
+
+        total = 0
+        offset = 0
+        while True:
+            page = collection.get(include=["metadatas"], limit=_PAGE_SIZE, offset=offset)
+            if not page["ids"]:
+                break
+            new_facts = {
+                doc_id: opportunity_facts(metadata or {})
+                for doc_id, metadata in zip(page["ids"], page["metadatas"])
+            }
+            llm_cache._with_retry(lambda: self._apply(new_facts, []))
+            total += len(page["ids"])
+            offset += len(page["ids"])
+
+        def _mark_rebuilt():
+            with llm_cache._sqlite_connection(self.db_path) as conn:
+                conn.executemany(
+                    "INSERT OR REPLACE INTO trend_meta (key, value) VALUES (?, ?)",
+                    [("rebuilt_at", time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime())),
+                     ("facts_version", str(FACTS_VERSION)),
+                     ("collection", collection_identity(collection))],
+                )
+
+        llm_cache._with_retry(_mark_rebuilt)
+        logger.info(f"📊 Rebuilt trend aggregates from {total} documents")
+        return total
+
+    def rebuilt_at(self, collection: Any = None) -> Optional[str]:
+        """
+        UTC time of the last full rebuild, or None if the store was never
+        seeded, was built by an older FACTS_VERSION or (when collection is
+        given) was built from a different collection.
+        """
+        def _select():
+            with llm_cache._sqlite_connection(self.db_path) as conn:
+                meta = dict(conn.execute(
+                    "SELECT key, value FROM trend_meta "
+                    "WHERE key IN ('rebuilt_at', 'facts_version', 'collection')"
+                ).fetchall())
+                if meta.get("facts_version") != str(FACTS_VERSION):
+                    return None
+                if collection is not None and meta.get("collection") != collection_identity(collection):
+                    return None
+                return meta.get("rebuilt_at")
+
+        return llm_cache._with_retry(_select)
+
+    def sync(self, collection: Any) -> bool:
+        """
+        Make sure the counters mirror collection: rebuild if the store was
+        never seeded from it (see rebuilt_at) or its total no longer matches
+        the collection's document count.
+
+        Returns:
+            True if the store was rebuilt, False if it was current
+        """
+        if self.rebuilt_at(collection) is not None and self.total() == collection.count():
+            return False
+
+        self.rebuild(collection)
+        return True
+
+    def counters(self) -> Dict[str, Dict[str, Dict[str, float]]]:
+        """All counters as {dimension: {key: {"count", "sum_automation", "sum_legitimacy"}}}."""
+        def _select():
+            with llm_cache._sqlite_connection(self.db_path) as conn:
+                return conn.execute(
+                    "SELECT dimension, key, count, sum_automation, sum_legitimacy FROM trend_counters"
+                ).fetchall()
+
+        result: Dict[str, Dict[str, Dict[str, float]]] = defaultdict(dict)
+        for row in llm_cache._with_retry(_select):
+            result[row["dimension"]][row["key"]] = {
+                "count": row["count"],
+                "sum_automation": row["sum_automation"],
+                "sum_legitimacy": row["sum_legitimacy"],
+            }
+        return result
+
+    def total(self) -> int:
+        """Number of opportunities aggregated."""
+        def _select():
+            with llm_cache._sqlite_connection(self.db_path) as conn:
+                row = conn.execute(
+                    "SELECT count FROM trend_counters WHERE dimension = 'total'"
+                ).fetchone()
+                return row["count"] if row else 0
+
+        return llm_cache._with_retry(_select)